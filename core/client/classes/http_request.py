@@ -26,6 +26,25 @@ if TYPE_CHECKING:
 class HTTPRequest:
     """An HTTP request utility class"""
 
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ SLOTS
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Declare slots, so that instances do not carry a __dict__
+    __slots__ = (
+        "url",
+        "method",
+        "params",
+        "headers",
+        "cookies",
+        "timeout",
+        "data",
+        "json",
+        "weight",
+        "response",
+        "is_retry",
+    )
+
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ INSTANCE ATTRIBUTES
     # └─────────────────────────────────────────────────────────────────────────────────
@@ -41,6 +41,13 @@ T = TypeVar("T")
 class HTTPResponse:
     """An HTTP response utility class"""
 
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ SLOTS
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Declare slots, so that instances do not carry a __dict__
+    __slots__ = ("request", "text", "json", "weight", "time", "_obj")
+
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ INSTANCE ATTRIBUTES
     # └─────────────────────────────────────────────────────────────────────────────────
@@ -1,15 +1,104 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+import importlib
+
+from typing import TYPE_CHECKING, Any
+
 # ┌─────────────────────────────────────────────────────────────────────────────────────
 # │ PROJECT IMPORTS
 # └─────────────────────────────────────────────────────────────────────────────────────
 
+from core.collection.classes.column_collection import (  # noqa: F401
+    ColumnCollection as ColumnCollection,
+)
+
+from core.collection.classes.concurrent_dict_collection import (  # noqa: F401
+    ConcurrentDictCollection as ConcurrentDictCollection,
+)
+
+from core.collection.classes.concurrent_ring_collection import (  # noqa: F401
+    ConcurrentRingCollection as ConcurrentRingCollection,
+)
+
 from core.collection.classes.dict_collection import (  # noqa: F401
     DictCollection as DictCollection,
 )
 
+from core.collection.classes.hyper_log_log import (  # noqa: F401
+    HyperLogLog as HyperLogLog,
+)
+
+from core.collection.classes.kll_sketch import (  # noqa: F401
+    KLLSketch as KLLSketch,
+)
+
 from core.collection.classes.list_collection import (  # noqa: F401
     ListCollection as ListCollection,
 )
 
+from core.collection.classes.numeric_ring_collection import (  # noqa: F401
+    NumericRingCollection as NumericRingCollection,
+)
+
+from core.collection.classes.reservoir import (  # noqa: F401
+    Reservoir as Reservoir,
+)
+
 from core.collection.classes.ring_collection import (  # noqa: F401
     RingCollection as RingCollection,
 )
+
+from core.collection.classes.sketch import (  # noqa: F401
+    Sketch as Sketch,
+)
+
+from core.collection.classes.space_saving import (  # noqa: F401
+    SpaceSaving as SpaceSaving,
+)
+
+from core.collection.classes.stream import (  # noqa: F401
+    Stream as Stream,
+)
+
+if TYPE_CHECKING:
+    from core.collection.classes.shared_ring_collection import (  # noqa: F401
+        SharedRingCollection as SharedRingCollection,
+    )
+
+    from core.collection.classes.spillable_dict_collection import (  # noqa: F401
+        SpillableDictCollection as SpillableDictCollection,
+    )
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ LAZY IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Define the modules of classes that are imported on first access, as they pull in
+# shared memory or SQLite
+LAZY_IMPORTS = {
+    "SharedRingCollection": "core.collection.classes.shared_ring_collection",
+    "SpillableDictCollection": "core.collection.classes.spillable_dict_collection",
+}
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ __GETATTR__
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def __getattr__(name: str) -> Any:
+    """Returns a lazily imported class of the package, importing it on first access"""
+
+    # Raise AttributeError if name is not lazily imported
+    if name not in LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # Import class and cache it, so that later accesses skip this function
+    value = globals()[name] = getattr(importlib.import_module(LAZY_IMPORTS[name]), name)
+
+    # Return class
+    return value
@@ -4,27 +4,57 @@
 
 from __future__ import annotations
 
+import heapq
+import itertools
+import os
 import random
 
 from abc import ABC, abstractmethod
 from copy import deepcopy
-from typing import Any, Callable, Generator, Generic, Hashable, Iterator, TypeVar
+from operator import is_not, itemgetter, not_
+from time import perf_counter_ns
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Generator,
+    Generic,
+    Hashable,
+    Iterable,
+    Iterator,
+    Literal,
+    TypeVar,
+)
 
 # ┌─────────────────────────────────────────────────────────────────────────────────────
 # │ PROJECT IMPORTS
 # └─────────────────────────────────────────────────────────────────────────────────────
 
+from core.collection.classes.filter_plan import FilterPlan
+from core.collection.classes.filter_statistics import FilterStatistics
+from core.collection.classes.group_by import GroupBy
+from core.collection.classes.query_set import QuerySet
+from core.collection.classes.reservoir import Reservoir
+from core.collection.classes.sketch import Sketch
+from core.collection.classes.sorted_index import SortedIndex
+from core.collection.classes.stream import Stream
 from core.collection.exceptions import MultipleItemsError, NoItemsError
-from core.collection.functions.filter_conditions import get_filter_conditions
+from core.collection.functions.parallel import filter_partition, map_partition
+from core.collection.functions.snapshot import dump_snapshot, load_snapshot
 from core.dict.types import DictSchema
-from core.object.functions.oget import oget
+from core.object.functions.ogetter import ogetter
 from core.object.functions.oupdate import oupdate
 
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
 # ┌─────────────────────────────────────────────────────────────────────────────────────
 # │ TYPE VARIABLES
 # └─────────────────────────────────────────────────────────────────────────────────────
 
 ItemBound = TypeVar("ItemBound", bound=Any)
+ReturnBound = TypeVar("ReturnBound")
+SketchBound = TypeVar("SketchBound", bound=Sketch)
 
 # ┌─────────────────────────────────────────────────────────────────────────────────────
 # │ COLLECTION
@@ -40,6 +70,21 @@ class Collection(Generic[ItemBound], ABC):
 
     CollectionBound = TypeVar("CollectionBound", bound="Collection[ItemBound]")
 
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ CLASS ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Define the partitions per worker of parallel methods, so that load is balanced
+    PARALLEL_PARTITIONS = 4
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ SLOTS
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Declare filter statistics as the only slot, so that subclasses that declare their
+    # slots do not carry a __dict__ and pickled states of __dict__ leave them out
+    __slots__ = ("_statistics",)
+
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ __GETITEM__
     # └─────────────────────────────────────────────────────────────────────────────────
@@ -318,6 +363,497 @@ class Collection(Generic[ItemBound], ABC):
         if collection is not None and len(collection) > 0:
             yield collection
 
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _CANDIDATES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _candidates(self, plan: FilterPlan) -> tuple[list[Any] | None, FilterPlan]:
+        """Returns candidate items in collection order and the residual plan"""
+
+        # Return None given that no condition can be served by an index
+        return None, plan
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _COLUMN
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _column(self, path: str, items: list[ItemBound]) -> tuple[list[Any], list[int]]:
+        """Returns the values of a path of items and the positions of those with one"""
+
+        # Get getter
+        getter = ogetter(path.replace(".", "__"), default=None, delimiter="__")
+
+        # Get values
+        values = list(map(getter, items))
+
+        # Return values and the positions of values that are not None
+        return values, list(
+            itertools.compress(
+                range(len(values)), map(is_not, values, itertools.repeat(None))
+            )
+        )
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _EXPLAIN
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _explain(self, plan: FilterPlan) -> str:
+        """Returns a report of how a filter plan is run, running it to time it"""
+
+        # Get candidate items and residual plan
+        items, plan_residual = self._candidates(plan)
+
+        # Filter items, measuring the time taken
+        start = perf_counter_ns()
+        count = sum(1 for _ in self._filter(plan))
+        nanoseconds = perf_counter_ns() - start
+
+        # Initialize lines
+        lines = [f"{self.__class__.__name__} of {len(self)} items"]
+
+        # Check if no condition was served by an index
+        if items is None:
+            # Append scan line
+            lines.append(f"Scan: {len(self)} items")
+
+        # Otherwise append the conditions served by an index and the candidate count
+        else:
+            lines.append(
+                "Index: "
+                + ", ".join(
+                    f"{condition.path}{condition.operator}={condition.value!r}"
+                    for condition in plan.conditions
+                    if condition not in plan_residual.conditions
+                )
+                + f" -> {len(items)} candidates"
+            )
+
+        # Get filter statistics
+        statistics = self._filter_statistics()
+
+        # Iterate over residual conditions in the order they are checked
+        for i, condition in enumerate(statistics.order(plan_residual.conditions), 1):
+            # Get mean cost
+            cost = statistics.cost(condition)
+
+            # Append condition line
+            lines.append(
+                f"{i}. {condition.path}{condition.operator}={condition.value!r}"
+                f" (selectivity {statistics.selectivity(condition):.1%}, cost "
+                + ("unknown" if cost is None else f"{cost:,.0f} ns")
+                + ")"
+            )
+
+        # Append result line
+        lines.append(f"Result: {count} items in {nanoseconds / 1e6:,.3f} ms")
+
+        # Return report
+        return "\n".join(lines)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _FILTER
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _filter(self, plan: FilterPlan) -> Iterator[ItemBound]:
+        """Yields the items of the collection that meet a filter plan"""
+
+        # Return filtered items
+        return plan.filter(self, self._filter_statistics())
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _FILTER STATISTICS
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _filter_statistics(self) -> FilterStatistics:
+        """Returns the filter statistics of the collection, initializing them once"""
+
+        # Get filter statistics
+        statistics: FilterStatistics | None = getattr(self, "_statistics", None)
+
+        # Check if filter statistics are not initialized
+        if statistics is None:
+            # Initialize filter statistics
+            statistics = self._statistics = FilterStatistics()
+
+        # Return filter statistics
+        return statistics
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _GET KEY LOOKUP
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _get_key_lookup(self, path: str) -> Callable[[Any], ItemBound | None] | None:
+        """Returns a getter of the only item by a value of a path, if a key serves it"""
+
+        # Return None
+        return None
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _GET SORTED INDEX
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _get_sorted_index(self, path: str) -> SortedIndex | None:
+        """Returns the sorted index of a path if any"""
+
+        # Return None
+        return None
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _JOIN
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _join(
+        self, other: Collection[Any], path: str, path_other: str, left: bool
+    ) -> Iterator[tuple[ItemBound, Any]]:
+        """Yields pairs of items of the collection and other whose values are equal
+
+        Items whose value is missing, None or unhashable do not match. With left, items
+        of the collection without a match are paired with None.
+        """
+
+        # Get getters of paths
+        getter = ogetter(path.replace(".", "__"), default=None, delimiter="__")
+        getter_other = ogetter(
+            path_other.replace(".", "__"), default=None, delimiter="__"
+        )
+
+        # Get the lookup of the only other item by value if a unique key serves it
+        lookup = other._get_key_lookup(path_other)
+
+        # Check if other has no unique key of path and the collection is smaller
+        if lookup is None and len(self) < len(other):
+            # Get table of items by value
+            table = self._join_table(self, getter)
+
+            # Initialize the IDs of matched items
+            matched: set[int] = set()
+
+            # Iterate over other items
+            for item_other in other:
+                # Get value
+                value = getter_other(item_other)
+
+                # Initialize try-except block
+                try:
+                    # Get the items with value
+                    items = None if value is None else table.get(value)
+
+                # Handle unhashable values, which do not match
+                except TypeError:
+                    continue
+
+                # Continue if no item has value
+                if items is None:
+                    continue
+
+                # Iterate over items with value
+                for item in items:
+                    # Add item ID to matched item IDs if left
+                    if left:
+                        matched.add(id(item))
+
+                    # Yield pair
+                    yield item, item_other
+
+            # Yield items without a match if left, which come last in this case
+            if left:
+                for item in self:
+                    if id(item) not in matched:
+                        yield item, None
+
+            # Return
+            return
+
+        # Get whether the lookup of a unique key finds other items rather than lists
+        unique = lookup is not None
+
+        # Get lookup of the other items by value, hashing other without a unique key
+        find = (
+            lookup if lookup is not None else self._join_table(other, getter_other).get
+        )
+
+        # Iterate over items
+        for item in self:
+            # Get value
+            value = getter(item)
+
+            # Initialize try-except block
+            try:
+                # Get the match or matches of value
+                match = None if value is None else find(value)
+
+            # Handle unhashable values, which do not match
+            except TypeError:
+                match = None
+
+            # Yield item without a match if left
+            if match is None:
+                if left:
+                    yield item, None
+
+            # Otherwise yield the pair of a unique key match
+            elif unique:
+                yield item, match
+
+            # Otherwise yield the pair of each match
+            else:
+                for item_other in match:
+                    yield item, item_other
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _JOIN TABLE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _join_table(
+        items: Iterable[Any], getter: Callable[[Any], Any]
+    ) -> dict[Hashable, list[Any]]:
+        """Returns the lists of items by value, skipping missing, None and unhashable"""
+
+        # Initialize table
+        table: dict[Hashable, list[Any]] = {}
+
+        # Iterate over items
+        for item in items:
+            # Get value
+            value = getter(item)
+
+            # Continue if value is missing or None
+            if value is None:
+                continue
+
+            # Initialize try-except block
+            try:
+                # Get the items with value
+                items_value = table.get(value)
+
+            # Skip unhashable values
+            except TypeError:
+                continue
+
+            # Add item, creating the list of value only if it does not exist
+            if items_value is None:
+                table[value] = [item]
+            else:
+                items_value.append(item)
+
+        # Return table
+        return table
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _ORDER
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _order(
+        self,
+        items: Iterable[ItemBound],
+        paths: str | tuple[str, ...],
+        reverse: bool = False,
+        n: int | None = None,
+    ) -> list[ItemBound]:
+        """Returns items ordered by the values of paths, or only the first n if given
+
+        A path prefixed with "-" is ordered in the opposite direction, and items without
+        a value of a path come after those with one. Values are read once per item and
+        positions are sorted by each path in turn, so that no key is computed in Python.
+        """
+
+        # Get paths as a tuple and items as a list
+        paths = (paths,) if isinstance(paths, str) else paths
+        items = items if isinstance(items, list) else list(items)
+
+        # Get directions of paths
+        directions = [reverse != path.startswith("-") for path in paths]
+
+        # Get the values of each path and the positions of items with a value
+        columns = [self._column(path.removeprefix("-"), items) for path in paths]
+
+        # Check if only the first n items of a single path are needed
+        if n is not None and len(paths) == 1 and n < len(columns[0][1]):
+            # Get values and positions of items with a value
+            values, positions = columns[0]
+
+            # Return the first n items without sorting all of them
+            return list(
+                map(
+                    items.__getitem__,
+                    (heapq.nlargest if directions[0] else heapq.nsmallest)(
+                        n, positions, key=values.__getitem__
+                    ),
+                )
+            )
+
+        # Initialize positions in item order
+        order = list(range(len(items)))
+
+        # Iterate over paths from the last, given that sorts are stable
+        for (values, positions), direction in zip(
+            reversed(columns), reversed(directions)
+        ):
+            # Sort positions by values at once if every item has a value
+            if len(positions) == len(items):
+                order.sort(key=values.__getitem__, reverse=direction)
+                continue
+
+            # Get whether each position has a value, keeping the current order
+            has_value = list(
+                map(is_not, map(values.__getitem__, order), itertools.repeat(None))
+            )
+
+            # Get positions with and without a value
+            present = list(itertools.compress(order, has_value))
+            missing = list(itertools.compress(order, map(not_, has_value)))
+
+            # Sort positions with a value, followed by those without one
+            present.sort(key=values.__getitem__, reverse=direction)
+            order = present + missing
+
+        # Return items in order, or only the first n
+        return list(map(items.__getitem__, order[:n]))
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _PARALLEL
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _parallel(
+        self,
+        worker: Callable[[Callable[[Any], Any], Any], ReturnBound],
+        func: Callable[[Any], Any],
+        workers: int | None,
+        threads: bool,
+    ) -> tuple[list[Any], list[ReturnBound]]:
+        """Returns partitions of the collection and the result of a worker on each"""
+
+        # Get worker count
+        workers = max(1, workers or os.cpu_count() or 1)
+
+        # Get partitions, several per worker so that a slow one does not hold the rest
+        partitions = self._partition(workers * self.PARALLEL_PARTITIONS)
+
+        # Return results of the current process if there is nothing to parallelize
+        if workers == 1 or len(partitions) <= 1:
+            return partitions, [worker(func, partition) for partition in partitions]
+
+        # Import executors here, as they pull in multiprocessing on import
+        from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+        # Initialize executor, where each partition is pickled separately for processes
+        executor: Executor = (
+            ThreadPoolExecutor(workers) if threads else ProcessPoolExecutor(workers)
+        )
+
+        # Return results in partition order
+        with executor:
+            return partitions, list(
+                executor.map(worker, itertools.repeat(func), partitions)
+            )
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _PARTITION
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _partition(self, n: int) -> list[Any]:
+        """Returns up to n partitions of the items in collection order to be pickled"""
+
+        # Get items
+        items = list(self)
+
+        # Get the minimum item count and the number of partitions with one extra item
+        size, extra = divmod(len(items), n)
+
+        # Initialize partitions and start
+        partitions = []
+        start = 0
+
+        # Iterate over partitions
+        for i in range(n):
+            # Get stop
+            stop = start + size + (1 if i < extra else 0)
+
+            # Break if there are no items left
+            if stop == start:
+                break
+
+            # Append partition
+            partitions.append(items[start:stop])
+
+            # Set start
+            start = stop
+
+        # Return partitions
+        return partitions
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _VALUES AND ITEMS
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _values_and_items(
+        self, path: str, items: Iterable[ItemBound] | None = None
+    ) -> tuple[list[tuple[Any, ItemBound]], list[ItemBound]]:
+        """Returns value-item pairs of a path and the items without a value"""
+
+        # Get getter
+        getter = ogetter(path.replace(".", "__"), default=None, delimiter="__")
+
+        # Initialize value-item pairs and items without a value
+        values_and_items: list[tuple[Any, ItemBound]] = []
+        items_missing: list[ItemBound] = []
+
+        # Iterate over items
+        for item in self if items is None else items:
+            # Get value
+            value = getter(item)
+
+            # Append to items without a value if value is missing or None
+            if value is None:
+                items_missing.append(item)
+
+            # Otherwise append value-item pair
+            else:
+                values_and_items.append((value, item))
+
+        # Return value-item pairs and items without a value
+        return values_and_items, items_missing
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ BOTTOM K
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def bottom_k(self: CollectionBound, n: int, path: str) -> CollectionBound:
+        """Returns a new collection of the n items with the least values of a path
+
+        Items are kept in a heap of n, so this takes O(N log n) rather than a full sort,
+        and items without a value of path are left out.
+        """
+
+        # Initialize collection
+        collection = self.New()
+
+        # Get sorted index of path
+        index = self._get_sorted_index(path)
+
+        # Check if path has a sorted index
+        if index is not None:
+            # Add the first n items in index order
+            collection.add(*itertools.islice(index.items(reverse=False), max(0, n)))
+
+        # Otherwise select n items from value-item pairs
+        else:
+            # Get items, their values and the positions of those with a value
+            items = list(self)
+            values, positions = self._column(path, items)
+
+            # Add the n items with the least values in order
+            collection.add(
+                *map(
+                    items.__getitem__,
+                    heapq.nsmallest(n, positions, key=values.__getitem__),
+                )
+            )
+
+        # Return collection
+        return collection
+
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ COPY DEEP
     # └─────────────────────────────────────────────────────────────────────────────────
@@ -371,6 +907,20 @@ class Collection(Generic[ItemBound], ABC):
         # Return length
         return len(self)
 
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ EXPLAIN
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def explain(self, **kwargs: Any) -> str:
+        """Returns a report of how a filter by keyword args is run
+
+        The report shows the conditions served by an index, the order in which the
+        rest are checked with their selectivity and cost, and the time taken.
+        """
+
+        # Return report
+        return self._explain(FilterPlan.from_kwargs(kwargs))
+
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ FILTER
     # └─────────────────────────────────────────────────────────────────────────────────
@@ -381,30 +931,11 @@ class Collection(Generic[ItemBound], ABC):
         # Initialize collection
         collection = self.New()
 
-        # Initialize conditions
-        conditions = list(get_filter_conditions(kwargs))
+        # Get a compiled filter plan
+        plan = FilterPlan.from_kwargs(kwargs)
 
-        # Iterate over items
-        for item in self:
-            # Iterate over keyword arguments
-            for key, value, operator, checker in conditions:
-                # Initialize try-except block
-                try:
-                    # Get value
-                    value_actual = oget(item, key, delimiter="__")
-
-                # Break on KeyError
-                except KeyError:
-                    break
-
-                # Break if condition not met
-                if checker(value_actual, value) is False:
-                    break
-
-            # Otherwise, add item to collection
-            else:
-                # Add item to collection
-                collection.add(item)
+        # Add items that meet the plan conditions to collection
+        collection.add(*self._filter(plan))
 
         # Return collection
         return collection
@@ -416,8 +947,8 @@ class Collection(Generic[ItemBound], ABC):
     def filter_only(self, **kwargs: Any) -> ItemBound:
         """Filters the collection by keyword args and returns the only item"""
 
-        # Return item
-        return self.filter(**kwargs).only()
+        # Return item without materializing the filtered collection
+        return self.query().filter(**kwargs).only()
 
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ FILTER ONLY OR NONE
@@ -426,8 +957,8 @@ class Collection(Generic[ItemBound], ABC):
     def filter_only_or_none(self, **kwargs: Any) -> ItemBound | None:
         """Filters the collection by keyword args and returns the only item or None"""
 
-        # Return item
-        return self.filter(**kwargs).only_or_none()
+        # Return item without materializing the filtered collection
+        return self.query().filter(**kwargs).only_or_none()
 
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ FIND AND UPDATE
@@ -450,6 +981,9 @@ class Collection(Generic[ItemBound], ABC):
         # Update item
         oupdate(item_found, item, schema=schema)
 
+        # Reindex item, given that keyed or indexed values may have changed
+        self.reindex(item_found)
+
         # Return 1
         return 1
 
@@ -504,6 +1038,16 @@ class Collection(Generic[ItemBound], ABC):
         # Return first item
         return next(iter(self))
 
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ GROUP BY
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def group_by(self, *paths: str) -> GroupBy[ItemBound]:
+        """Returns a grouped view of the items by the values of one or more paths"""
+
+        # Return grouped view
+        return GroupBy(self, *paths)
+
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ HEAD
     # └─────────────────────────────────────────────────────────────────────────────────
@@ -514,20 +1058,46 @@ class Collection(Generic[ItemBound], ABC):
         # Initialize collection
         collection = self.New()
 
-        # Get n
-        n = max(0, min(n, len(self)))
-
-        # Get reverse iterator
-        iterator = reversed(self)
-
-        # Iterate over items
-        for i in range(n):
-            # Add item to collection
-            collection.add(next(iterator))
+        # Add the first n items to collection
+        collection.add(*itertools.islice(self, max(0, n)))
 
         # Return collection
         return collection
 
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ JOIN
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def join(
+        self,
+        other: Collection[Any],
+        on: str | tuple[str, str],
+        how: Literal["inner", "left"] = "inner",
+        merge: Callable[[ItemBound, Any], ReturnBound] | None = None,
+    ) -> Iterator[tuple[ItemBound, Any]] | Iterator[ReturnBound]:
+        """Returns a lazy iterator of the pairs of items with equal values of a path
+
+        The path is either shared or given for each side as a tuple. A unique key of
+        other, such as a DictCollection key, serves the join as it is. Otherwise the
+        smaller collection is hashed and the larger one streamed, which yields pairs in
+        the order of the larger one. With how="left", items without a match are paired
+        with None, and come last if the collection is the smaller one. With merge, the
+        merged record of each pair is yielded instead.
+        """
+
+        # Raise ValueError if join type is not supported
+        if how not in ("inner", "left"):
+            raise ValueError(f"Join type must be 'inner' or 'left', not {how!r}")
+
+        # Get paths
+        path, path_other = (on, on) if isinstance(on, str) else on
+
+        # Get pairs
+        pairs = self._join(other, path, path_other, left=how == "left")
+
+        # Return pairs, or their merged records if merge is given
+        return pairs if merge is None else itertools.starmap(merge, pairs)
+
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ LAST
     # └─────────────────────────────────────────────────────────────────────────────────
@@ -542,6 +1112,46 @@ class Collection(Generic[ItemBound], ABC):
         # Return last item
         return next(reversed(self))
 
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ MAX
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def max(self, path: str) -> ItemBound | None:
+        """Returns the item with the greatest value of a path"""
+
+        # Get sorted index of path
+        index = self._get_sorted_index(path)
+
+        # Return greatest item by sorted index
+        if index is not None:
+            return index.max()
+
+        # Get value-item pairs
+        values_and_items, _ = self._values_and_items(path)
+
+        # Return item with the greatest value
+        return max(values_and_items, key=itemgetter(0))[1] if values_and_items else None
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ MIN
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def min(self, path: str) -> ItemBound | None:
+        """Returns the item with the least value of a path"""
+
+        # Get sorted index of path
+        index = self._get_sorted_index(path)
+
+        # Return least item by sorted index
+        if index is not None:
+            return index.min()
+
+        # Get value-item pairs
+        values_and_items, _ = self._values_and_items(path)
+
+        # Return item with the least value
+        return min(values_and_items, key=itemgetter(0))[1] if values_and_items else None
+
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ ONLY
     # └─────────────────────────────────────────────────────────────────────────────────
@@ -580,18 +1190,173 @@ class Collection(Generic[ItemBound], ABC):
         # Return None
         return None
 
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ ORDER BY
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def order_by(
+        self: CollectionBound, *paths: str, reverse: bool = False
+    ) -> CollectionBound:
+        """Returns a new collection of the items ordered by the values of paths
+
+        A path prefixed with "-" is ordered in the opposite direction, and ties of a
+        path are ordered by the next path.
+        """
+
+        # Raise TypeError if a path is not a string, such as a positional reverse flag
+        if not paths or not all(isinstance(path, str) for path in paths):
+            raise TypeError("order_by takes one or more paths and a keyword reverse")
+
+        # Initialize collection
+        collection = self.New()
+
+        # Get sorted index of path if there is a single path
+        index = (
+            self._get_sorted_index(paths[0].removeprefix("-"))
+            if len(paths) == 1
+            else None
+        )
+
+        # Check if path has a sorted index
+        if index is not None:
+            # Add items in index order followed by items that were not indexed
+            collection.add(
+                *itertools.chain(
+                    index.items(reverse=reverse != paths[0].startswith("-")),
+                    (item for item in self if id(item) not in index),
+                )
+            )
+
+        # Otherwise add items in value order followed by items without a value
+        else:
+            collection.add(*self._order(self, paths, reverse=reverse))
+
+        # Return collection
+        return collection
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ PARALLEL FILTER
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def parallel_filter(
+        self: CollectionBound,
+        func: Callable[[ItemBound], Any],
+        workers: int | None = None,
+        threads: bool = False,
+    ) -> CollectionBound:
+        """Returns a new collection of the items that meet a predicate run in parallel
+
+        The predicate runs in a process pool unless threads is True, in which case it
+        should be I/O-bound. For processes, it must be a module-level function.
+        """
+
+        # Get partitions and the positions of the items of each that meet predicate
+        partitions, positions = self._parallel(filter_partition, func, workers, threads)
+
+        # Initialize collection
+        collection = self.New()
+
+        # Add the items of each partition that meet predicate
+        collection.add(
+            *(
+                partition[i]
+                for partition, positions_partition in zip(partitions, positions)
+                for i in positions_partition
+            )
+        )
+
+        # Return collection
+        return collection
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ PARALLEL MAP
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def parallel_map(
+        self: CollectionBound,
+        func: Callable[[ItemBound], Any],
+        workers: int | None = None,
+        threads: bool = False,
+    ) -> CollectionBound:
+        """Returns a new collection of the results of a function run in parallel
+
+        The function runs in a process pool unless threads is True, in which case it
+        should be I/O-bound. For processes, it must be a module-level function.
+        """
+
+        # Get the results of each partition
+        _, results = self._parallel(map_partition, func, workers, threads)
+
+        # Initialize collection
+        collection = self.New()
+
+        # Add results in collection order
+        collection.add(*itertools.chain.from_iterable(results))
+
+        # Return collection
+        return collection
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ QUERY
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def query(self) -> QuerySet[ItemBound]:
+        """Returns a lazy query set of the collection"""
+
+        # Return query set
+        return QuerySet(self)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ REINDEX
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def reindex(self, *items: ItemBound) -> int:
+        """Updates the entries of mutated items and returns how many changed"""
+
+        # Return 0, given that a plain collection keeps no entries derived from items
+        return 0
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ RESTORE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    @classmethod
+    def restore(
+        cls: type[CollectionBound], path: str, mmap: bool = False
+    ) -> CollectionBound:
+        """Returns a collection from a snapshot, mapping its buffers lazily if mmap"""
+
+        # Load collection
+        collection = load_snapshot(path, mmap=mmap)
+
+        # Raise TypeError if snapshot is not of a collection of this class
+        if not isinstance(collection, cls):
+            raise TypeError(
+                f"{path} is a snapshot of {type(collection).__name__}, "
+                f"not {cls.__name__}"
+            )
+
+        # Return collection
+        return collection
+
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ SAMPLE
     # └─────────────────────────────────────────────────────────────────────────────────
 
     def sample(self: CollectionBound, n: int) -> CollectionBound:
-        """Returns a random sample of n items in the collection"""
+        """Returns a random sample of n items in the collection
 
-        # Convert collection to list
-        items = list(self)
+        Items are sampled in a single pass by a reservoir, so that the collection is not
+        copied into a list first.
+        """
+
+        # Raise ValueError if n is out of range
+        if not 0 <= n <= len(self):
+            raise ValueError("Sample larger than population or is negative")
 
-        # Get sample
-        items = random.sample(items, n)
+        # Get sampled items in random order
+        items = Reservoir(n).extend(self).items
+        random.shuffle(items)
 
         # Initialize sample
         sample = self.New()
@@ -602,6 +1367,39 @@ class Collection(Generic[ItemBound], ABC):
         # Return sample
         return sample
 
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ SKETCH
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def sketch(self, sketch: SketchBound, path: str | None = None) -> SketchBound:
+        """Adds the items, or the values of a path that are not None, to a sketch
+
+        Sketches of partitions, such as those of collection / n, can be merged.
+        """
+
+        # Return sketch
+        return sketch.extend(self, path)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ SNAPSHOT
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def snapshot(self, path: str) -> int:
+        """Writes a binary snapshot of the collection and its keys and indexes"""
+
+        # Write snapshot and return its size in bytes
+        return dump_snapshot(self, path)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ STREAM
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def stream(self) -> Stream[ItemBound]:
+        """Returns a lazy stream of the items of the collection"""
+
+        # Return stream
+        return Stream(self, source=self)
+
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ TAIL
     # └─────────────────────────────────────────────────────────────────────────────────
@@ -625,3 +1423,42 @@ class Collection(Generic[ItemBound], ABC):
 
         # Return collection
         return collection
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ TOP K
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def top_k(self: CollectionBound, n: int, path: str) -> CollectionBound:
+        """Returns a new collection of the n items with the greatest values of a path
+
+        Items are kept in a heap of n, so this takes O(N log n) rather than a full sort,
+        and items without a value of path are left out.
+        """
+
+        # Initialize collection
+        collection = self.New()
+
+        # Get sorted index of path
+        index = self._get_sorted_index(path)
+
+        # Check if path has a sorted index
+        if index is not None:
+            # Add the first n items in index order
+            collection.add(*itertools.islice(index.items(reverse=True), max(0, n)))
+
+        # Otherwise select n items from value-item pairs
+        else:
+            # Get items, their values and the positions of those with a value
+            items = list(self)
+            values, positions = self._column(path, items)
+
+            # Add the n items with the greatest values in order
+            collection.add(
+                *map(
+                    items.__getitem__,
+                    heapq.nlargest(n, positions, key=values.__getitem__),
+                )
+            )
+
+        # Return collection
+        return collection
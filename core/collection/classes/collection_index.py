@@ -0,0 +1,355 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Any, Callable, TypeVar
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.collection.classes.filter_condition import FilterCondition
+from core.object.functions.ogetter import ogetter
+from core.placeholders import nothing
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ SENTINELS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Define a sentinel for items that do not have the path of an index
+MISSING = object()
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ COLLECTION INDEX
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class CollectionIndex(ABC):
+    """An abstract secondary index of collection items by the value of a path"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ TYPE VARIABLES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    CollectionIndexBound = TypeVar("CollectionIndexBound", bound="CollectionIndex")
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ CLASS ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Declare filter operators that can be served by the index
+    OPERATORS: frozenset[str] = frozenset()
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ INSTANCE ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Declare type of path
+    path: str
+
+    # Declare type of getter
+    getter: Callable[[Any], Any]
+
+    # Declare type of values by item ID
+    _values_by_id: dict[int, Any]
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, path: str) -> None:
+        """Init Method"""
+
+        # Set path, normalized to the filter keyword delimiter
+        self.path = path.replace(".", "__")
+
+        # Set getter
+        self.getter = ogetter(self.path, default=MISSING, delimiter="__")
+
+        # Initialize values by item ID
+        self._values_by_id = {}
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __CONTAINS__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __contains__(self, item_id: int) -> bool:
+        """Contains Method"""
+
+        # Return whether item ID is indexed
+        return item_id in self._values_by_id
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __GETSTATE__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Get State Method"""
+
+        # Get state
+        state = self.__dict__.copy()
+
+        # Remove getter, which is a closure that cannot be pickled
+        del state["getter"]
+
+        # Return state
+        return state
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __LEN__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __len__(self) -> int:
+        """Length Method"""
+
+        # Return indexed item count
+        return len(self._values_by_id)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __REPR__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __repr__(self) -> str:
+        """Representation Method"""
+
+        # Return representation
+        return f"<{self.__class__.__name__}: {self.path} ({len(self)} items)>"
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __SETSTATE__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Set State Method"""
+
+        # Update state
+        self.__dict__.update(state)
+
+        # Set getter
+        self.getter = ogetter(self.path, default=MISSING, delimiter="__")
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _ADD
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    @abstractmethod
+    def _add(self, item_id: int, item: Any, value: Any) -> bool:
+        """Adds an item by value and returns whether it was indexed"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _ADD ORDERED
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _add_ordered(
+        self, item_id: int, item: Any, value: Any, positions: dict[int, int]
+    ) -> bool:
+        """Adds an item by value among equal values in order of insertion position"""
+
+        # Add item, given that the index does not keep items in an order
+        return self._add(item_id, item, value)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _CLEAR
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    @abstractmethod
+    def _clear(self) -> None:
+        """Clears the index structures"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _LOOKUP
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    @abstractmethod
+    def _lookup(self, condition: FilterCondition) -> dict[int, Any] | None:
+        """Returns items by ID that meet a condition or None if it cannot be served"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _REMAP
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    @abstractmethod
+    def _remap(self, item_ids: dict[int, int] | list[int]) -> None:
+        """Replaces the item IDs of the index structures by what they map to"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _REMOVE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    @abstractmethod
+    def _remove(self, item_id: int, value: Any) -> None:
+        """Removes an item by its indexed value"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ NEW
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def New(self: CollectionIndexBound) -> CollectionIndexBound:
+        """Returns a new empty index of the same path"""
+
+        # Return new index
+        return self.__class__(self.path)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ ADD
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def add(self, item_id: int, item: Any) -> None:
+        """Adds an item to the index"""
+
+        # Get value
+        value = self.getter(item)
+
+        # Return if item does not have the path
+        if value is MISSING:
+            return
+
+        # Add item and store value so that it can be removed after a mutation
+        if self._add(item_id, item, value):
+            self._values_by_id[item_id] = value
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ CLEAR
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def clear(self) -> None:
+        """Clears the index"""
+
+        # Clear values by item ID
+        self._values_by_id.clear()
+
+        # Clear index structures
+        self._clear()
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ COPY
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def copy(
+        self: CollectionIndexBound, items_by_id: dict[int, Any]
+    ) -> CollectionIndexBound:
+        """Returns a copy of the index restricted to items by ID"""
+
+        # Initialize index
+        index = self.New()
+
+        # Iterate over stored values by item ID
+        for item_id, value in self._values_by_id.items():
+            # Continue if item is not kept
+            if item_id not in items_by_id:
+                continue
+
+            # Add item by its stored value without getting it again
+            if index._add(item_id, items_by_id[item_id], value):
+                index._values_by_id[item_id] = value
+
+        # Return index
+        return index
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ LOOKUP
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def lookup(self, *conditions: FilterCondition) -> dict[int, Any] | None:
+        """Returns items by ID that meet all conditions or None if unservable"""
+
+        # Initialize items
+        items: dict[int, Any] | None = None
+
+        # Iterate over conditions
+        for condition in conditions:
+            # Lookup items that meet condition
+            items_condition = self._lookup(condition)
+
+            # Return None if condition cannot be served
+            if items_condition is None:
+                return None
+
+            # Intersect items
+            items = (
+                items_condition
+                if items is None
+                else {k: v for k, v in items.items() if k in items_condition}
+            )
+
+        # Return items
+        return items
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ REMAP
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def remap(self, item_ids: dict[int, int] | list[int]) -> None:
+        """Replaces item IDs by what they map to, as when items were unpickled"""
+
+        # Replace the item IDs of values
+        self._values_by_id = dict(
+            zip(
+                map(item_ids.__getitem__, self._values_by_id),
+                self._values_by_id.values(),
+            )
+        )
+
+        # Replace the item IDs of index structures
+        self._remap(item_ids)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ REMOVE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def remove(self, item_id: int) -> None:
+        """Removes an item from the index by its ID"""
+
+        # Pop value
+        value = self._values_by_id.pop(item_id, nothing)
+
+        # Return if item was not indexed
+        if value is nothing:
+            return
+
+        # Remove item by its indexed value
+        self._remove(item_id, value)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ UPDATE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def update(
+        self, item_id: int, item: Any, positions: dict[int, int] | None = None
+    ) -> bool:
+        """Moves an item to its current value and returns whether it had changed
+
+        Given the insertion positions of items, an ordered index keeps the item among
+        equal values in collection order rather than after them.
+        """
+
+        # Get current and stored values
+        value = self.getter(item)
+        value_stored = self._values_by_id.get(item_id, MISSING)
+
+        # Return False if value is unchanged
+        if value is value_stored or (
+            type(value) is type(value_stored) and value == value_stored
+        ):
+            return False
+
+        # Remove item by its stored value
+        self.remove(item_id)
+
+        # Return True if item no longer has the path
+        if value is MISSING:
+            return True
+
+        # Add item by its current value, among equal values by position if given
+        if (
+            self._add(item_id, item, value)
+            if positions is None
+            else self._add_ordered(item_id, item, value, positions)
+        ):
+            self._values_by_id[item_id] = value
+
+        # Return True
+        return True
@@ -0,0 +1,692 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+import itertools
+import operator
+
+from array import array
+from time import perf_counter_ns
+from typing import (
+    Any,
+    Callable,
+    Generator,
+    Hashable,
+    Iterable,
+    Iterator,
+    Sequence,
+    TypeVar,
+)
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.collection.classes.collection import Collection
+from core.collection.classes.filter_condition import FilterCondition
+from core.collection.classes.filter_plan import FilterPlan
+from core.collection.classes.filter_statistics import FilterStatistics
+from core.collection.functions.import_numpy import import_numpy
+from core.collection.functions.parallel import filter_partition
+from core.object.functions.ogetter import ogetter
+from core.object.functions.olower import olower
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TYPE VARIABLES
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+ItemBound = TypeVar("ItemBound", bound=Any)
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ COMPARATORS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Define comparators of operators that can be applied to a whole typed column at once
+COMPARATORS: dict[str, Callable[[Any, Any], Any]] = {
+    "__eq": operator.eq,
+    "__gt": operator.gt,
+    "__gte": operator.ge,
+    "__lt": operator.lt,
+    "__lte": operator.le,
+}
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ COLUMN COLLECTION
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class ColumnCollection(Collection[ItemBound]):
+    """A column-based collection utility class for homogeneous records"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ INSTANCE ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Declare type of columns by name
+    _columns: dict[str, array[Any] | list[Any]]
+
+    # Declare type of array typecodes by column name
+    _typecodes: dict[str, str | None]
+
+    # Declare type of item factory
+    _factory: Callable[..., ItemBound]
+
+    # Declare type of value getters by column name
+    _getters: dict[str, Callable[[Any], Any]]
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(
+        self,
+        columns: Iterable[str] | dict[str, str | None],
+        factory: Callable[..., ItemBound] | None = None,
+    ) -> None:
+        """Init Method"""
+
+        # Set typecodes, where a column without a typecode holds arbitrary objects
+        self._typecodes = (
+            dict(columns)
+            if isinstance(columns, dict)
+            else {column: None for column in columns}
+        )
+
+        # Initialize columns as typed arrays or lists
+        self._columns = {
+            column: array(typecode) if typecode else []
+            for column, typecode in self._typecodes.items()
+        }
+
+        # Set factory, which builds items from column values passed as keyword args
+        self._factory = factory or dict  # type: ignore
+
+        # Set value getters
+        self._getters = {
+            column: ogetter(column, default=None) for column in self._columns
+        }
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __GETITEM__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __getitem__(self, item: Any) -> Any:
+        """Get Item Method"""
+
+        # Check if item is a slice
+        if isinstance(item, slice):
+            # Return items of rows in slice
+            return [self._row(row) for row in range(len(self))[item]]
+
+        # Return item of row
+        return self._row(range(len(self))[item])
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __GETSTATE__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Get State Method"""
+
+        # Get state
+        state = self.__dict__.copy()
+
+        # Remove value getters, which are closures that cannot be pickled
+        del state["_getters"]
+
+        # Return state
+        return state
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __ITER__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __iter__(self) -> Iterator[ItemBound]:
+        """Iterate Method"""
+
+        # Return iterator of items, built lazily from rows
+        return self._rows(range(len(self)))
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __LEN__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __len__(self) -> int:
+        """Length Method"""
+
+        # Return the length of the first column if any
+        return len(next(iter(self._columns.values()), ()))
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __REVERSED__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __reversed__(self) -> Iterator[ItemBound]:
+        """Reversed Method"""
+
+        # Return reversed iterator of items
+        return self._rows(range(len(self) - 1, -1, -1))
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __SETSTATE__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Set State Method"""
+
+        # Update state
+        self.__dict__.update(state)
+
+        # Set value getters
+        self._getters = {
+            column: ogetter(column, default=None) for column in self._columns
+        }
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __TRUEDIV__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __truediv__(
+        self, other: int
+    ) -> Generator[ColumnCollection[ItemBound], None, None]:
+        """True Division Method"""
+
+        # Check if invalid
+        if other <= 0:
+            return
+
+        # Get the minimum row count and the number of collections with one extra row
+        size, extra = divmod(len(self), other)
+
+        # Initialize start
+        start = 0
+
+        # Iterate over collections
+        for i in range(other):
+            # Get stop
+            stop = start + size + (1 if i < extra else 0)
+
+            # Return if there are no rows left
+            if stop == start:
+                return
+
+            # Yield collection of rows
+            yield self._take(range(start, stop))
+
+            # Set start
+            start = stop
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _FILTER
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _filter(self, plan: FilterPlan) -> Iterator[ItemBound]:
+        """Yields the items of the collection that meet a filter plan"""
+
+        # Return items of selected rows
+        return self._rows(self._select(plan, self._filter_statistics()))
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _MASK
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _mask(self, condition: FilterCondition, rows: Sequence[int]) -> Iterable[Any]:
+        """Returns a mask of whether each row meets a condition"""
+
+        # Get column and expected value
+        column = self._columns.get(condition.path)
+        expected = condition.expected
+
+        # Check if path is not a column, such as a nested path
+        if column is None:
+            # Return mask of condition by row item
+            return map(condition, self._records(rows))
+
+        # Get column values of rows, avoiding a copy if all rows are selected
+        values: Iterable[Any] = (
+            column if len(rows) == len(column) else map(column.__getitem__, rows)
+        )
+
+        # Check if column is typed and can be compared as a whole
+        if (
+            isinstance(column, array)
+            and column.typecode != "u"
+            and self._is_numeric(condition)
+        ):
+            # Get NumPy if it is available
+            numpy = import_numpy()
+
+            # Check if NumPy is available
+            if numpy is not None:
+                # Get typed column values as an array view without copying
+                view = numpy.frombuffer(column, dtype=column.typecode)
+
+                # Select rows if not all rows are selected
+                if len(rows) != len(column):
+                    view = view[rows]
+
+                # Return vectorized mask
+                if condition.operator == "__in":
+                    return numpy.isin(view, list(expected))  # type: ignore
+                return COMPARATORS[condition.operator](view, expected)
+
+            # Return mask of comparator, which does not need to handle TypeError
+            if condition.operator == "__in":
+                return map(set(expected).__contains__, values)
+            return map(
+                COMPARATORS[condition.operator], values, itertools.repeat(expected)
+            )
+
+        # Lowercase values if condition is case-insensitive
+        if condition.accessor is not condition.getter:
+            values = map(olower, values)
+
+        # Return mask of checker
+        return (
+            result is not False
+            for result in map(condition.checker, values, itertools.repeat(expected))
+        )
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _IS NUMERIC
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _is_numeric(condition: FilterCondition) -> bool:
+        """Returns whether a condition compares against numbers only"""
+
+        # Get expected value
+        expected = condition.expected
+
+        # Check if operator is a membership operator
+        if condition.operator == "__in":
+            # Return whether expected value is a container of numbers
+            return isinstance(expected, (list, tuple, set, frozenset)) and all(
+                isinstance(value, (int, float)) for value in expected
+            )
+
+        # Return whether operator is a comparator of a number
+        return condition.operator in COMPARATORS and isinstance(expected, (int, float))
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _PARTITION
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _partition(self, n: int) -> list[Any]:
+        """Returns up to n partitions of rows, which are pickled as column slices"""
+
+        # Return collections of contiguous rows
+        return list(self / n)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _RECORDS
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _records(self, rows: Iterable[int]) -> Iterator[dict[str, Any]]:
+        """Returns an iterator of column values by name of each row"""
+
+        # Get column names and columns
+        names, columns = tuple(self._columns), tuple(self._columns.values())
+
+        # Iterate over rows
+        for row in rows:
+            # Yield column values by name
+            yield {name: column[row] for name, column in zip(names, columns)}
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _ROW
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _row(self, row: int) -> ItemBound:
+        """Returns the item of a row"""
+
+        # Return item built from column values
+        return self._factory(
+            **{name: column[row] for name, column in self._columns.items()}
+        )
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _ROWS
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _rows(self, rows: Iterable[int]) -> Iterator[ItemBound]:
+        """Returns an iterator of the items of rows"""
+
+        # Get factory
+        factory = self._factory
+
+        # Iterate over column values by name of each row
+        for record in self._records(rows):
+            # Yield item
+            yield factory(**record)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _SELECT
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _select(
+        self, plan: FilterPlan, statistics: FilterStatistics | None = None
+    ) -> Sequence[int]:
+        """Returns the rows that meet a filter plan
+
+        With statistics, conditions are checked in order of least expected work and
+        the selectivity and cost of each is recorded. If a reordered check raises, the
+        rows are selected again in the given order, so that errors surface as usual.
+        """
+
+        # Initialize rows
+        rows: Sequence[int] = range(len(self))
+
+        # Get NumPy if it is available
+        numpy = import_numpy()
+
+        # Initialize try-except block
+        try:
+            # Iterate over conditions
+            for condition in (
+                plan.conditions
+                if statistics is None
+                else statistics.order(plan.conditions)
+            ):
+                # Return if no rows are left
+                if not len(rows):
+                    return rows
+
+                # Get the number of rows checked and the start time
+                checked, start = len(rows), perf_counter_ns()
+
+                # Get mask of the remaining rows
+                mask = self._mask(condition, rows)
+
+                # Narrow rows by mask
+                rows = (
+                    (
+                        numpy.flatnonzero(mask)
+                        if isinstance(rows, range)
+                        else numpy.asarray(rows)[mask]  # type: ignore
+                    )
+                    if numpy is not None and isinstance(mask, numpy.ndarray)
+                    else list(itertools.compress(rows, mask))
+                )
+
+                # Record checks, passes and time taken if there are statistics
+                if statistics is not None:
+                    statistics.record(
+                        condition, checked, len(rows), perf_counter_ns() - start
+                    )
+
+        # Select rows in the given order if a reordered check raises
+        except Exception:
+            # Re-raise if conditions were checked in the given order
+            if statistics is None:
+                raise
+
+            # Return rows selected in the given order
+            return self._select(plan)
+
+        # Return rows
+        return rows
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _TAKE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _take(self, rows: Sequence[int]) -> ColumnCollection[ItemBound]:
+        """Returns a new collection of rows without building their items"""
+
+        # Initialize collection
+        collection = self.New()
+
+        # Get NumPy if it is available
+        numpy = import_numpy()
+
+        # Get rows as a list of ints for indexing lists if selected by NumPy
+        rows_list = (
+            rows.tolist()  # type: ignore
+            if numpy is not None and isinstance(rows, numpy.ndarray)
+            else rows
+        )
+
+        # Iterate over columns
+        for name, column in self._columns.items():
+            # Check if rows are a contiguous range
+            if isinstance(rows, range) and rows.step == 1:
+                collection._columns[name] = column[rows.start : rows.stop]  # noqa: E203
+
+            # Otherwise check if column is typed and NumPy is available
+            elif isinstance(column, array) and numpy is not None:
+                collection._columns[name].frombytes(  # type: ignore
+                    numpy.frombuffer(column, dtype=column.typecode)[rows].tobytes()
+                    if len(column)
+                    else b""
+                )
+
+            # Otherwise take column values of rows
+            else:
+                collection._columns[name].extend(map(column.__getitem__, rows_list))
+
+        # Return collection
+        return collection
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ NEW
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def New(self, *args: Any, **kwargs: Any) -> ColumnCollection[ItemBound]:
+        """Returns a new collection"""
+
+        # Check if columns not in kwargs
+        if not args and "columns" not in kwargs:
+            # Add columns to kwargs
+            kwargs["columns"] = self._typecodes
+
+        # Check if factory not in kwargs
+        if "factory" not in kwargs:
+            # Add factory to kwargs
+            kwargs["factory"] = self._factory
+
+        # Return new collection
+        return ColumnCollection(*args, **kwargs)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ ADD
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def add(self, *items: ItemBound) -> int:
+        """Adds an item to the collection"""
+
+        # Get column values by name of each item
+        records = [
+            {name: getter(item) for name, getter in self._getters.items()}
+            for item in items
+        ]
+
+        # Get length
+        length = len(self)
+
+        # Initialize try-except block
+        try:
+            # Iterate over columns
+            for name, column in self._columns.items():
+                # Extend column with the values of the items
+                column.extend([record[name] for record in records])
+
+        # Roll back columns if a value does not fit a typed column
+        except (OverflowError, TypeError):
+            # Iterate over columns
+            for column in self._columns.values():
+                # Truncate column to original length
+                del column[length:]
+
+            # Re-raise exception
+            raise
+
+        # Return count
+        return len(records)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ COLUMN
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def column(self, name: str) -> array[Any] | list[Any]:
+        """Returns the storage of a column, which should be treated as read-only"""
+
+        # Return column
+        return self._columns[name]
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ COLUMNS
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    @property
+    def columns(self) -> tuple[str, ...]:
+        """Returns the column names of the collection"""
+
+        # Return column names
+        return tuple(self._columns)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ COUNT
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def count(self) -> int:
+        """Returns the number of items in the collection"""
+
+        # Return length
+        return len(self)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ FILTER
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def filter(self, **kwargs: Any) -> ColumnCollection[ItemBound]:
+        """Filters the collection by keyword args"""
+
+        # Return collection of the rows that meet the plan conditions, reordered by
+        # filter statistics as _filter does
+        return self._take(
+            self._select(FilterPlan.from_kwargs(kwargs), self._filter_statistics())
+        )
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ FIND
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def find(self, item: Any | ItemBound) -> ItemBound | None:
+        """Finds an item in the collection"""
+
+        # Check if item is not a row index
+        if not isinstance(item, int):
+            # Get column values of item
+            values = tuple(getter(item) for getter in self._getters.values())
+
+            # Iterate over rows
+            for row, current in enumerate(zip(*self._columns.values())):
+                # Return item of row if column values are equal
+                if current == values:
+                    return self._row(row)
+
+        # Return get
+        return self.get(item)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ GET
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def get(self, key: Hashable, default: ItemBound | None = None) -> ItemBound | None:
+        """Gets an item from the column collection"""
+
+        # Return default if key is not an int or exceeds length
+        if not isinstance(key, int) or key > len(self) - 1:
+            return default
+
+        # Return item of row
+        return self[key]  # type: ignore
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ HEAD
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def head(self, n: int = 5) -> ColumnCollection[ItemBound]:
+        """Returns a new collection of the first n items of the collection"""
+
+        # Return collection of the first n rows
+        return self._take(range(min(max(0, n), len(self))))
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ NEXT
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def next(self) -> ItemBound | None:
+        """Returns the next item in the collection"""
+
+        # Raise NotImplementedError
+        raise NotImplementedError
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ PARALLEL FILTER
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def parallel_filter(
+        self,
+        func: Callable[[ItemBound], Any],
+        workers: int | None = None,
+        threads: bool = False,
+    ) -> ColumnCollection[ItemBound]:
+        """Returns a new collection of the rows that meet a predicate run in parallel"""
+
+        # Get partitions and the positions of the rows of each that meet predicate
+        partitions, positions = self._parallel(filter_partition, func, workers, threads)
+
+        # Get the offset of each partition, which holds contiguous rows
+        offsets = itertools.accumulate((len(p) for p in partitions), initial=0)
+
+        # Return collection of the rows that meet predicate without building items
+        return self._take(
+            [
+                offset + i
+                for offset, positions_partition in zip(offsets, positions)
+                for i in positions_partition
+            ]
+        )
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ REMOVE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def remove(self, *items: Any | ItemBound) -> int:
+        """Removes an item from the collection"""
+
+        # Get column values of items
+        values = [
+            tuple(getter(item) for getter in self._getters.values()) for item in items
+        ]
+
+        # Get the rows to keep
+        rows = [
+            row
+            for row, current in enumerate(zip(*self._columns.values()))
+            if current not in values
+        ]
+
+        # Get original length
+        len0 = len(self)
+
+        # Replace columns with those of the rows to keep
+        self._columns = self._take(rows)._columns
+
+        # Return number of items removed
+        return len0 - len(self)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ TAIL
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def tail(self, n: int = 5) -> ColumnCollection[ItemBound]:
+        """Returns a new collection of the last n items of the collection"""
+
+        # Return collection of the last n rows
+        return self._take(range(max(0, len(self) - max(0, n)), len(self)))
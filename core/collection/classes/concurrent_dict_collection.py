@@ -0,0 +1,629 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+import threading
+
+from contextlib import contextmanager
+from typing import Any, Callable, Hashable, Iterable, Iterator, TypeVar
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.collection.classes.collection import Collection
+from core.collection.classes.collection_index import CollectionIndex
+from core.collection.classes.dict_collection import DictCollection
+from core.collection.classes.filter_condition import FilterCondition
+from core.collection.classes.filter_plan import FilterPlan
+from core.collection.classes.sorted_index import SortedIndex
+from core.collection.exceptions import DuplicateKeyError, NoSuchKeyError
+from core.placeholders import nothing
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TYPE VARIABLES
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+ItemBound = TypeVar("ItemBound", bound=Any)
+ReturnBound = TypeVar("ReturnBound")
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ CONCURRENT DICT COLLECTION
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class ConcurrentDictCollection(DictCollection[ItemBound]):
+    """A thread-safe dict collection whose writers are lock-striped by key hash"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ INSTANCE ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Declare type of stripe locks
+    _stripes: tuple[threading.RLock, ...]
+
+    # Declare type of the lock of secondary indexes and insertion positions
+    _index_lock: threading.Lock
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(
+        self,
+        keys: Iterable[str | Iterable[str]] | str | None = None,
+        indexes: Iterable[str | CollectionIndex] | None = None,
+        stripes: int = 16,
+    ) -> None:
+        """Init Method"""
+
+        # Initialize stripe locks, which are reentrant so that bulk methods can nest
+        self._stripes = tuple(threading.RLock() for _ in range(max(1, stripes)))
+
+        # Initialize index lock
+        self._index_lock = threading.Lock()
+
+        # Initialize dict collection
+        super().__init__(keys=keys, indexes=indexes)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __GETITEM__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __getitem__(self, key_value: Hashable) -> ItemBound:
+        """Get Item Method"""
+
+        # Get item in a single lookup of each dict, so that a removal cannot race it
+        item: Any = self._items_by_id.get(
+            self._item_ids_by_key.get(key_value, 0), nothing
+        )
+
+        # Raise NoSuchKeyError if key value is not in collection
+        if item is nothing:
+            raise NoSuchKeyError(key_value)
+
+        # Return item
+        return item
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __GETSTATE__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Get State Method"""
+
+        # Get state while all writers are held off
+        with self._locked():
+            state = super().__getstate__()
+
+        # Replace locks, which cannot be pickled, by the number of stripes
+        state["_stripes"] = len(self._stripes)
+        del state["_index_lock"]
+
+        # Return state
+        return state
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __ITER__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __iter__(self) -> Iterator[ItemBound]:
+        """Iterate Method"""
+
+        # Return iterator of a snapshot, which is unaffected by concurrent writers
+        return iter(self._items_by_id.copy().values())
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __REVERSED__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __reversed__(self) -> Iterator[ItemBound]:
+        """Reversed Method"""
+
+        # Return reversed iterator of a snapshot
+        return reversed(self._items_by_id.copy().values())
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __SETSTATE__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Set State Method"""
+
+        # Initialize stripe locks and index lock
+        self._stripes = tuple(threading.RLock() for _ in range(state.pop("_stripes")))
+        self._index_lock = threading.Lock()
+
+        # Set state
+        super().__setstate__(state)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __AND__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __and__(  # type: ignore[override]
+        self, other: Any
+    ) -> DictCollection[ItemBound]:
+        """And Method"""
+
+        # Return intersection while all writers are held off
+        with self._locked():
+            return super().__and__(other)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __OR__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __or__(self, other: Any) -> DictCollection[ItemBound]:  # type: ignore[override]
+        """Or Method"""
+
+        # Return union while all writers are held off
+        with self._locked():
+            return super().__or__(other)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _CANDIDATES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _candidates(self, plan: FilterPlan) -> tuple[list[Any] | None, FilterPlan]:
+        """Returns candidate items in collection order and the residual plan"""
+
+        # Return candidate items while secondary indexes are held still
+        with self._index_lock:
+            return super()._candidates(plan)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _COPY
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _copy(self, item_ids: Iterable[int] | None = None) -> DictCollection[ItemBound]:
+        """Returns a shallow copy of all items, or of items by ID, without rekeying"""
+
+        # Return copy while all writers are held off
+        with self._locked():
+            return super()._copy(item_ids)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _GET SORTED INDEX
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _get_sorted_index(self, path: str) -> SortedIndex | None:
+        """Returns None, given that sorted indexes are walked lazily by ordering"""
+
+        # Return None so that ordering iterates a snapshot instead
+        return None
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _INDEX ADD
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _index_add(self, item_id: int, item: Any) -> None:
+        """Adds an item to the secondary indexes"""
+
+        # Add item to secondary indexes under index lock
+        with self._index_lock:
+            super()._index_add(item_id, item)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _INDEX ADD MANY
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _index_add_many(self, items_by_id: dict[int, Any]) -> None:
+        """Adds new items by ID to the secondary indexes"""
+
+        # Add items to secondary indexes under index lock
+        with self._index_lock:
+            super()._index_add_many(items_by_id)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _INDEX REMOVE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _index_remove(self, item_id: int) -> None:
+        """Removes an item from the secondary indexes"""
+
+        # Remove item from secondary indexes under index lock
+        with self._index_lock:
+            super()._index_remove(item_id)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _INDEX UPDATE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _index_update(self, item_id: int, item: Any) -> bool:
+        """Updates the index entries of an item and returns whether any changed"""
+
+        # Update item in secondary indexes under index lock
+        with self._index_lock:
+            return super()._index_update(item_id, item)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _KEY VALUES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _key_values(self, item: Any) -> tuple[Hashable, ...]:
+        """Returns the key values of an item, skipping missing and None as add does"""
+
+        # Initialize key values
+        key_values: list[Hashable] = []
+
+        # Iterate over key getters
+        for getter in self._key_getters:
+            # Get key value
+            key_value = getter(item)
+
+            # Append key value if it would be keyed
+            if (
+                key_value is not nothing
+                and key_value is not None
+                and key_value not in key_values
+            ):
+                key_values.append(key_value)
+
+        # Return key values
+        return tuple(key_values)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _LOCKED
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Holds all stripe locks, which excludes every writer"""
+
+        # Acquire all stripe locks in order
+        for lock in self._stripes:
+            lock.acquire()
+
+        # Initialize try-finally block
+        try:
+            # Yield control
+            yield
+
+        # Release stripe locks in reverse order
+        finally:
+            for lock in reversed(self._stripes):
+                lock.release()
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _LOOKUP CONDITION
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _lookup_condition(self, condition: FilterCondition) -> dict[int, Any] | None:
+        """Returns items by ID that meet a condition without an index or None"""
+
+        # Return items, retrying reads that race a removal
+        return self._retry(super()._lookup_condition, condition)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _RETRY
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _retry(self, function: Callable[..., ReturnBound], *args: Any) -> ReturnBound:
+        """Calls a lock-free read until it does not race a concurrent removal"""
+
+        # Loop until the read completes
+        while True:
+            # Initialize try-except block
+            try:
+                # Return result of read
+                return function(*args)
+
+            # Raise a missing key, which is a genuine result rather than a race
+            except NoSuchKeyError:
+                raise
+
+            # Retry if a key was removed between two lookups of the read
+            except KeyError:
+                continue
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _STRIPES OF
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _stripes_of(
+        self, item_id: int, key_values: tuple[Hashable, ...], by_id: bool = False
+    ) -> list[threading.RLock]:
+        """Returns the stripe locks of key values, or of an item ID, in lock order"""
+
+        # Get stripes
+        stripes = self._stripes
+
+        # Get stripe count
+        n = len(stripes)
+
+        # Return the stripe lock of item ID if it has no key values to serialize on
+        if not key_values and not by_id:
+            return [stripes[(item_id >> 4) % n]]
+
+        # Return the stripe lock of a single key value
+        if len(key_values) == 1 and not by_id:
+            return [stripes[hash(key_values[0]) % n]]
+
+        # Get the distinct stripes of key values and, if requested, of item ID
+        indices = {hash(key_value) % n for key_value in key_values}
+        if by_id:
+            indices.add((item_id >> 4) % n)
+
+        # Return stripe locks in order, so that writers cannot deadlock
+        return [stripes[i] for i in sorted(indices)]
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ NEW
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def New(self, *args: Any, **kwargs: Any) -> ConcurrentDictCollection[ItemBound]:
+        """Returns a new collection"""
+
+        # Check if keys not in kwargs
+        if "keys" not in kwargs:
+            # Add keys to kwargs
+            kwargs["keys"] = self._keys
+
+        # Check if indexes not in kwargs
+        if "indexes" not in kwargs:
+            # Add new empty indexes of the same paths to kwargs
+            kwargs["indexes"] = tuple(index.New() for index in self._indexes)
+
+        # Check if stripes not in kwargs
+        if "stripes" not in kwargs:
+            # Add stripe count to kwargs
+            kwargs["stripes"] = len(self._stripes)
+
+        # Return new collection
+        return ConcurrentDictCollection(*args, **kwargs)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ ADD
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def add(self, *items: ItemBound) -> int:
+        """Adds an item to the collection, locking only the stripes of its keys"""
+
+        # Initialize count
+        count = 0
+
+        # Iterate over items
+        for item in items:
+            # Continue if item is None
+            if item is None:
+                continue
+
+            # Get item ID and key values, computed before any lock is taken
+            item_id, key_values = id(item), self._key_values(item)
+
+            # Get stripe locks
+            locks = self._stripes_of(item_id, key_values)
+
+            # Acquire stripe locks
+            for lock in locks:
+                lock.acquire()
+
+            # Initialize try-finally block
+            try:
+                # Continue if item is already in collection
+                if item_id in self._items_by_id:
+                    continue
+
+                # Iterate over key values
+                for key_value in key_values:
+                    # Raise DuplicateKeyError if key value is already in collection
+                    if key_value in self._item_ids_by_key:
+                        raise DuplicateKeyError(key_value)
+
+                # Iterate over key values
+                for key_value in key_values:
+                    # Add key value to item IDs by key
+                    self._item_ids_by_key[key_value] = item_id
+
+                # Store key values so that they can be updated or removed later
+                if key_values:
+                    self._key_values_by_id[item_id] = key_values
+
+                # Hold index lock, so that positions follow the order of items by ID
+                with self._index_lock:
+                    # Add item to collection
+                    self._items_by_id[item_id] = item
+
+                    # Add item to secondary indexes
+                    super()._index_add(item_id, item)
+
+                # Increment count
+                count += 1
+
+            # Release stripe locks
+            finally:
+                for lock in reversed(locks):
+                    lock.release()
+
+        # Return count
+        return count
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ ADD INDEX
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def add_index(self, *indexes: str | CollectionIndex) -> None:
+        """Adds and builds secondary indexes where a path string declares a HashIndex"""
+
+        # Add indexes while all writers and index readers are held off
+        with self._locked(), self._index_lock:
+            super().add_index(*indexes)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ ADD MANY
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def add_many(self, items: Iterable[ItemBound]) -> int:
+        """Adds an iterable of items atomically, reporting all duplicate keys at once"""
+
+        # Add items while all writers are held off, so that the batch stays atomic
+        with self._locked():
+            return super().add_many(items)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ COPY SHALLOW
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def copy_shallow(  # type: ignore[override]
+        self, exclude: Collection[Any] | None = None
+    ) -> DictCollection[ItemBound]:
+        """Returns a shallow copy of the collection"""
+
+        # Return copy while all writers are held off
+        with self._locked():
+            return super().copy_shallow(exclude)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ FIND
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def find(self, item: Any | ItemBound) -> ItemBound | None:
+        """Finds an item in the collection"""
+
+        # Return item if it is in collection
+        if id(item) in self._items_by_id:
+            return item
+
+        # Return item, retrying reads that race a removal
+        return self._retry(super().find, item)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ GET
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def get(
+        self, key: Hashable, default: ItemBound | Hashable | None = None
+    ) -> ItemBound | None:
+        """Gets an item from the collection by key"""
+
+        # Get item in a single lookup of each dict, so that a removal cannot race it
+        item: Any = self._items_by_id.get(self._item_ids_by_key.get(key, 0), nothing)
+
+        # Return item if key is in collection
+        if item is not nothing:
+            return item
+
+        # Return resolved default
+        return default if default is None else self.find(default)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ REINDEX
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def reindex(self, *items: Any | ItemBound) -> int:
+        """Updates the entries of mutated items and returns how many changed"""
+
+        # Initialize count
+        count = 0
+
+        # Iterate over items
+        for item in items:
+            # Get item ID
+            item_id = id(item)
+
+            # Loop until the stored key values are unchanged once locked
+            while True:
+                # Get stored key values
+                key_values_stored = self._key_values_by_id.get(item_id, ())
+
+                # Get the stripe locks of both stored and current key values
+                locks = self._stripes_of(
+                    item_id,
+                    key_values_stored + self._key_values(item),
+                    by_id=not key_values_stored,
+                )
+
+                # Acquire stripe locks
+                for lock in locks:
+                    lock.acquire()
+
+                # Initialize try-finally block
+                try:
+                    # Retry if another writer changed the stored key values meanwhile
+                    if self._key_values_by_id.get(item_id, ()) != key_values_stored:
+                        continue
+
+                    # Update item and increment count if any entry changed
+                    count += super().reindex(item)
+
+                    # Break
+                    break
+
+                # Release stripe locks
+                finally:
+                    for lock in reversed(locks):
+                        lock.release()
+
+        # Return count
+        return count
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ REMOVE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def remove(self, *items: Any | ItemBound) -> int:
+        """Removes an item from the collection"""
+
+        # Initialize count
+        count = 0
+
+        # Iterate over items
+        for item in items:
+            # Find item
+            item = self.find(item)
+
+            # Continue if item is None
+            if item is None:
+                continue
+
+            # Get item ID
+            item_id = id(item)
+
+            # Loop until the stored key values are unchanged once locked
+            while True:
+                # Get stored key values
+                key_values = self._key_values_by_id.get(item_id, ())
+
+                # Get stripe locks
+                locks = self._stripes_of(item_id, key_values)
+
+                # Acquire stripe locks
+                for lock in locks:
+                    lock.acquire()
+
+                # Initialize try-finally block
+                try:
+                    # Retry if another writer changed the stored key values meanwhile
+                    if self._key_values_by_id.get(item_id, ()) != key_values:
+                        continue
+
+                    # Break if item was removed meanwhile
+                    if item_id not in self._items_by_id:
+                        break
+
+                    # Remove the stored key values of item
+                    self._key_remove(item_id)
+
+                    # Remove item from collection
+                    del self._items_by_id[item_id]
+
+                    # Remove item from secondary indexes
+                    self._index_remove(item_id)
+
+                    # Increment count
+                    count += 1
+
+                    # Break
+                    break
+
+                # Release stripe locks
+                finally:
+                    for lock in reversed(locks):
+                        lock.release()
+
+        # Return count
+        return count
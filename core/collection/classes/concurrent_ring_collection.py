@@ -0,0 +1,254 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+import threading
+
+from typing import Any, Callable, Hashable, Iterator, TypeVar
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.collection.classes.ring_collection import RingCollection
+from core.collection.classes.ring_view import RingView
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TYPE VARIABLES
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+ItemBound = TypeVar("ItemBound", bound=Any)
+ReturnBound = TypeVar("ReturnBound")
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ CONCURRENT RING COLLECTION
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class ConcurrentRingCollection(RingCollection[ItemBound]):
+    """A thread-safe ring collection of a single writer and many lock-free readers"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ CLASS ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Define the optimistic reads attempted before a reader takes the write lock
+    RETRIES = 3
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ INSTANCE ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Declare type of write lock
+    _write_lock: threading.Lock
+
+    # Declare type of version, which is odd while a write is in progress
+    _version: int
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, size: int | None) -> None:
+        """Init Method"""
+
+        # Initialize ring collection
+        super().__init__(size)
+
+        # Initialize write lock
+        self._write_lock = threading.Lock()
+
+        # Initialize version
+        self._version = 0
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __GETITEM__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __getitem__(self, item: Any) -> Any:
+        """Get Item Method"""
+
+        # Check if item is an integer
+        if isinstance(item, int):
+            return self.get(item)
+
+        # Get a snapshot of ring, cursor and length
+        ring, cursor, length = self._snapshot()
+
+        # Return a view of the slice over the snapshot
+        return RingView(ring, cursor, length, range(length)[item])
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __GETSTATE__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Get State Method"""
+
+        # Get state while the writer is held off, copying the ring it mutates in place
+        with self._write_lock:
+            state = {**self.__dict__, "_ring": self._ring.copy()}
+
+        # Remove write lock, which cannot be pickled
+        del state["_write_lock"]
+
+        # Return state
+        return state
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __ITER__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __iter__(self) -> Iterator[ItemBound]:
+        """Iter Method"""
+
+        # Get a snapshot of ring, cursor and length
+        ring, cursor, length = self._snapshot()
+
+        # Get a view of the snapshot from oldest to newest
+        view: RingView[ItemBound | None] = RingView(ring, cursor, length, range(length))
+
+        # Return iterator of the items of the view
+        return (item for item in view if item is not None)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __REVERSED__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __reversed__(self) -> Iterator[ItemBound]:
+        """Reversed Method"""
+
+        # Get a snapshot of ring, cursor and length
+        ring, cursor, length = self._snapshot()
+
+        # Get a view of the snapshot from newest to oldest
+        view: RingView[ItemBound | None] = RingView(
+            ring, cursor, length, range(length - 1, -1, -1)
+        )
+
+        # Return iterator of the items of the view
+        return (item for item in view if item is not None)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __SETSTATE__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Set State Method"""
+
+        # Update state
+        self.__dict__.update(state)
+
+        # Initialize write lock
+        self._write_lock = threading.Lock()
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _READ
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _read(self, function: Callable[..., ReturnBound], *args: Any) -> ReturnBound:
+        """Calls a read that is retried if it overlaps a write"""
+
+        # Iterate over optimistic attempts
+        for _ in range(self.RETRIES):
+            # Get version
+            version = self._version
+
+            # Continue if a write is in progress
+            if version % 2:
+                continue
+
+            # Initialize try-except block
+            try:
+                # Get result
+                result = function(*args)
+
+            # Retry if a write resized the ring during the read
+            except IndexError:
+                continue
+
+            # Return result if no write overlapped the read
+            if self._version == version:
+                return result
+
+        # Return result under the write lock, so that readers cannot starve
+        with self._write_lock:
+            return function(*args)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _SNAPSHOT
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _snapshot(self) -> tuple[list[ItemBound | None], int, int]:
+        """Returns a consistent copy of the ring with its cursor and length"""
+
+        # Return snapshot
+        return self._read(lambda: (self._ring.copy(), self._cursor, self._length))
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ NEW
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def New(self, *args: Any, **kwargs: Any) -> ConcurrentRingCollection[ItemBound]:
+        """Returns a new collection"""
+
+        # Check if size not in kwargs
+        if "size" not in kwargs:
+            # Add size to kwargs
+            kwargs["size"] = self._size
+
+        # Return new collection
+        return ConcurrentRingCollection(*args, **kwargs)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ ADD
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def add(self, *items: ItemBound) -> int:
+        """Adds an item to the collection"""
+
+        # Hold the write lock and mark the write as in progress
+        with self._write_lock:
+            self._version += 1
+
+            # Initialize try-finally block
+            try:
+                # Add items
+                return super().add(*items)
+
+            # Mark the write as done
+            finally:
+                self._version += 1
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ GET
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def get(self, key: Hashable, default: ItemBound | None = None) -> ItemBound | None:
+        """Gets an item from the ring collection"""
+
+        # Return item
+        return self._read(super().get, key, default)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ UPDATE SIZE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def update_size(self, size: int | None) -> None:
+        """Updates the size of the collection"""
+
+        # Hold the write lock and mark the write as in progress
+        with self._write_lock:
+            self._version += 1
+
+            # Initialize try-finally block
+            try:
+                # Update size
+                super().update_size(size)
+
+            # Mark the write as done
+            finally:
+                self._version += 1
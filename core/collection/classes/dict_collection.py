@@ -4,15 +4,26 @@
 
 from __future__ import annotations
 
-from typing import Any, Hashable, Iterable, Iterator, TypeVar
+import itertools
+
+from array import array
+from typing import Any, Callable, Hashable, Iterable, Iterator, TypeVar
 
 # ┌─────────────────────────────────────────────────────────────────────────────────────
 # │ PROJECT IMPORTS
 # └─────────────────────────────────────────────────────────────────────────────────────
 
 from core.collection.classes.collection import Collection
-from core.collection.exceptions import DuplicateKeyError, NoSuchKeyError
+from core.collection.classes.collection_index import CollectionIndex
+from core.collection.classes.filter_condition import FilterCondition
+from core.collection.exceptions import (
+    DuplicateKeyError,
+    DuplicateKeysError,
+    NoSuchKeyError,
+)
+from core.collection.mixins.indexed_collection_mixin import IndexedCollectionMixin
 from core.object.functions.oget import oget
+from core.object.functions.ogetter import ogetter
 from core.object.functions.ohasattr import ohasattr
 from core.placeholders import nothing
 
@@ -28,7 +39,7 @@ ItemBound = TypeVar("ItemBound", bound=Any)
 # └─────────────────────────────────────────────────────────────────────────────────────
 
 
-class DictCollection(Collection[ItemBound]):
+class DictCollection(IndexedCollectionMixin, Collection[ItemBound]):
     """A dict-based collection utility class"""
 
     # ┌─────────────────────────────────────────────────────────────────────────────────
@@ -38,12 +49,18 @@ class DictCollection(Collection[ItemBound]):
     # Declare type of keys
     _keys: tuple[str | tuple[str, ...], ...]
 
+    # Declare type of compiled key getters
+    _key_getters: tuple[Callable[[Any], Any], ...]
+
     # Declare type of items by ID
     _items_by_id: dict[int, ItemBound]
 
     # Declare type of item IDs by key
     _item_ids_by_key: dict[Hashable, int]
 
+    # Declare type of the key values of each item, as stored when it was last keyed
+    _key_values_by_id: dict[int, tuple[Hashable, ...]]
+
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ CREATE KEY
     # └─────────────────────────────────────────────────────────────────────────────────
@@ -80,11 +97,105 @@ class DictCollection(Collection[ItemBound]):
         # Return key
         return oget(item, key)
 
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ CREATE KEY GETTER
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    @classmethod
+    def create_key_getter(
+        cls, key: str | tuple[str, ...]
+    ) -> Callable[[ItemBound], Any | tuple[Any, ...]]:
+        """Creates a compiled getter that behaves like create_key for a fixed key"""
+
+        # Initialize a local sentinel for missing values
+        missing = object()
+
+        # Check if key is a tuple
+        if isinstance(key, tuple):
+            # Get getters of each key, splitting their paths once
+            getters = tuple(ogetter(k, default=missing) for k in key)
+
+            # Define a tuple key getter
+            def getter_tuple(item: Any) -> Any:
+                """Gets a tuple of key values or nothing"""
+
+                # Get values
+                value = tuple(getter(item) for getter in getters)
+
+                # Return nothing if any value is missing
+                if any(v is missing for v in value):
+                    return nothing
+
+                # Return value
+                return value
+
+            # Return tuple key getter
+            return getter_tuple
+
+        # Check if key is not nested
+        if "." not in key:
+            # Define a single key getter
+            def getter_flat(item: Any) -> Any:
+                """Gets a key value or nothing"""
+
+                # Return value by key or attribute or nothing
+                if isinstance(item, dict):
+                    return item.get(key, nothing)
+                return getattr(item, key, nothing)
+
+            # Return single key getter
+            return getter_flat
+
+        # Get getter, splitting its path once
+        getter_single = ogetter(key, default=missing)
+
+        # Define a key getter
+        def getter(item: Any) -> Any:
+            """Gets a key value or nothing"""
+
+            # Get value
+            value = getter_single(item)
+
+            # Return nothing if value is missing
+            return nothing if value is missing else value
+
+        # Return key getter
+        return getter
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ FROM ITERABLE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    @classmethod
+    def from_iterable(
+        cls,
+        items: Iterable[ItemBound],
+        keys: Iterable[str | Iterable[str]] | str | None = None,
+        indexes: Iterable[str | CollectionIndex] | None = None,
+        **kwargs: Any,
+    ) -> DictCollection[ItemBound]:
+        """Returns a new collection bulk-loaded from an iterable of items"""
+
+        # Initialize collection, passing any further options of a subclass
+        collection: DictCollection[ItemBound] = cls(
+            keys=keys, indexes=indexes, **kwargs
+        )
+
+        # Add items to collection
+        collection.add_many(items)
+
+        # Return collection
+        return collection
+
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ __INIT__
     # └─────────────────────────────────────────────────────────────────────────────────
 
-    def __init__(self, keys: Iterable[str | Iterable[str]] | str | None = None) -> None:
+    def __init__(
+        self,
+        keys: Iterable[str | Iterable[str]] | str | None = None,
+        indexes: Iterable[str | CollectionIndex] | None = None,
+    ) -> None:
         """Init Method"""
 
         # Check if keys is a string
@@ -106,6 +217,15 @@ class DictCollection(Collection[ItemBound]):
         # Initialize item IDs by key
         self._item_ids_by_key = {}
 
+        # Initialize key values by item ID
+        self._key_values_by_id = {}
+
+        # Set key getters, compiling the path of each key once
+        self._key_getters = tuple(self.create_key_getter(key) for key in self._keys)
+
+        # Initialize secondary indexes, tracking positions given that keys serve filters
+        self._init_indexes(indexes, positions=True)
+
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ __GETITEM__
     # └─────────────────────────────────────────────────────────────────────────────────
@@ -120,6 +240,44 @@ class DictCollection(Collection[ItemBound]):
         # Get and return item
         return self._items_by_id[self._item_ids_by_key[key_value]]
 
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __GETSTATE__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Get State Method"""
+
+        # Get state
+        state = self.__dict__.copy()
+
+        # Get the positions of item IDs, by which they are pickled as IDs change
+        positions = dict(zip(self._items_by_id, itertools.count()))
+        position = positions.__getitem__
+
+        # Replace items by ID by items in collection order
+        state["_items_by_id"] = list(self._items_by_id.values())
+
+        # Replace item IDs by key by keys and positions, so that keys are not created
+        state["_item_ids_by_key"] = (
+            list(self._item_ids_by_key),
+            array("q", map(position, self._item_ids_by_key.values())),
+        )
+
+        # Replace key values by item ID by positions and key values
+        state["_key_values_by_id"] = (
+            array("q", map(position, self._key_values_by_id)),
+            list(self._key_values_by_id.values()),
+        )
+
+        # Remove key getters, which are closures that cannot be pickled
+        del state["_key_getters"]
+
+        # Update state of indexes and insertion positions
+        state.update(self._get_index_state(positions))
+
+        # Return state
+        return state
+
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ __ITER__
     # └─────────────────────────────────────────────────────────────────────────────────
@@ -152,6 +310,325 @@ class DictCollection(Collection[ItemBound]):
             # Yield item
             yield self._items_by_id[key]
 
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __SETSTATE__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Set State Method"""
+
+        # Pop items, keys and key values
+        items = state.pop("_items_by_id")
+        keys, key_positions = state.pop("_item_ids_by_key")
+        key_value_positions, key_values = state.pop("_key_values_by_id")
+
+        # Update state
+        self.__dict__.update(state)
+
+        # Get the IDs of unpickled items by position
+        item_ids = list(map(self._item_id, items))
+        item_id = item_ids.__getitem__
+
+        # Set items by ID, item IDs by key and key values by item ID
+        self._items_by_id = dict(zip(item_ids, items))
+        self._item_ids_by_key = dict(zip(keys, map(item_id, key_positions)))
+        self._key_values_by_id = dict(
+            zip(map(item_id, key_value_positions), key_values)
+        )
+
+        # Set key getters
+        self._key_getters = tuple(self.create_key_getter(key) for key in self._keys)
+
+        # Set indexes and insertion positions
+        self._set_index_state(item_ids)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __AND__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __and__(self, other: Any) -> DictCollection[ItemBound]:
+        """And Method"""
+
+        # Return generic intersection if other does not share the key definition
+        if not self._is_compatible(other):
+            return super().__and__(other)
+
+        # Return copy of the items that are in other collection
+        return self._copy(self._find_ids(other))
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __OR__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __or__(self, other: Any) -> DictCollection[ItemBound]:
+        """Or Method"""
+
+        # Return generic union if other does not share the key definition
+        if not self._is_compatible(other):
+            return super().__or__(other)
+
+        # Make a shallow copy of the collection
+        collection = self._copy()
+
+        # Get the IDs of the items of other collection that are already in collection
+        item_ids_found = other._find_ids(self)
+
+        # Iterate over the items of other collection
+        for item_id, item in other._items_by_id.items():
+            # Continue if item already in collection
+            if item_id in item_ids_found:
+                continue
+
+            # Add item to collection
+            collection._items_by_id[item_id] = item
+
+            # Add item to secondary indexes
+            collection._index_add(item_id, item)
+
+        # Iterate over the item IDs by key of other collection
+        for key_value, item_id in other._item_ids_by_key.items():
+            # Continue if item already in collection
+            if item_id in item_ids_found:
+                continue
+
+            # Raise DuplicateKeyError if key value is already in collection
+            if key_value in collection._item_ids_by_key:
+                raise DuplicateKeyError(key_value)
+
+            # Add key value to item IDs by key
+            collection._item_ids_by_key[key_value] = item_id
+
+            # Add key value to key values by item ID
+            collection._key_values_by_id[item_id] = collection._key_values_by_id.get(
+                item_id, ()
+            ) + (key_value,)
+
+        # Return collection
+        return collection
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _COPY
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _copy(self, item_ids: Iterable[int] | None = None) -> DictCollection[ItemBound]:
+        """Returns a shallow copy of all items, or of items by ID, without rekeying"""
+
+        # Initialize collection without secondary indexes, which are copied instead
+        collection = self.New(indexes=())
+
+        # Check if all items are copied
+        if item_ids is None:
+            # Copy items by ID, item IDs by key and key values by item ID
+            collection._items_by_id = dict(self._items_by_id)
+            collection._item_ids_by_key = dict(self._item_ids_by_key)
+            collection._key_values_by_id = dict(self._key_values_by_id)
+
+        # Otherwise copy items by ID
+        else:
+            # Get the IDs of the items to copy
+            item_ids = item_ids if isinstance(item_ids, (set, dict)) else set(item_ids)
+
+            # Copy items by ID in collection order
+            collection._items_by_id = {
+                item_id: item
+                for item_id, item in self._items_by_id.items()
+                if item_id in item_ids
+            }
+
+            # Copy item IDs by key of the copied items
+            collection._item_ids_by_key = {
+                key_value: item_id
+                for key_value, item_id in self._item_ids_by_key.items()
+                if item_id in item_ids
+            }
+
+            # Copy key values by item ID of the copied items
+            collection._key_values_by_id = {
+                item_id: key_values
+                for item_id, key_values in self._key_values_by_id.items()
+                if item_id in item_ids
+            }
+
+        # Copy secondary indexes
+        collection._copy_indexes(self, collection._items_by_id)
+
+        # Return collection
+        return collection
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _FIND IDS
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _find_ids(self, other: DictCollection[Any]) -> set[int]:
+        """Returns the IDs of the items that are found in another collection"""
+
+        # Get items by ID and the item IDs by key of other collection
+        items_by_id, item_ids_by_key = self._items_by_id, other._item_ids_by_key
+
+        # Get the IDs of the items that are in both collections
+        item_ids = set(items_by_id.keys() & other._items_by_id.keys())
+
+        # Iterate over the stored key values of the items
+        for key_value, item_id in self._item_ids_by_key.items():
+            # Add item ID if key value is in other collection, as find would
+            if (
+                item_id not in item_ids
+                and key_value in item_ids_by_key
+                and (
+                    hasattr(items_by_id[item_id], "__dict__")
+                    or hasattr(items_by_id[item_id], "__slots__")
+                )
+            ):
+                item_ids.add(item_id)
+
+        # Check if other collection has keys
+        if item_ids_by_key:
+            # Iterate over items
+            for item_id, item in items_by_id.items():
+                # Initialize try-except block
+                try:
+                    # Add item ID if item is itself a key of other collection
+                    if item in item_ids_by_key:
+                        item_ids.add(item_id)
+
+                # Continue if item is not hashable
+                except TypeError:
+                    continue
+
+        # Return item IDs
+        return item_ids
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _GET KEY LOOKUP
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _get_key_lookup(self, path: str) -> Callable[[Any], ItemBound | None] | None:
+        """Returns a getter of the only item by a value of a path, if a key serves it"""
+
+        # Get key of path
+        key = path.replace("__", ".")
+
+        # Return None if path is not a key
+        if key not in self._keys:
+            return None
+
+        # Get key getter, and whether other keys share the namespace of key values
+        key_getter = self._key_getters[self._keys.index(key)]
+        shared = len(self._keys) > 1
+
+        # Get items by ID and item IDs by key
+        items_by_id, item_ids_by_key = self._items_by_id, self._item_ids_by_key
+
+        # Define lookup
+        def lookup(value: Any) -> ItemBound | None:
+            """Returns the item whose key value is value or None"""
+
+            # Get item ID
+            item_id = item_ids_by_key.get(value)
+
+            # Return None if value is not a key value
+            if item_id is None:
+                return None
+
+            # Get item
+            item = items_by_id[item_id]
+
+            # Return item unless the value is that of another key
+            return item if not shared or key_getter(item) == value else None
+
+        # Return lookup
+        return lookup
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _IS COMPATIBLE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _is_compatible(self, other: Any) -> bool:
+        """Returns whether another collection shares the same keys and item IDs"""
+
+        # Return whether other is a dict collection of the same keys and item IDs
+        return (
+            isinstance(other, DictCollection)
+            and other._keys == self._keys
+            and type(other)._item_id is type(self)._item_id
+        )
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _ITEM ID
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _item_id(self, item: Any) -> int:
+        """Returns the ID by which an item is stored"""
+
+        # Return object ID
+        return id(item)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _KEY REMOVE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _key_remove(self, item_id: int) -> None:
+        """Removes the stored key values of an item from item IDs by key"""
+
+        # Iterate over the stored key values of item
+        for key_value in self._key_values_by_id.pop(item_id, ()):
+            # Remove key value from item IDs by key if it belongs to item
+            if self._item_ids_by_key.get(key_value) == item_id:
+                del self._item_ids_by_key[key_value]
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _LOOKUP CONDITION
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _lookup_condition(self, condition: FilterCondition) -> dict[int, Any] | None:
+        """Returns items by ID that meet a condition without an index or None"""
+
+        # Return None if condition cannot be served by a unique key
+        if (
+            condition.operator not in ("__eq", "__in")
+            or condition.path.replace("__", ".") not in self._keys
+        ):
+            return None
+
+        # Get expected key values
+        key_values = (
+            (condition.expected,)
+            if condition.operator == "__eq"
+            else condition.expected
+        )
+
+        # Return None if expected key values are not discrete
+        if not isinstance(key_values, (list, tuple, set, frozenset)):
+            return None
+
+        # Initialize items
+        items = {}
+
+        # Iterate over key values
+        for key_value in key_values:
+            # Initialize try-except block
+            try:
+                # Get item ID
+                item_id = self._item_ids_by_key.get(key_value)
+
+            # Return None on unhashable key values
+            except TypeError:
+                return None
+
+            # Continue if key value is not in collection
+            if item_id is None:
+                continue
+
+            # Get item
+            item = self._items_by_id[item_id]
+
+            # Add item if condition is met, given that keys share a single namespace
+            if condition(item):
+                items[item_id] = item
+
+        # Return items
+        return items
+
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ NEW
     # └─────────────────────────────────────────────────────────────────────────────────
@@ -164,6 +641,11 @@ class DictCollection(Collection[ItemBound]):
             # Add keys to kwargs
             kwargs["keys"] = self._keys
 
+        # Check if indexes not in kwargs
+        if "indexes" not in kwargs:
+            # Add new empty indexes of the same paths to kwargs
+            kwargs["indexes"] = tuple(index.New() for index in self._indexes)
+
         # Return new collection
         return DictCollection(*args, **kwargs)
 
@@ -194,7 +676,7 @@ class DictCollection(Collection[ItemBound]):
                 continue
 
             # Get item ID
-            item_id = id(item)
+            item_id = self._item_id(item)
 
             # Continue if item is already in collection
             if item_id in self._items_by_id:
@@ -203,10 +685,10 @@ class DictCollection(Collection[ItemBound]):
             # Initialize item IDs by key
             item_ids_by_key = {}
 
-            # Iterate over keys
-            for key in self._keys:
+            # Iterate over key getters
+            for getter in self._key_getters:
                 # Get key value
-                key_value = self.create_key(item, key)
+                key_value = getter(item)
 
                 # Continue if key value is nothing
                 if key_value is nothing:
@@ -227,15 +709,123 @@ class DictCollection(Collection[ItemBound]):
             # Update item IDs by key
             self._item_ids_by_key.update(item_ids_by_key)
 
+            # Store key values so that they can be updated or removed after a mutation
+            if item_ids_by_key:
+                self._key_values_by_id[item_id] = tuple(item_ids_by_key)
+
             # Add item to collection
             self._items_by_id[item_id] = item
 
+            # Add item to secondary indexes
+            self._index_add(item_id, item)
+
             # Increment count
             count += 1
 
         # Return count
         return count
 
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ ADD MANY
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def add_many(self, items: Iterable[ItemBound]) -> int:
+        """Adds an iterable of items atomically, reporting all duplicate keys at once"""
+
+        # Get key getters and item IDs by key
+        key_getters, item_ids_by_key = self._key_getters, self._item_ids_by_key
+
+        # Initialize new items by ID and new item IDs by key
+        items_by_id_new: dict[int, ItemBound] = {}
+        item_ids_by_key_new: dict[Hashable, int] = {}
+
+        # Initialize duplicate key values
+        duplicates: list[Any] = []
+
+        # Iterate over items in a single pass, which allows generators
+        for item in items:
+            # Continue if item is None
+            if item is None:
+                continue
+
+            # Get item ID
+            item_id = self._item_id(item)
+
+            # Continue if item is already in collection or batch
+            if item_id in self._items_by_id or item_id in items_by_id_new:
+                continue
+
+            # Iterate over key getters
+            for getter in key_getters:
+                # Get key value
+                key_value = getter(item)
+
+                # Continue if key value is nothing
+                if key_value is nothing:
+                    continue
+
+                # Append duplicate if key value is already in collection, or belongs to
+                # another item of batch rather than to another key of this item
+                if (
+                    key_value in item_ids_by_key
+                    or item_ids_by_key_new.get(key_value, item_id) != item_id
+                ):
+                    duplicates.append(key_value)
+
+                # Otherwise add key value to new item IDs by key if not None
+                elif key_value is not None:
+                    item_ids_by_key_new[key_value] = item_id
+
+            # Add item to new items by ID
+            items_by_id_new[item_id] = item
+
+        # Raise DuplicateKeysError, leaving the collection untouched
+        if duplicates:
+            raise DuplicateKeysError(duplicates)
+
+        # Update items by ID and item IDs by key
+        self._items_by_id.update(items_by_id_new)
+        item_ids_by_key.update(item_ids_by_key_new)
+
+        # Get key values by item ID
+        key_values_by_id = self._key_values_by_id
+
+        # Iterate over new item IDs by key
+        for key_value, item_id in item_ids_by_key_new.items():
+            # Store key value so that it can be updated or removed after a mutation
+            key_values_by_id[item_id] = key_values_by_id.get(item_id, ()) + (key_value,)
+
+        # Add items to secondary indexes
+        self._index_add_many(items_by_id_new)
+
+        # Return count
+        return len(items_by_id_new)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ COPY SHALLOW
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def copy_shallow(  # type: ignore[override]
+        self, exclude: Collection[Any] | None = None
+    ) -> DictCollection[ItemBound]:
+        """Returns a shallow copy of the collection"""
+
+        # Return copy of all items if nothing is excluded
+        if exclude is None:
+            return self._copy()
+
+        # Return generic copy if excluded collection does not share the key definition
+        if not self._is_compatible(exclude):
+            return super().copy_shallow(exclude)  # type: ignore
+
+        # Get the IDs of the items that are in the excluded collection
+        item_ids_found = self._find_ids(exclude)  # type: ignore
+
+        # Return copy of the items that are not in the excluded collection
+        return self._copy(
+            [item_id for item_id in self._items_by_id if item_id not in item_ids_found]
+        )
+
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ FIND
     # └─────────────────────────────────────────────────────────────────────────────────
@@ -244,19 +834,19 @@ class DictCollection(Collection[ItemBound]):
         """Finds an item in the collection"""
 
         # Return if item is in items by ID
-        if id(item) in self._items_by_id:
+        if self._item_id(item) in self._items_by_id:
             return item
 
         # Return if item is in item IDs by key
         if isinstance(item, Hashable) and item in self._item_ids_by_key:
             return self._items_by_id[self._item_ids_by_key[item]]
 
-        # Check if item has a __dict__ attribute
-        if hasattr(item, "__dict__"):
-            # Iterate over keys
-            for key in self._keys:
+        # Check if item has attributes, held in a __dict__ or in slots
+        if hasattr(item, "__dict__") or hasattr(item, "__slots__"):
+            # Iterate over key getters
+            for getter in self._key_getters:
                 # Get value
-                value = self.create_key(item, key)
+                value = getter(item)
 
                 # Continue if value is nothing
                 if value is nothing:
@@ -289,6 +879,79 @@ class DictCollection(Collection[ItemBound]):
         # Return resolved default
         return default_resolved
 
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ REINDEX
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def reindex(self, *items: Any | ItemBound) -> int:
+        """Updates the entries of mutated items and returns how many changed"""
+
+        # Initialize count
+        count = 0
+
+        # Iterate over items
+        for item in items:
+            # Get item ID
+            item_id = self._item_id(item)
+
+            # Continue if item is not in collection
+            if item_id not in self._items_by_id:
+                continue
+
+            # Initialize current key values
+            key_values_current: list[Hashable] = []
+
+            # Iterate over key getters
+            for getter in self._key_getters:
+                # Get key value
+                key_value = getter(item)
+
+                # Append key value, skipping missing and None as add does
+                if (
+                    key_value is not nothing
+                    and key_value is not None
+                    and key_value not in key_values_current
+                ):
+                    key_values_current.append(key_value)
+
+            # Get current key values as a tuple
+            key_values = tuple(key_values_current)
+
+            # Get whether key values have changed
+            changed = key_values != self._key_values_by_id.get(item_id, ())
+
+            # Check if key values have changed
+            if changed:
+                # Iterate over key values
+                for key_value in key_values:
+                    # Get the ID of the item that has key value
+                    item_id_keyed = self._item_ids_by_key.get(key_value, item_id)
+
+                    # Raise DuplicateKeyError if key value belongs to another item
+                    if item_id_keyed != item_id:
+                        raise DuplicateKeyError(key_value)
+
+                # Remove the stored key values of item
+                self._key_remove(item_id)
+
+                # Iterate over key values
+                for key_value in key_values:
+                    # Add key value to item IDs by key
+                    self._item_ids_by_key[key_value] = item_id
+
+                # Store key values
+                if key_values:
+                    self._key_values_by_id[item_id] = key_values
+
+            # Update item in secondary indexes
+            changed = self._index_update(item_id, item) or changed
+
+            # Increment count if any entry changed
+            count += changed
+
+        # Return count
+        return count
+
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ REMOVE
     # └─────────────────────────────────────────────────────────────────────────────────
@@ -309,31 +972,21 @@ class DictCollection(Collection[ItemBound]):
                 continue
 
             # Get item ID
-            item_id = id(item)
+            item_id = self._item_id(item)
 
             # Continue if item is not in collection
             if item_id not in self._items_by_id:
                 continue
 
-            # Iterate over keys
-            for key in self._keys:
-                # Get key value
-                key_value = self.create_key(item, key)
-
-                # Continue if key value is nothing
-                if key_value is nothing:
-                    continue
-
-                # Check if key value is not in item IDs by key
-                if key_value not in self._item_ids_by_key:
-                    continue
-
-                # Remove key value from item IDs by key
-                del self._item_ids_by_key[key_value]
+            # Remove the stored key values of item, which hold even after a mutation
+            self._key_remove(item_id)
 
             # Remove item from collection
             del self._items_by_id[item_id]
 
+            # Remove item from secondary indexes
+            self._index_remove(item_id)
+
             # Increment count
             count += 1
 
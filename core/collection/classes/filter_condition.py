@@ -0,0 +1,144 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+from typing import Any, Callable
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.collection.functions.filter_conditions import (
+    CHECKERS,
+    CHECKERS_CASE_SENSITIVE,
+    FilterChecker,
+)
+from core.object.functions.ogetter import ogetter
+from core.object.functions.olower import olower
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ FILTER CONDITION
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class FilterCondition:
+    """A compiled filter condition that checks a single path of an item"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ INSTANCE ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Declare type of path
+    path: str
+
+    # Declare type of operator
+    operator: str
+
+    # Declare type of value
+    value: Any
+
+    # Declare type of expected value
+    expected: Any
+
+    # Declare type of getter
+    getter: Callable[[Any], Any]
+
+    # Declare type of accessor
+    accessor: Callable[[Any], Any]
+
+    # Declare type of checker
+    checker: FilterChecker
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(
+        self,
+        path: str,
+        operator: str,
+        value: Any,
+        getter: Callable[[Any], Any] | None = None,
+    ) -> None:
+        """Init Method"""
+
+        # Set path
+        self.path = path
+
+        # Set operator
+        self.operator = operator
+
+        # Set value
+        self.value = value
+
+        # Set getter, i.e. the raw value of the path of an item
+        self.getter = getter or ogetter(path, delimiter="__")
+
+        # Get case-sensitive checker if operator is case-insensitive
+        checker = CHECKERS_CASE_SENSITIVE.get(operator)
+
+        # Check if operator is case-insensitive
+        if checker is not None:
+            # Lowercase the expected value once rather than once per item
+            value = olower(value)
+
+            # Get getter
+            getter = self.getter
+
+            # Set accessor that lowercases actual values
+            self.accessor = lambda item: olower(getter(item))
+
+            # Set case-sensitive checker
+            self.checker = checker
+
+        # Otherwise handle case-sensitive operator
+        else:
+            # Set accessor and checker
+            self.accessor = self.getter
+            self.checker = CHECKERS[operator]
+
+        # Check if operator is a membership operator of a hashable sequence
+        if operator in ("__in", "__iin") and isinstance(value, (list, tuple, set)):
+            # Initialize try-except block
+            try:
+                # Convert to a frozenset for constant time membership checks
+                value = frozenset(value)
+
+            # Handle TypeError of unhashable values
+            except TypeError:
+                pass
+
+        # Set expected value
+        self.expected = value
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __CALL__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __call__(self, item: Any) -> bool:
+        """Call Method"""
+
+        # Initialize try-except block
+        try:
+            # Get value
+            value_actual = self.accessor(item)
+
+        # Return False on KeyError
+        except KeyError:
+            return False
+
+        # Return whether condition is met
+        return self.checker(value_actual, self.expected) is not False
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __REPR__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __repr__(self) -> str:
+        """Representation Method"""
+
+        # Return representation
+        return f"<{self.__class__.__name__}: {self.path}{self.operator}={self.value!r}>"
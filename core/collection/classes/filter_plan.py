@@ -0,0 +1,251 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+from functools import lru_cache
+from itertools import chain, compress, islice
+from operator import and_
+from time import perf_counter_ns
+from typing import TYPE_CHECKING, Any, Callable, Generator, Iterable, Iterator, TypeVar
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.collection.classes.filter_condition import FilterCondition
+from core.collection.functions.filter_conditions import get_filter_key
+from core.object.functions.ogetter import ogetter
+
+if TYPE_CHECKING:
+    from core.collection.classes.filter_statistics import FilterStatistics
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TYPE VARIABLES
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+ItemBound = TypeVar("ItemBound", bound=Any)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ FILTER PLAN
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class FilterPlan:
+    """A compiled plan of filter conditions that are checked in order"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ INSTANCE ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Declare type of conditions
+    conditions: tuple[FilterCondition, ...]
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, conditions: Iterable[FilterCondition]) -> None:
+        """Init Method"""
+
+        # Set conditions
+        self.conditions = tuple(conditions)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __CALL__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __call__(self, item: Any) -> bool:
+        """Call Method"""
+
+        # Return whether all conditions are met
+        return all(condition(item) for condition in self.conditions)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __LEN__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __len__(self) -> int:
+        """Length Method"""
+
+        # Return condition count
+        return len(self.conditions)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __REPR__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __repr__(self) -> str:
+        """Representation Method"""
+
+        # Return representation
+        return f"<{self.__class__.__name__}: {list(self.conditions)!r}>"
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _PROFILE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _profile(
+        self, items: Iterator[ItemBound], statistics: FilterStatistics
+    ) -> Generator[ItemBound, None, None]:
+        """Yields the items that meet all conditions, measured on samples in between
+
+        Every condition is checked on a sample before each interval of items, so that
+        statistics reflect its own selectivity and cost throughout the items, and the
+        interval is checked in the order of least expected work. An item whose
+        reordered check raises is checked again in the given order, so that errors
+        surface as they would without reordering.
+        """
+
+        # Iterate over samples of items
+        while sample := list(islice(items, statistics.SAMPLE)):
+            # Initialize whether each sample item meets all conditions
+            met = [True] * len(sample)
+
+            # Initialize try-except block
+            try:
+                # Iterate over conditions
+                for condition in self.conditions:
+                    # Check condition on sample, measuring the time taken
+                    start = perf_counter_ns()
+                    results = list(map(condition, sample))
+                    nanoseconds = perf_counter_ns() - start
+
+                    # Record checks, passes and time taken
+                    statistics.record(condition, len(sample), sum(results), nanoseconds)
+
+                    # Combine results
+                    met = list(map(and_, met, results))
+
+            # Check items in the given order if a condition raises on the sample
+            except Exception:
+                yield from self._scan(chain(sample, items), self.conditions)
+                return
+
+            # Yield sample items that meet all conditions
+            yield from compress(sample, met)
+
+            # Yield the items of the interval, checked in order of least expected work
+            yield from self._scan(
+                islice(items, statistics.INTERVAL),
+                statistics.order(self.conditions),
+                fallback=self,
+            )
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _SCAN
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _scan(
+        self,
+        items: Iterable[ItemBound],
+        conditions: tuple[FilterCondition, ...],
+        fallback: Callable[[ItemBound], bool] | None = None,
+    ) -> Generator[ItemBound, None, None]:
+        """Yields the items that meet all conditions, checked in the given order
+
+        If a check raises other than KeyError, the fallback decides whether an item is
+        met, and the error is raised if there is no fallback.
+        """
+
+        # Get accessor, checker and expected value of each condition
+        steps = tuple(
+            (condition.accessor, condition.checker, condition.expected)
+            for condition in conditions
+        )
+
+        # Iterate over items
+        for item in items:
+            # Initialize try-except block
+            try:
+                # Iterate over steps
+                for accessor, checker, expected in steps:
+                    # Initialize try-except block
+                    try:
+                        # Get value
+                        value_actual = accessor(item)
+
+                    # Break on KeyError
+                    except KeyError:
+                        break
+
+                    # Break if condition not met
+                    if checker(value_actual, expected) is False:
+                        break
+
+                # Otherwise, yield item
+                else:
+                    yield item
+
+            # Handle other errors
+            except Exception:
+                # Re-raise if there is no fallback
+                if fallback is None:
+                    raise
+
+                # Yield item if it meets fallback
+                if fallback(item):
+                    yield item
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ COMPILE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def compile(
+        keys: tuple[str, ...]
+    ) -> tuple[tuple[str, str, Callable[[Any], Any]], ...]:
+        """Returns a cached path, operator and getter tuple for each filter key"""
+
+        # Initialize templates
+        templates = []
+
+        # Iterate over keys
+        for key in keys:
+            # Get path and operator
+            path, operator, _ = get_filter_key(key)
+
+            # Append template
+            templates.append((path, operator, ogetter(path, delimiter="__")))
+
+        # Return templates
+        return tuple(templates)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ FILTER
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def filter(
+        self, items: Iterable[ItemBound], statistics: FilterStatistics | None = None
+    ) -> Generator[ItemBound, None, None]:
+        """Yields the items that meet all conditions of the plan
+
+        With statistics, conditions are reordered by their selectivity and cost.
+        """
+
+        # Check items in the given order if there are no statistics or one condition
+        if statistics is None or len(self.conditions) < 2:
+            return self._scan(items, self.conditions)
+
+        # Return items checked in order of least expected work
+        return self._profile(iter(items), statistics)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ FROM KWARGS
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    @classmethod
+    def from_kwargs(cls, kwargs: dict[str, Any]) -> FilterPlan:
+        """Returns a filter plan from filter keyword arguments"""
+
+        # Get cached templates by kwargs shape
+        templates = cls.compile(tuple(kwargs))
+
+        # Return filter plan
+        return cls(
+            FilterCondition(path, operator, value, getter=getter)
+            for (path, operator, getter), value in zip(templates, kwargs.values())
+        )
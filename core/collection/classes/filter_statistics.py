@@ -0,0 +1,151 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+from typing import Iterable
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.collection.classes.filter_condition import FilterCondition
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ FILTER STATISTICS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class FilterStatistics:
+    """Selectivity and cost statistics of filter conditions by path and operator
+
+    Conditions are ordered by cost / (1 - selectivity), which minimizes the expected
+    work of checking independent conditions until the first one fails.
+    """
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ CLASS ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Define the number of items on which every condition of a filter is measured
+    SAMPLE = 64
+
+    # Define the number of items that are filtered in a fixed order between samples
+    INTERVAL = 16384
+
+    # Define the number of checks after which statistics are halved, so they adapt
+    DECAY = 1 << 16
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ INSTANCE ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Declare type of checks, passes and nanoseconds by path and operator
+    _counts: dict[tuple[str, str], list[int]]
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self) -> None:
+        """Init Method"""
+
+        # Initialize counts
+        self._counts = {}
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __REPR__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __repr__(self) -> str:
+        """Representation Method"""
+
+        # Return representation
+        return f"<{self.__class__.__name__}: {len(self._counts)} conditions>"
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ COST
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def cost(self, condition: FilterCondition) -> float | None:
+        """Returns the mean nanoseconds of a check of a condition, or None if unknown"""
+
+        # Get counts
+        counts = self._counts.get((condition.path, condition.operator))
+
+        # Return mean nanoseconds if condition was checked
+        return counts[2] / counts[0] if counts and counts[0] else None
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ ORDER
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def order(
+        self, conditions: Iterable[FilterCondition]
+    ) -> tuple[FilterCondition, ...]:
+        """Returns conditions in order of expected work, keeping the given order on ties
+
+        Conditions without statistics come first, so that they are measured.
+        """
+
+        # Return conditions sorted by rank
+        return tuple(sorted(conditions, key=self.rank))
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ RANK
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def rank(self, condition: FilterCondition) -> float:
+        """Returns the expected nanoseconds spent per item that a condition rejects"""
+
+        # Get cost
+        cost = self.cost(condition)
+
+        # Return 0 if condition was not checked
+        if cost is None:
+            return 0.0
+
+        # Return cost per rejection
+        return cost / (1 - self.selectivity(condition))
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ RECORD
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def record(
+        self, condition: FilterCondition, checked: int, passed: int, nanoseconds: int
+    ) -> None:
+        """Records the number of items checked by a condition, passed and time taken"""
+
+        # Get counts
+        counts = self._counts.setdefault(
+            (condition.path, condition.operator), [0, 0, 0]
+        )
+
+        # Add to counts
+        counts[0] += checked
+        counts[1] += passed
+        counts[2] += nanoseconds
+
+        # Halve counts once there are enough, so that recent checks weigh more
+        if counts[0] > self.DECAY:
+            counts[:] = [count // 2 for count in counts]
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ SELECTIVITY
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def selectivity(self, condition: FilterCondition) -> float:
+        """Returns the estimated share of items that meet a condition
+
+        The share is smoothed by one pass and one failure, so that it is never 0 or 1.
+        """
+
+        # Get checks and passes
+        checked, passed, _ = self._counts.get(
+            (condition.path, condition.operator), (0, 0, 0)
+        )
+
+        # Return smoothed share of passes
+        return (passed + 1) / (checked + 2)
@@ -0,0 +1,299 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable, Generic, Hashable, Iterable, TypeVar
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.dict.functions.dset import dset
+from core.object.classes.aggregator import Aggregator, get_reducer
+from core.object.functions.ogetter import ogetter
+
+if TYPE_CHECKING:
+    from core.collection.classes.collection import Collection
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TYPE VARIABLES
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+ItemBound = TypeVar("ItemBound", bound=Any)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GROUP BY
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class GroupBy(Generic[ItemBound]):
+    """A grouped view of collection items by the values of one or more paths"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ INSTANCE ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Declare type of collection
+    collection: Collection[ItemBound]
+
+    # Declare type of paths
+    paths: tuple[str, ...]
+
+    # Declare type of group key getter
+    key: Callable[[Any], Hashable]
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, collection: Collection[ItemBound], *paths: str) -> None:
+        """Init Method"""
+
+        # Raise ValueError if there are no paths
+        if not paths:
+            raise ValueError("At least one path is required to group by")
+
+        # Set collection
+        self.collection = collection
+
+        # Set paths, normalized to the dot delimiter of aggregate schemas
+        self.paths = tuple(path.replace("__", ".") for path in paths)
+
+        # Get getters, where items without a path are grouped under None
+        getters = tuple(ogetter(path, default=None) for path in self.paths)
+
+        # Set group key getter, i.e. a value for one path or a tuple for several
+        self.key = (
+            getters[0]
+            if len(getters) == 1
+            else lambda item: tuple(getter(item) for getter in getters)
+        )
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __REPR__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __repr__(self) -> str:
+        """Representation Method"""
+
+        # Return representation
+        return (
+            f"<{self.__class__.__name__}: {self.collection.__class__.__name__} "
+            f"by {', '.join(self.paths)}>"
+        )
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ AGG
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def agg(
+        self,
+        agg_schema: dict[str, Iterable[str]],
+        reducers: dict[str, Any] | None = None,
+        InstanceClass: type[Any] | None = None,
+    ) -> dict[Hashable, Any]:
+        """Returns aggregate instance kwargs, or instances of a class, by group"""
+
+        # Initialize aggregator, compiling the aggregate schema once for all groups
+        aggregator = Aggregator(agg_schema, reducers=reducers)
+
+        # Initialize aggregators by group key
+        aggregators: dict[Hashable, Aggregator] = {}
+
+        # Get group key getter
+        key = self.key
+
+        # Iterate over items in a single pass
+        for item in self.collection:
+            # Get group key
+            group = key(item)
+
+            # Get aggregator of group
+            group_aggregator = aggregators.get(group)
+
+            # Check if group is new
+            if group_aggregator is None:
+                # Initialize aggregator of group
+                group_aggregator = aggregators[group] = aggregator.New()
+
+            # Add item to aggregator of group
+            group_aggregator.add(item)
+
+        # Initialize results
+        results: dict[Hashable, Any] = {}
+
+        # Iterate over aggregators by group key
+        for group, group_aggregator in aggregators.items():
+            # Initialize instance kwargs
+            kwargs: dict[str, Any] = {}
+
+            # Iterate over group paths and values
+            for path, value in zip(
+                self.paths, (group,) if len(self.paths) == 1 else group  # type: ignore
+            ):
+                # Add group value to instance kwargs
+                dset(kwargs, path, value, insert=True)
+
+            # Add aggregate values to instance kwargs
+            group_aggregator.result(kwargs)
+
+            # Set result
+            results[group] = (
+                kwargs if InstanceClass is None else InstanceClass(**kwargs)
+            )
+
+        # Return results
+        return results
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ COLLECTIONS
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def collections(self) -> dict[Hashable, Collection[ItemBound]]:
+        """Returns a new collection of items by group, materializing every group"""
+
+        # Initialize collections by group key
+        collections: dict[Hashable, Collection[ItemBound]] = {}
+
+        # Get group key getter
+        key = self.key
+
+        # Iterate over items
+        for item in self.collection:
+            # Get group key
+            group = key(item)
+
+            # Check if group is new
+            if group not in collections:
+                # Initialize collection of group
+                collections[group] = self.collection.New()
+
+            # Add item to collection of group
+            collections[group].add(item)
+
+        # Return collections
+        return collections
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ COUNT
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def count(self) -> dict[Hashable, int]:
+        """Returns the number of items by group"""
+
+        # Return item counts
+        return self.reduce("count")
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ FIRST
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def first(self, path: str) -> dict[Hashable, Any]:
+        """Returns the first non-None value of a path by group"""
+
+        # Return first values
+        return self.reduce("first", path)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ KEYS
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def keys(self) -> list[Hashable]:
+        """Returns the distinct group keys in order of appearance"""
+
+        # Return group keys
+        return list(dict.fromkeys(map(self.key, self.collection)))
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ LAST
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def last(self, path: str) -> dict[Hashable, Any]:
+        """Returns the last non-None value of a path by group"""
+
+        # Return last values
+        return self.reduce("last", path)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ MAX
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def max(self, path: str) -> dict[Hashable, Any]:
+        """Returns the greatest value of a path by group"""
+
+        # Return greatest values
+        return self.reduce("max", path)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ MEAN
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def mean(self, path: str) -> dict[Hashable, Any]:
+        """Returns the mean value of a path by group"""
+
+        # Return mean values
+        return self.reduce("mean", path)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ MIN
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def min(self, path: str) -> dict[Hashable, Any]:
+        """Returns the least value of a path by group"""
+
+        # Return least values
+        return self.reduce("min", path)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ REDUCE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def reduce(
+        self,
+        key: str,
+        path: str | None = None,
+        reducers: dict[str, Any] | None = None,
+    ) -> dict[Hashable, Any]:
+        """Returns the aggregate of a path, or of the items if no path, by group"""
+
+        # Get reducer
+        initial, step, final = get_reducer(key, reducers)
+
+        # Get value getter
+        getter = ogetter(path.replace("__", "."), default=None) if path else None
+
+        # Get group key getter
+        group_key = self.key
+
+        # Initialize states by group key
+        states: dict[Hashable, Any] = {}
+
+        # Iterate over items in a single pass
+        for item in self.collection:
+            # Get group key
+            group = group_key(item)
+
+            # Get state of group, initializing it if new
+            state = states[group] if group in states else initial()
+
+            # Get value
+            value = item if getter is None else getter(item)
+
+            # Set state, stepping it if value is not None
+            states[group] = state if value is None else step(state, value)
+
+        # Return aggregate values by group key
+        return {group: final(state) for group, state in states.items()}
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ SUM
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def sum(self, path: str) -> dict[Hashable, Any]:
+        """Returns the sum of the values of a path by group"""
+
+        # Return sums
+        return self.reduce("sum", path)
@@ -0,0 +1,297 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+from typing import Any, Hashable, Iterable
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.collection.classes.collection_index import CollectionIndex
+from core.collection.classes.filter_condition import FilterCondition
+from core.object.functions.olower import olower
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ HASH INDEX
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class HashIndex(CollectionIndex):
+    """A non-unique secondary index of collection items by a hashable path value"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ CLASS ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Define filter operators that can be served by the index
+    OPERATORS = frozenset(("__eq", "__in", "__ieq", "__iin"))
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ INSTANCE ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Declare type of items by ID by value
+    _items_by_value: dict[Hashable, dict[int, Any]]
+
+    # Declare type of items by ID by lowercase value
+    _items_by_value_lower: dict[Hashable, dict[int, Any]] | None
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, path: str) -> None:
+        """Init Method"""
+
+        # Initialize index
+        super().__init__(path)
+
+        # Initialize items by value
+        self._items_by_value = {}
+
+        # Lowercase items by value are only built once a case-insensitive lookup occurs
+        self._items_by_value_lower = None
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _ADD
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _add(self, item_id: int, item: Any, value: Any) -> bool:
+        """Adds an item by value and returns whether it was indexed"""
+
+        # Initialize try-except block
+        try:
+            # Add item to the bucket of its value
+            self._items_by_value.setdefault(value, {})[item_id] = item
+
+        # Skip unhashable values, which cannot equal a hashable expected value
+        except TypeError:
+            return False
+
+        # Check if lowercase items by value have been built
+        if self._items_by_value_lower is not None:
+            # Add item to the bucket of its lowercase value
+            self._items_by_value_lower.setdefault(olower(value), {})[item_id] = item
+
+        # Return True
+        return True
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _CLEAR
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _clear(self) -> None:
+        """Clears the index structures"""
+
+        # Clear items by value
+        self._items_by_value.clear()
+
+        # Reset lowercase items by value
+        self._items_by_value_lower = None
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _GET ITEMS BY VALUE LOWER
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _get_items_by_value_lower(self) -> dict[Hashable, dict[int, Any]]:
+        """Returns items by lowercase value, building them if necessary"""
+
+        # Check if lowercase items by value have not been built
+        if self._items_by_value_lower is None:
+            # Initialize lowercase items by value
+            items_by_value_lower: dict[Hashable, dict[int, Any]] = {}
+
+            # Iterate over buckets
+            for value, items in self._items_by_value.items():
+                # Merge bucket into the bucket of its lowercase value
+                items_by_value_lower.setdefault(olower(value), {}).update(items)
+
+            # Set lowercase items by value
+            self._items_by_value_lower = items_by_value_lower
+
+        # Return lowercase items by value
+        return self._items_by_value_lower
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _LOOKUP
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _lookup(self, condition: FilterCondition) -> dict[int, Any] | None:
+        """Returns items by ID that meet a condition or None if it cannot be served"""
+
+        # Get operator and expected value
+        operator, expected = condition.operator, condition.expected
+
+        # Check if operator is a membership operator
+        if operator in ("__in", "__iin"):
+            # Return the union of buckets by value
+            return self._union(
+                (
+                    self._items_by_value
+                    if operator == "__in"
+                    else self._get_items_by_value_lower()
+                ),
+                expected,
+            )
+
+        # Check if operator is an equality operator
+        if operator in ("__eq", "__ieq"):
+            # Get items by value
+            items_by_value = (
+                self._items_by_value
+                if operator == "__eq"
+                else self._get_items_by_value_lower()
+            )
+
+            # Initialize try-except block
+            try:
+                # Get bucket
+                items = items_by_value.get(expected)
+
+            # Return None on unhashable expected values
+            except TypeError:
+                return None
+
+            # Return no items if expected value does not equal itself, such as NaN,
+            # given that buckets match it by identity but equality checks do not
+            if items and expected != expected:
+                return {}
+
+            # Return bucket
+            return items or {}
+
+        # Return None
+        return None
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _REMAP
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _remap(self, item_ids: dict[int, int] | list[int]) -> None:
+        """Replaces the item IDs of buckets by what they map to"""
+
+        # Replace the item IDs of each bucket
+        self._items_by_value = {
+            value: dict(zip(map(item_ids.__getitem__, items), items.values()))
+            for value, items in self._items_by_value.items()
+        }
+
+        # Reset lowercase items by value, which the next lookup that needs them rebuilds
+        self._items_by_value_lower = None
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _REMOVE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _remove(self, item_id: int, value: Any) -> None:
+        """Removes an item by its indexed value"""
+
+        # Iterate over item buckets by value
+        for items_by_value, key in (
+            (self._items_by_value, value),
+            (self._items_by_value_lower, olower(value)),
+        ):
+            # Continue if items by value have not been built
+            if items_by_value is None:
+                continue
+
+            # Get bucket
+            items = items_by_value.get(key)
+
+            # Continue if bucket does not exist
+            if items is None:
+                continue
+
+            # Remove item from bucket
+            items.pop(item_id, None)
+
+            # Remove bucket if empty
+            if not items:
+                del items_by_value[key]
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _UNION
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _union(
+        items_by_value: dict[Hashable, dict[int, Any]], values: Any
+    ) -> dict[int, Any] | None:
+        """Returns the union of the buckets of a series of values"""
+
+        # Return None if values is not a container of discrete values
+        if not isinstance(values, (list, tuple, set, frozenset)):
+            return None
+
+        # Initialize items
+        items: dict[int, Any] = {}
+
+        # Iterate over values
+        for value in values:
+            # Initialize try-except block
+            try:
+                # Get bucket
+                bucket = items_by_value.get(value)
+
+            # Return None on unhashable values
+            except TypeError:
+                return None
+
+            # Update items with bucket
+            if bucket:
+                items.update(bucket)
+
+        # Return items
+        return items
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ COPY
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def copy(self, items_by_id: dict[int, Any]) -> HashIndex:
+        """Returns a copy of the index restricted to items by ID"""
+
+        # Initialize index
+        index = self.New()
+
+        # Check if all indexed items are kept
+        if self._values_by_id.keys() <= items_by_id.keys():
+            # Copy buckets and stored values by item ID as they are
+            index._items_by_value = {
+                k: v.copy() for k, v in self._items_by_value.items()
+            }
+            index._values_by_id = self._values_by_id.copy()
+
+            # Return index
+            return index
+
+        # Iterate over buckets by value
+        for value, items in self._items_by_value.items():
+            # Get the kept items of bucket
+            items_kept = {k: v for k, v in items.items() if k in items_by_id}
+
+            # Set bucket if any item is kept
+            if items_kept:
+                index._items_by_value[value] = items_kept
+
+        # Set stored values by item ID
+        index._values_by_id = {
+            k: v for k, v in self._values_by_id.items() if k in items_by_id
+        }
+
+        # Return index
+        return index
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ VALUES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def values(self) -> Iterable[Hashable]:
+        """Returns the distinct values of the index"""
+
+        # Return values
+        return self._items_by_value.keys()
@@ -0,0 +1,145 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+import math
+
+from typing import Any, Iterable
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.collection.classes.sketch import Sketch
+from core.collection.functions.stable_hash import stable_hash
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ HYPER LOG LOG
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class HyperLogLog(Sketch):
+    """A sketch of the number of distinct values in 2 ** precision bytes
+
+    The relative standard error is about 1.04 / sqrt(2 ** precision), i.e. 0.8% at the
+    default precision of 14, regardless of how many values are added.
+    """
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ INSTANCE ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Declare type of precision, i.e. the number of hash bits that select a register
+    precision: int
+
+    # Declare type of registers, each of which is the greatest rank seen
+    registers: bytearray
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, precision: int = 14) -> None:
+        """Init Method"""
+
+        # Raise ValueError if precision is out of range
+        if not 4 <= precision <= 18:
+            raise ValueError("HyperLogLog precision must be between 4 and 18")
+
+        # Initialize sketch
+        super().__init__()
+
+        # Set precision
+        self.precision = precision
+
+        # Initialize registers
+        self.registers = bytearray(1 << precision)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _EXTEND
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _extend(self, values: Iterable[Any]) -> None:
+        """Adds values in a single loop of local lookups"""
+
+        # Get registers, precision, register mask and rank width
+        registers, precision = self.registers, self.precision
+        mask, width = len(registers) - 1, 65 - precision
+
+        # Initialize count
+        count = 0
+
+        # Iterate over hashes of values
+        for count, h in enumerate(map(stable_hash, values), 1):
+            # Get register and the rank of the leftmost set bit of the remaining bits
+            i = h & mask
+            rank = width - (h >> precision).bit_length()
+
+            # Update register if rank is greater
+            if rank > registers[i]:
+                registers[i] = rank
+
+        # Update count
+        self.count += count
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ ADD
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def add(self, value: Any) -> None:
+        """Adds a value to the sketch"""
+
+        # Add value
+        self._extend((value,))
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ ESTIMATE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def estimate(self) -> int:
+        """Returns the estimated number of distinct values"""
+
+        # Get registers and their count
+        registers = self.registers
+        m = len(registers)
+
+        # Get bias correction constant
+        alpha = {16: 0.673, 32: 0.697, 64: 0.709}.get(m, 0.7213 / (1 + 1.079 / m))
+
+        # Get raw estimate from the harmonic mean of the register ranks
+        estimate = alpha * m * m / sum(2.0**-rank for rank in registers)
+
+        # Get the number of empty registers
+        zeros = registers.count(0)
+
+        # Use linear counting for small cardinalities, where it is more accurate
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * math.log(m / zeros)
+
+        # Return estimate
+        return round(estimate)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ MERGE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def merge(self, other: HyperLogLog) -> HyperLogLog:
+        """Returns a new sketch of the values of both sketches"""
+
+        # Raise ValueError if precisions differ
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge HyperLogLog sketches of different precision")
+
+        # Initialize sketch
+        sketch = HyperLogLog(self.precision)
+
+        # Set registers to the greatest rank of each register
+        sketch.registers = bytearray(map(max, self.registers, other.registers))
+
+        # Set count
+        sketch.count = self.count + other.count
+
+        # Return sketch
+        return sketch
@@ -0,0 +1,242 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+import itertools
+import math
+import random
+
+from bisect import bisect_left
+from operator import itemgetter
+from typing import Any, Iterable
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.collection.classes.sketch import Sketch
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ KLL SKETCH
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class KLLSketch(Sketch):
+    """A sketch of the quantiles of comparable values in O(k) space
+
+    Values are kept in levels of compactors, where a full compactor sorts its values
+    and promotes every other one to the next level with twice the weight. The rank
+    error is about 1.7 / k, i.e. under 1% at the default k of 200.
+    """
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ CLASS ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Define the ratio of the capacity of a level to that of the level above it
+    DECAY = 2 / 3
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ INSTANCE ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Declare type of the capacity of the top level
+    k: int
+
+    # Declare type of compactors, where the values of level h have weight 2 ** h
+    compactors: list[list[Any]]
+
+    # Declare type of the number of values held and the number that triggers compaction
+    _size: int
+    _size_max: int
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, k: int = 200) -> None:
+        """Init Method"""
+
+        # Raise ValueError if k is too small to compact
+        if k < 8:
+            raise ValueError("KLL sketch k must be at least 8")
+
+        # Initialize sketch
+        super().__init__()
+
+        # Set k
+        self.k = k
+
+        # Initialize compactors and sizes
+        self.compactors = []
+        self._size = 0
+        self._size_max = 0
+
+        # Add the first level
+        self._grow()
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _CAPACITY
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _capacity(self, level: int) -> int:
+        """Returns the capacity of a level, which decays with depth below the top"""
+
+        # Return capacity
+        return math.ceil(self.k * self.DECAY ** (len(self.compactors) - level - 1)) + 1
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _COMPRESS
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _compress(self) -> None:
+        """Compacts the lowest full level until the sketch is under capacity"""
+
+        # Iterate while sketch is at capacity, where some level must then be full
+        while self._size >= self._size_max:
+            # Get the lowest full level
+            level = next(
+                level
+                for level, values in enumerate(self.compactors)
+                if len(values) >= self._capacity(level)
+            )
+
+            # Add a level above if this is the top
+            if level + 1 == len(self.compactors):
+                self._grow()
+
+            # Get values, sorted, keeping the last back if their count is odd
+            values = sorted(self.compactors[level])
+            self.compactors[level] = [values.pop()] if len(values) % 2 else []
+
+            # Promote every other value, starting at random, to the next level
+            promoted = values[random.getrandbits(1) :: 2]  # noqa: E203
+            self.compactors[level + 1].extend(promoted)
+
+            # Update size
+            self._size -= len(values) - len(promoted)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _EXTEND
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _extend(self, values: Iterable[Any]) -> None:
+        """Adds values to the bottom level in chunks that fit under capacity"""
+
+        # Get iterator
+        iterator = iter(values)
+
+        # Iterate over chunks of as many values as fit before compaction
+        while chunk := list(itertools.islice(iterator, self._size_max - self._size)):
+            # Add chunk to the bottom level
+            self.compactors[0].extend(chunk)
+
+            # Update size and count
+            self._size += len(chunk)
+            self.count += len(chunk)
+
+            # Compact levels if sketch is full
+            self._compress()
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _GROW
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _grow(self) -> None:
+        """Adds a level above the top, which lowers the capacity of the levels below"""
+
+        # Add level
+        self.compactors.append([])
+
+        # Update the size that triggers compaction
+        self._size_max = sum(map(self._capacity, range(len(self.compactors))))
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ ADD
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def add(self, value: Any) -> None:
+        """Adds a value to the sketch"""
+
+        # Add value
+        self._extend((value,))
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ MERGE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def merge(self, other: KLLSketch) -> KLLSketch:
+        """Returns a new sketch of the values of both sketches"""
+
+        # Raise ValueError if capacities differ
+        if other.k != self.k:
+            raise ValueError("Cannot merge KLL sketches of different k")
+
+        # Initialize sketch
+        sketch = KLLSketch(self.k)
+
+        # Add levels until sketch is as tall as the taller sketch
+        while len(sketch.compactors) < max(len(self.compactors), len(other.compactors)):
+            sketch._grow()
+
+        # Concatenate the values of each level
+        for compactors in (self.compactors, other.compactors):
+            for level, values in enumerate(compactors):
+                sketch.compactors[level].extend(values)
+
+        # Set size and count
+        sketch._size = self._size + other._size
+        sketch.count = self.count + other.count
+
+        # Compact levels if sketch is full
+        sketch._compress()
+
+        # Return sketch
+        return sketch
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ QUANTILE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def quantile(self, q: float) -> Any:
+        """Returns the estimated value at a quantile, or None if the sketch is empty"""
+
+        # Return the quantile
+        return self.quantiles(q)[0]
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ QUANTILES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def quantiles(self, *qs: float) -> list[Any]:
+        """Returns the estimated values at quantiles between 0 and 1 in a single pass"""
+
+        # Raise ValueError if a quantile is out of range
+        if not all(0 <= q <= 1 for q in qs):
+            raise ValueError("Quantiles must be between 0 and 1")
+
+        # Return None for each quantile if sketch is empty
+        if not self._size:
+            return [None] * len(qs)
+
+        # Get values and their weights, sorted by value
+        weighted = sorted(
+            (
+                (value, 1 << level)
+                for level, values in enumerate(self.compactors)
+                for value in values
+            ),
+            key=itemgetter(0),
+        )
+
+        # Get the cumulative weight up to each value and the total weight
+        cumulative = list(itertools.accumulate(weight for _, weight in weighted))
+        total = cumulative[-1]
+
+        # Return the first value whose cumulative weight reaches each quantile
+        return [
+            weighted[min(bisect_left(cumulative, q * total), len(weighted) - 1)][0]
+            for q in qs
+        ]
@@ -4,13 +4,19 @@
 
 from __future__ import annotations
 
-from typing import Any, Hashable, Iterator, TypeVar
+import itertools
+
+from functools import partial
+from operator import is_
+from typing import Any, Hashable, Iterable, Iterator, TypeVar
 
 # ┌─────────────────────────────────────────────────────────────────────────────────────
 # │ PROJECT IMPORTS
 # └─────────────────────────────────────────────────────────────────────────────────────
 
 from core.collection.classes.collection import Collection
+from core.collection.classes.collection_index import CollectionIndex
+from core.collection.mixins.indexed_collection_mixin import IndexedCollectionMixin
 
 # ┌─────────────────────────────────────────────────────────────────────────────────────
 # │ TYPE VARIABLES
@@ -18,13 +24,20 @@ from core.collection.classes.collection import Collection
 
 ItemBound = TypeVar("ItemBound", bound=Any)
 
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ SENTINELS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Define a sentinel that takes the place of removed items until the list is compacted
+TOMBSTONE: Any = object()
+
 
 # ┌─────────────────────────────────────────────────────────────────────────────────────
 # │ LIST COLLECTION
 # └─────────────────────────────────────────────────────────────────────────────────────
 
 
-class ListCollection(Collection[ItemBound]):
+class ListCollection(IndexedCollectionMixin, Collection[ItemBound]):
     """A list collection utility class"""
 
     # ┌─────────────────────────────────────────────────────────────────────────────────
@@ -34,16 +47,42 @@ class ListCollection(Collection[ItemBound]):
     # Declare type of items
     _items: list[ItemBound]
 
+    # Declare type of the list offset of each item by ID, if items are tracked by ID
+    _offsets: dict[int, int] | None
+
+    # Declare type of the further list offsets of items that were added more than once
+    _duplicates: dict[int, list[int]]
+
+    # Declare type of the number of tombstones in items
+    _tombstones: int
+
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ __INIT__
     # └─────────────────────────────────────────────────────────────────────────────────
 
-    def __init__(self) -> None:
-        """Init Method"""
+    def __init__(
+        self,
+        indexes: Iterable[str | CollectionIndex] | None = None,
+        identity: bool = False,
+    ) -> None:
+        """Init Method
+
+        With identity, the list offset of each item is tracked by ID, so that find, in
+        and remove match items by identity in O(1) rather than by equality in a scan.
+        Removed items leave tombstones, which are compacted once they outnumber items.
+        """
 
         # Initialize items
         self._items = []
 
+        # Initialize list offsets by item ID if items are tracked by ID
+        self._offsets = {} if identity else None
+        self._duplicates = {}
+        self._tombstones = 0
+
+        # Initialize secondary indexes, which hold each distinct item once
+        self._init_indexes(indexes)
+
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ __GETITEM__
     # └─────────────────────────────────────────────────────────────────────────────────
@@ -55,9 +94,44 @@ class ListCollection(Collection[ItemBound]):
         if isinstance(item, int):
             return self.get(item)
 
+        # Compact items so that the slice is taken over items only
+        if self._tombstones:
+            self._compact()
+
         # Check if item is a slice
         return self._items[item]
 
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __GETSTATE__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Get State Method"""
+
+        # Compact items so that no tombstones are pickled
+        if self._tombstones:
+            self._compact()
+
+        # Get state
+        state = self.__dict__.copy()
+
+        # Replace list offsets, which are keyed by item IDs, by whether they are tracked
+        state["_offsets"] = self._offsets is not None
+        state["_duplicates"] = {}
+
+        # Get the positions of distinct item IDs, by which indexes are pickled
+        positions = (
+            dict(zip(dict.fromkeys(map(id, self._items)), itertools.count()))
+            if self._positions is not None
+            else {}
+        )
+
+        # Update state of indexes and insertion positions
+        state.update(self._get_index_state(positions))
+
+        # Return state
+        return state
+
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ __ITER__
     # └─────────────────────────────────────────────────────────────────────────────────
@@ -65,9 +139,13 @@ class ListCollection(Collection[ItemBound]):
     def __iter__(self) -> Iterator[ItemBound]:
         """Iter Method"""
 
-        # Iterate over items
-        for item in self._items:
-            yield item
+        # Return iterator of items if they are not tracked by ID
+        if self._offsets is None:
+            return iter(self._items)
+
+        # Return iterator of items, skipping tombstones, including any left by removals
+        # made while iterating
+        return itertools.filterfalse(partial(is_, TOMBSTONE), self._items)
 
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ __LEN__
@@ -76,8 +154,8 @@ class ListCollection(Collection[ItemBound]):
     def __len__(self) -> int:
         """Length Method"""
 
-        # Return length
-        return len(self._items)
+        # Return length, excluding tombstones
+        return len(self._items) - self._tombstones
 
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ __REVERSED__
@@ -86,8 +164,126 @@ class ListCollection(Collection[ItemBound]):
     def __reversed__(self) -> Iterator[ItemBound]:
         """Reversed Method"""
 
-        # Return reversed items
-        return reversed(self._items)
+        # Return reversed items if they are not tracked by ID
+        if self._offsets is None:
+            return reversed(self._items)
+
+        # Return reversed items, skipping tombstones
+        return itertools.filterfalse(partial(is_, TOMBSTONE), reversed(self._items))
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __SETSTATE__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Set State Method"""
+
+        # Update state
+        self.__dict__.update(state)
+
+        # Rebuild list offsets by the IDs of unpickled items if they are tracked
+        self._offsets = {} if state.get("_offsets") else None
+        self._duplicates, self._tombstones = {}, 0
+        if self._offsets is not None:
+            self._compact()
+
+        # Set indexes and insertion positions by the IDs of distinct unpickled items
+        self._set_index_state(
+            list(dict.fromkeys(map(id, self._items))) if self._positions else []
+        )
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _COMPACT
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _compact(self) -> None:
+        """Drops tombstones from items and rebuilds list offsets by item ID"""
+
+        # Drop tombstones
+        self._items = list(itertools.filterfalse(partial(is_, TOMBSTONE), self._items))
+        self._tombstones = 0
+
+        # Return if items are not tracked by ID
+        if self._offsets is None:
+            return
+
+        # Get items
+        items = self._items
+
+        # Set the first list offset of each item ID, writing later offsets first
+        self._offsets = offsets = dict(
+            zip(map(id, reversed(items)), range(len(items) - 1, -1, -1))
+        )
+
+        # Get the IDs of items that may still be in the list more than once
+        ids_duplicate = self._duplicates.keys() & offsets.keys()
+
+        # Initialize further list offsets
+        self._duplicates = {}
+
+        # Check if any item may still be in the list more than once
+        if ids_duplicate:
+            # Iterate over items
+            for offset, item in enumerate(items):
+                # Get item ID
+                item_id = id(item)
+
+                # Add further offset of item
+                if item_id in ids_duplicate and offsets[item_id] != offset:
+                    self._duplicates.setdefault(item_id, []).append(offset)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _TRACK
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _track(self, item: ItemBound) -> None:
+        """Records the list offset of an item that was appended"""
+
+        # Return if items are not tracked by ID
+        if self._offsets is None:
+            return
+
+        # Get item ID and offset
+        item_id, offset = id(item), len(self._items) - 1
+
+        # Record offset, or a further offset if item is already in the list
+        if self._offsets.setdefault(item_id, offset) != offset:
+            self._duplicates.setdefault(item_id, []).append(offset)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _UNTRACK
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _untrack(self, item_id: int, offset: int) -> bool:
+        """Forgets a list offset of an item and returns whether item is gone"""
+
+        # Return if items are not tracked by ID
+        if self._offsets is None:
+            return True
+
+        # Get further offsets of item
+        duplicates = self._duplicates.get(item_id)
+
+        # Check if item is in the list only once
+        if not duplicates:
+            # Forget item
+            del self._offsets[item_id]
+
+            # Return that item is gone
+            return True
+
+        # Forget further offset, or promote the next one if offset is the first
+        if self._offsets[item_id] == offset:
+            self._offsets[item_id] = duplicates.pop(0)
+        else:
+            duplicates.remove(offset)
+
+        # Forget that item is in the list more than once if it no longer is
+        if not duplicates:
+            del self._duplicates[item_id]
+
+        # Return that item is still in the list
+        return False
 
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ ADD
@@ -104,6 +300,12 @@ class ListCollection(Collection[ItemBound]):
             # Append item to collection
             self._items.append(item)
 
+            # Record the list offset of item
+            self._track(item)
+
+            # Add item to secondary indexes
+            self._index_add(id(item), item)
+
             # Increment count
             count += 1
 
@@ -120,6 +322,12 @@ class ListCollection(Collection[ItemBound]):
         # Append item to items
         self._items.append(item)
 
+        # Record the list offset of item
+        self._track(item)
+
+        # Add item to secondary indexes
+        self._index_add(id(item), item)
+
         # Return number of items appended
         return 1
 
@@ -133,6 +341,14 @@ class ListCollection(Collection[ItemBound]):
         # Get item ID
         id_item = id(item)
 
+        # Check if items are tracked by ID
+        if self._offsets is not None:
+            # Get the list offset of item
+            offset = self._offsets.get(id_item)
+
+            # Return item by offset if any, or otherwise by position
+            return self._items[offset] if offset is not None else self.get(item)
+
         # Iterate over items
         for current in self:
             # Return item if current is item
@@ -153,6 +369,10 @@ class ListCollection(Collection[ItemBound]):
         if not isinstance(key, int):
             return default
 
+        # Compact items so that the index is a position among items only
+        if self._tombstones:
+            self._compact()
+
         # Get index
         index = key
 
@@ -174,6 +394,14 @@ class ListCollection(Collection[ItemBound]):
     def New(self, *args: Any, **kwargs: Any) -> ListCollection[ItemBound]:
         """Returns a new collection"""
 
+        # Check if indexes not in kwargs
+        if "indexes" not in kwargs:
+            # Add new empty indexes of the same paths to kwargs
+            kwargs["indexes"] = tuple(index.New() for index in self._indexes)
+
+        # Track items by ID if this collection does
+        kwargs.setdefault("identity", self._offsets is not None)
+
         # Return new collection
         return ListCollection(*args, **kwargs)
 
@@ -194,8 +422,41 @@ class ListCollection(Collection[ItemBound]):
     def pop(self, index: int = -1) -> ItemBound:
         """Pops an item from the collection"""
 
+        # Check if items are tracked by ID
+        if self._offsets is not None:
+            # Compact items so that the index is a position among items only
+            if self._tombstones:
+                self._compact()
+
+            # Get offset, raising IndexError if it is out of range
+            offset = range(len(self._items))[index]
+
+            # Get item
+            item = self._items[offset]
+
+            # Pop item if it is last, or otherwise leave a tombstone in its place
+            if offset == len(self._items) - 1:
+                self._items.pop()
+            else:
+                self._items[offset] = TOMBSTONE
+                self._tombstones += 1
+
+            # Remove item from secondary indexes if it is no longer in the collection
+            if self._untrack(id(item), offset):
+                self._index_remove(id(item))
+
+            # Return item
+            return item
+
         # Pop item from collection
-        return self._items.pop(index)
+        item = self._items.pop(index)
+
+        # Remove item from secondary indexes unless it is still in the collection
+        if self._indexes and not any(i is item for i in self._items):
+            self._index_remove(id(item))
+
+        # Return item
+        return item
 
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ REMOVE
@@ -204,9 +465,49 @@ class ListCollection(Collection[ItemBound]):
     def remove(self, *items: Any | ItemBound) -> int:
         """Removes an item from the collection"""
 
+        # Check if items are tracked by ID
+        if self._offsets is not None:
+            # Get list items, offsets and further offsets
+            items_list, offsets = self._items, self._offsets
+            duplicates = self._duplicates
+
+            # Get original length
+            len0 = len(self)
+
+            # Iterate over the IDs of items to be removed
+            for item_id in map(id, items):
+                # Get offset of item and forget it, continuing if it is not in list
+                offset = offsets.pop(item_id, None)
+                if offset is None:
+                    continue
+
+                # Iterate over the offsets of item
+                for offset in (offset, *duplicates.pop(item_id, ())):
+                    # Leave a tombstone in place of item
+                    items_list[offset] = TOMBSTONE
+                    self._tombstones += 1
+
+                # Remove item from secondary indexes
+                if self._indexes:
+                    self._index_remove(item_id)
+
+            # Compact items once tombstones outnumber them
+            if self._tombstones > len(self):
+                self._compact()
+
+            # Return number of items removed
+            return len0 - len(self)
+
         # Get original length
         len0 = len(self)
 
+        # Check if there are secondary indexes
+        if self._indexes:
+            # Iterate over items to be removed
+            for item in (i for i in self._items if i in items):
+                # Remove item from secondary indexes
+                self._index_remove(id(item))
+
         # Remove items from collection
         self._items = [i for i in self._items if i not in items]
 
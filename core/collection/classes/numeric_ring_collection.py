@@ -0,0 +1,336 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+import math
+
+from array import array
+from collections import deque
+from typing import Any
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.collection.classes.ring_collection import RingCollection
+from core.collection.functions.import_numpy import import_numpy
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ NUMERIC RING COLLECTION
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class NumericRingCollection(RingCollection[float]):
+    """An array-backed ring collection of numbers with O(1) rolling statistics"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ INSTANCE ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Declare type of ring
+    _ring: array[Any]  # type: ignore[assignment]
+
+    # Declare type of typecode
+    _typecode: str
+
+    # Declare type of the sequence number of the next sample
+    _sequence: int
+
+    # Declare type of running sum, mean and sum of squared deviations
+    _sum: float
+    _mean: float
+    _m2: float
+
+    # Declare type of monotonic deques of sequence number and value pairs
+    _mins: deque[tuple[int, float]]
+    _maxes: deque[tuple[int, float]]
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, size: int | None, typecode: str = "d") -> None:
+        """Init Method"""
+
+        # Initialize ring collection
+        super().__init__(size)
+
+        # Set typecode
+        self._typecode = typecode
+
+        # Initialize ring as a typed array
+        self._ring = array(typecode)
+
+        # Initialize the sequence number of the next sample
+        self._sequence = 0
+
+        # Initialize rolling statistics
+        self._reset()
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _RESET
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _reset(self) -> None:
+        """Recomputes the rolling statistics from the samples in the ring"""
+
+        # Get samples from oldest to newest
+        values = list(self)
+
+        # Get sample count
+        n = len(values)
+
+        # Set running sum and mean, using an exact sum to discard any drift
+        self._sum = math.fsum(values)
+        self._mean = self._sum / n if n else 0.0
+
+        # Set sum of squared deviations in a second pass
+        self._m2 = math.fsum((value - self._mean) ** 2 for value in values)
+
+        # Initialize monotonic deques
+        self._mins = deque()
+        self._maxes = deque()
+
+        # Iterate over samples with their sequence numbers
+        for sequence, value in enumerate(values, self._sequence - n):
+            # Push sample onto monotonic deques
+            self._push(sequence, value)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _PUSH
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _push(self, sequence: int, value: float) -> None:
+        """Pushes a sample onto the monotonic deques and expires evicted samples"""
+
+        # Get monotonic deques
+        mins, maxes = self._mins, self._maxes
+
+        # Pop samples that can no longer be the least, then append sample
+        while mins and mins[-1][1] >= value:
+            mins.pop()
+        mins.append((sequence, value))
+
+        # Pop samples that can no longer be the greatest, then append sample
+        while maxes and maxes[-1][1] <= value:
+            maxes.pop()
+        maxes.append((sequence, value))
+
+        # Get the sequence number of the oldest sample in the window
+        oldest = sequence + 1 - self._length
+
+        # Expire samples that have left the window
+        if mins[0][0] < oldest:
+            mins.popleft()
+        if maxes[0][0] < oldest:
+            maxes.popleft()
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ NEW
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def New(self, *args: Any, **kwargs: Any) -> NumericRingCollection:
+        """Returns a new collection"""
+
+        # Check if size not in kwargs
+        if "size" not in kwargs:
+            # Add size to kwargs
+            kwargs["size"] = self._size
+
+        # Check if typecode not in kwargs
+        if "typecode" not in kwargs:
+            # Add typecode to kwargs
+            kwargs["typecode"] = self._typecode
+
+        # Return new collection
+        return NumericRingCollection(*args, **kwargs)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ ADD
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def add(self, *items: float) -> int:
+        """Adds samples to the collection, updating the statistics in O(1) each"""
+
+        # Get ring and size
+        ring, size = self._ring, self._size
+
+        # Iterate over items
+        for item in items:
+            # Check if ring is not yet full
+            if size is None or self._length < size:
+                # Append sample to ring
+                ring.append(item)
+
+                # Increment length
+                self._length += 1
+
+                # Update mean and sum of squared deviations by Welford's method
+                delta = item - self._mean
+                self._mean += delta / self._length
+                self._m2 += delta * (item - self._mean)
+
+                # Update running sum
+                self._sum += item
+
+            # Otherwise replace the oldest sample at cursor
+            else:
+                # Get evicted sample
+                evicted = ring[self._cursor]
+
+                # Replace evicted sample
+                ring[self._cursor] = item
+
+                # Update mean and sum of squared deviations for a fixed sample count
+                delta = item - evicted
+                mean = self._mean
+                self._mean += delta / size
+                self._m2 += delta * (item - self._mean + evicted - mean)
+
+                # Update running sum
+                self._sum += delta
+
+            # Push sample onto monotonic deques
+            self._push(self._sequence, ring[self._cursor])
+
+            # Increment sequence number
+            self._sequence += 1
+
+            # Increment cursor
+            self._cursor = self._cursor_next
+
+            # Recompute statistics once per turn of a full ring to bound float drift
+            if self._cursor == 0 and size is not None and self._length == size:
+                self._reset()
+
+        # Return count
+        return len(items)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ MAX
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def max(self, path: str | None = None) -> Any | None:
+        """Returns the greatest sample in the window"""
+
+        # Defer to collection if a path is given
+        if path is not None:
+            return super().max(path)
+
+        # Return greatest sample if any
+        return self._maxes[0][1] if self._maxes else None
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ MEAN
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def mean(self) -> float | None:
+        """Returns the mean of the samples in the window"""
+
+        # Return mean if any sample
+        return self._mean if self._length else None
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ MIN
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def min(self, path: str | None = None) -> Any | None:
+        """Returns the least sample in the window"""
+
+        # Defer to collection if a path is given
+        if path is not None:
+            return super().min(path)
+
+        # Return least sample if any
+        return self._mins[0][1] if self._mins else None
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ STD
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def std(self, ddof: int = 0) -> float | None:
+        """Returns the standard deviation of the samples in the window"""
+
+        # Get variance
+        variance = self.variance(ddof=ddof)
+
+        # Return standard deviation if any
+        return None if variance is None else math.sqrt(variance)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ SUM
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def sum(self) -> float:
+        """Returns the sum of the samples in the window"""
+
+        # Return running sum
+        return self._sum
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ UPDATE SIZE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def update_size(self, size: int | None) -> None:
+        """Updates the size of the collection, keeping the most recent samples"""
+
+        # Get samples from oldest to newest
+        values = list(self)
+
+        # Keep the most recent samples if shrinking
+        if size is not None:
+            values = values[max(0, len(values) - size) :]  # noqa: E203
+
+        # Set ring in order, so that the cursor follows the newest sample
+        self._ring = array(self._typecode, values)
+
+        # Set size and length
+        self._size = size
+        self._length = len(self._ring)
+
+        # Set cursor
+        self._cursor = self._length % size if size else self._length
+
+        # Recompute rolling statistics
+        self._reset()
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ VALUES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def values(self) -> Any:
+        """Returns the samples from oldest to newest as a NumPy or typed array"""
+
+        # Get ring and cursor
+        ring, cursor = self._ring, self._cursor
+
+        # Get NumPy if it is available
+        numpy = import_numpy()
+
+        # Check if NumPy is available
+        if numpy is not None:
+            # Get a zero-copy view of ring
+            view = numpy.frombuffer(ring, dtype=ring.typecode)
+
+            # Return samples in order
+            return numpy.concatenate((view[cursor:], view[:cursor]))
+
+        # Return samples in order
+        return ring[cursor:] + ring[:cursor]  # noqa: E203
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ VARIANCE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def variance(self, ddof: int = 0) -> float | None:
+        """Returns the variance of the samples in the window"""
+
+        # Return None if there are not enough samples
+        if self._length <= ddof:
+            return None
+
+        # Return variance, clamping rounding error below zero
+        return max(self._m2, 0.0) / (self._length - ddof)
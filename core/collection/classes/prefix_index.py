@@ -0,0 +1,263 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+import itertools
+import sys
+
+from copy import copy
+from typing import Any, Iterator
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.collection.classes.collection_index import CollectionIndex
+from core.collection.classes.filter_condition import FilterCondition
+from core.collection.classes.sorted_index import SortedIndex
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PREFIX INDEX
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class PrefixIndex(CollectionIndex):
+    """A secondary index of collection items by the prefix or suffix of a string value
+
+    Values are case-folded and kept in sorted order, and reversed in a second order,
+    so that the values with a prefix or suffix are a contiguous range found in
+    O(log n). The items in range are candidates that are then checked exactly.
+    """
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ CLASS ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Define filter operators that can be served by the index
+    OPERATORS = frozenset(
+        ("__startswith", "__istartswith", "__endswith", "__iendswith")
+    )
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ INSTANCE ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Declare type of string items in order of case-folded value
+    _prefixes: SortedIndex
+
+    # Declare type of string items in order of reversed case-folded value
+    _suffixes: SortedIndex
+
+    # Declare type of items by ID whose value is not a string, such as bytes
+    _others: dict[int, Any]
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, path: str) -> None:
+        """Init Method"""
+
+        # Initialize index
+        super().__init__(path)
+
+        # Initialize prefix and suffix orders and other items
+        self._prefixes = SortedIndex(path)
+        self._suffixes = SortedIndex(path)
+        self._others = {}
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _ADD
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _add(self, item_id: int, item: Any, value: Any) -> bool:
+        """Adds an item by value and returns whether it was indexed"""
+
+        # Check if value is not a string
+        if not isinstance(value, str):
+            # Add item to other items, which are checked on every lookup
+            self._others[item_id] = item
+
+            # Return True
+            return True
+
+        # Case-fold value
+        value = value.casefold()
+
+        # Add item by value and by reversed value
+        self._prefixes._add(item_id, item, value)
+        self._suffixes._add(item_id, item, value[::-1])
+
+        # Return True
+        return True
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _ADD ORDERED
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _add_ordered(
+        self, item_id: int, item: Any, value: Any, positions: dict[int, int]
+    ) -> bool:
+        """Adds an item by value among equal values in order of insertion position"""
+
+        # Add item like any other if value is not a string
+        if not isinstance(value, str):
+            return self._add(item_id, item, value)
+
+        # Case-fold value
+        value = value.casefold()
+
+        # Add item by value and by reversed value among equal values
+        self._prefixes._add_ordered(item_id, item, value, positions)
+        self._suffixes._add_ordered(item_id, item, value[::-1], positions)
+
+        # Return True
+        return True
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _CLEAR
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _clear(self) -> None:
+        """Clears the index structures"""
+
+        # Clear prefix and suffix orders and other items
+        self._prefixes._clear()
+        self._suffixes._clear()
+        self._others.clear()
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _LOOKUP
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _lookup(self, condition: FilterCondition) -> dict[int, Any] | None:
+        """Returns items by ID that meet a condition or None if it cannot be served"""
+
+        # Get operator and expected value
+        operator, expected = condition.operator, condition.expected
+
+        # Return None if operator is not served or expected value is not a string
+        if operator not in self.OPERATORS or not isinstance(expected, str):
+            return None
+
+        # Get whether expected value is a suffix
+        suffix = operator.endswith("endswith")
+
+        # Get whether values should be lowercased, given a lowercased expected value
+        lower = operator.startswith("__i")
+
+        # Get check of a value
+        check = str.endswith if suffix else str.startswith
+
+        # Get stored values
+        values = self._values_by_id
+
+        # Get candidate items whose stored value has the expected prefix or suffix
+        items = {
+            item_id: item
+            for item_id, item in self._range(expected, suffix)
+            if check(values[item_id].lower() if lower else values[item_id], expected)
+        }
+
+        # Add other items that meet condition
+        items.update(
+            (item_id, item) for item_id, item in self._others.items() if condition(item)
+        )
+
+        # Return items
+        return items
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _RANGE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _range(self, prefix: str, suffix: bool = False) -> Iterator[tuple[int, Any]]:
+        """Returns item IDs and items whose case-folded value starts with a prefix
+
+        If suffix, those whose value ends with it are returned in reversed value order.
+        """
+
+        # Get order and the case-folded prefix in that order
+        order = self._suffixes if suffix else self._prefixes
+        prefix = prefix.casefold()[::-1] if suffix else prefix.casefold()
+
+        # Get the least string that is greater than all strings with prefix, i.e. the
+        # prefix without trailing maximal characters and with its last one incremented
+        stop = prefix.rstrip(chr(sys.maxunicode))
+        stop = stop and stop[:-1] + chr(ord(stop[-1]) + 1)
+
+        # Return the item IDs and items in range
+        return order._range(
+            order._locate(prefix),
+            order._locate(stop) if stop else (len(order._maxes), 0),
+        )
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _REMAP
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _remap(self, item_ids: dict[int, int] | list[int]) -> None:
+        """Replaces the item IDs of orders and other items by what they map to"""
+
+        # Copy prefix and suffix orders, which a shallow copy of the index shares
+        self._prefixes, self._suffixes = copy(self._prefixes), copy(self._suffixes)
+
+        # Replace the item IDs of prefix and suffix orders
+        self._prefixes._remap(item_ids)
+        self._suffixes._remap(item_ids)
+
+        # Replace the item IDs of other items
+        self._others = dict(
+            zip(map(item_ids.__getitem__, self._others), self._others.values())
+        )
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _REMOVE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _remove(self, item_id: int, value: Any) -> None:
+        """Removes an item by its indexed value"""
+
+        # Check if value is not a string
+        if not isinstance(value, str):
+            # Remove item from other items
+            self._others.pop(item_id, None)
+
+            # Return
+            return
+
+        # Case-fold value
+        value = value.casefold()
+
+        # Remove item by value and by reversed value
+        self._prefixes._remove(item_id, value)
+        self._suffixes._remove(item_id, value[::-1])
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ SEARCH
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def search(self, prefix: str, limit: int | None = None) -> list[Any]:
+        """Returns up to limit items whose value starts with a prefix, ignoring case
+
+        Items are returned in order of case-folded value, visiting only those in range,
+        i.e. in O(log n + len(prefix) + k).
+        """
+
+        # Get lowercase prefix and stored values
+        prefix, values = prefix.lower(), self._values_by_id
+
+        # Return items whose stored value starts with prefix
+        return list(
+            itertools.islice(
+                (
+                    item
+                    for item_id, item in self._range(prefix)
+                    if values[item_id].lower().startswith(prefix)
+                ),
+                limit,
+            )
+        )
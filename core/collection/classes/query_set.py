@@ -0,0 +1,369 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+import itertools
+
+from typing import TYPE_CHECKING, Any, Generic, Iterator, TypeVar, overload
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.collection.classes.filter_condition import FilterCondition
+from core.collection.classes.filter_plan import FilterPlan
+from core.collection.exceptions import MultipleItemsError, NoItemsError
+from core.placeholders import nothing
+
+if TYPE_CHECKING:
+    from core.collection.classes.collection import Collection
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TYPE VARIABLES
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+ItemBound = TypeVar("ItemBound", bound=Any)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ QUERY SET
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class QuerySet(Generic[ItemBound]):
+    """A lazy, chainable query of filter conditions, ordering and slicing"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ INSTANCE ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Declare type of collection
+    collection: Collection[ItemBound]
+
+    # Declare type of conditions
+    conditions: tuple[FilterCondition, ...]
+
+    # Declare type of ordering paths and reverse flag
+    ordering: tuple[tuple[str, ...], bool] | None
+
+    # Declare type of slice start and stop
+    start: int
+    stop: int | None
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(
+        self,
+        collection: Collection[ItemBound],
+        conditions: tuple[FilterCondition, ...] = (),
+        ordering: tuple[tuple[str, ...], bool] | None = None,
+        start: int = 0,
+        stop: int | None = None,
+    ) -> None:
+        """Init Method"""
+
+        # Set collection
+        self.collection = collection
+
+        # Set conditions
+        self.conditions = conditions
+
+        # Set ordering
+        self.ordering = ordering
+
+        # Set slice start and stop
+        self.start = start
+        self.stop = stop
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __BOOL__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __bool__(self) -> bool:
+        """Bool Method"""
+
+        # Return whether any item meets the query
+        return self.exists()
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __GETITEM__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    @overload
+    def __getitem__(self, key: int) -> ItemBound:
+        ...
+
+    @overload
+    def __getitem__(self, key: slice) -> QuerySet[ItemBound]:
+        ...
+
+    def __getitem__(self, key: int | slice) -> ItemBound | QuerySet[ItemBound]:
+        """Get Item Method"""
+
+        # Check if key is a slice
+        if isinstance(key, slice):
+            # Raise ValueError if slice is not supported
+            if key.step not in (None, 1) or any(
+                bound is not None and bound < 0 for bound in (key.start, key.stop)
+            ):
+                raise ValueError(
+                    "Only non-negative slices without a step are supported"
+                )
+
+            # Get start relative to the current slice
+            start = self.start + (key.start or 0)
+
+            # Get stop relative to the current slice
+            stop = self.stop if key.stop is None else self.start + key.stop
+
+            # Narrow stop to the current slice
+            if self.stop is not None and stop is not None:
+                stop = min(stop, self.stop)
+
+            # Return query set
+            return self._clone(
+                start=start, stop=stop if stop is None else max(stop, start)
+            )
+
+        # Raise ValueError if index is negative
+        if key < 0:
+            raise ValueError("Negative indexing is not supported")
+
+        # Get items at index
+        items = list(self[key : key + 1]._iterate())  # noqa: E203
+
+        # Raise IndexError if index is out of range
+        if not items:
+            raise IndexError("QuerySet index out of range")
+
+        # Return item
+        return items[0]
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __ITER__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __iter__(self) -> Iterator[ItemBound]:
+        """Iterate Method"""
+
+        # Return iterator of items
+        return self._iterate()
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __REPR__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __repr__(self) -> str:
+        """Representation Method"""
+
+        # Return representation
+        return (
+            f"<{self.__class__.__name__}: {self.collection.__class__.__name__} "
+            f"({len(self.conditions)} conditions)>"
+        )
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _CLONE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _clone(self, **kwargs: Any) -> QuerySet[ItemBound]:
+        """Returns a copy of the query set with updated attributes"""
+
+        # Return query set
+        return self.__class__(
+            **{
+                "collection": self.collection,
+                "conditions": self.conditions,
+                "ordering": self.ordering,
+                "start": self.start,
+                "stop": self.stop,
+                **kwargs,
+            }
+        )
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _ITERATE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _iterate(self, ordered: bool = True) -> Iterator[ItemBound]:
+        """Returns an iterator of the items that meet the query in a single pass"""
+
+        # Get collection
+        collection = self.collection
+
+        # Get filter plan
+        plan = FilterPlan(self.conditions)
+
+        # Check if ordering applies
+        if ordered and self.ordering is not None:
+            # Get ordering paths and reverse flag
+            paths, reverse = self.ordering
+
+            # Get sorted index of path if there is a single path
+            index = (
+                collection._get_sorted_index(paths[0].removeprefix("-"))
+                if len(paths) == 1
+                else None
+            )
+
+            # Check if a sorted index can be walked lazily
+            if index is not None and (self.stop is not None or not plan):
+                # Get items in index order followed by items that were not indexed
+                items: Iterator[ItemBound] = plan.filter(
+                    itertools.chain(
+                        index.items(reverse=reverse != paths[0].startswith("-")),
+                        (item for item in collection if id(item) not in index),
+                    )
+                )
+
+            # Otherwise filter and then order the matching items
+            else:
+                items = iter(
+                    collection._order(
+                        collection._filter(plan), paths, reverse=reverse, n=self.stop
+                    )
+                )
+
+        # Otherwise filter without ordering
+        else:
+            items = collection._filter(plan)
+
+        # Return sliced items
+        return itertools.islice(items, self.start, self.stop)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ COLLECT
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def collect(self) -> Collection[ItemBound]:
+        """Returns a new collection of the items that meet the query"""
+
+        # Initialize collection
+        collection = self.collection.New()
+
+        # Add items to collection
+        collection.add(*self._iterate())
+
+        # Return collection
+        return collection
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ COUNT
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def count(self) -> int:
+        """Returns the number of items that meet the query"""
+
+        # Return collection length if there is nothing to filter or slice
+        if not self.conditions and self.start == 0 and self.stop is None:
+            return len(self.collection)
+
+        # Return item count, given that ordering does not affect it
+        return sum(1 for _ in self._iterate(ordered=False))
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ EXISTS
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def exists(self) -> bool:
+        """Returns whether any item meets the query"""
+
+        # Return whether a first item is found, given that ordering does not affect it
+        return next(self._iterate(ordered=False), nothing) is not nothing
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ EXPLAIN
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def explain(self) -> str:
+        """Returns a report of how the filter conditions of the query are run"""
+
+        # Return report of the filter plan, before ordering and slicing
+        return self.collection._explain(FilterPlan(self.conditions))
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ FILTER
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def filter(self, **kwargs: Any) -> QuerySet[ItemBound]:
+        """Returns a query set narrowed by filter keyword args"""
+
+        # Raise TypeError if query set has been sliced
+        if self.start != 0 or self.stop is not None:
+            raise TypeError("Cannot filter a query set once a slice has been taken")
+
+        # Return query set
+        return self._clone(
+            conditions=self.conditions + FilterPlan.from_kwargs(kwargs).conditions
+        )
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ FIRST
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def first(self) -> ItemBound | None:
+        """Returns the first item that meets the query"""
+
+        # Return first item or None
+        return next(self._iterate(), None)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ ONLY
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def only(self) -> ItemBound:
+        """Returns the only item that meets the query"""
+
+        # Get item
+        item = self.only_or_none()
+
+        # Raise exception if item is None
+        if item is None:
+            raise NoItemsError()
+
+        # Return item
+        return item
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ ONLY OR NONE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def only_or_none(self) -> ItemBound | None:
+        """Returns the only item that meets the query or None"""
+
+        # Get up to two items, which is enough to tell if there are several, where
+        # ordering only matters if a slice of the ordered items has been taken
+        items = list(
+            itertools.islice(
+                self._iterate(ordered=self.start != 0 or self.stop is not None), 2
+            )
+        )
+
+        # Check if more than one item meets the query
+        if len(items) > 1:
+            raise MultipleItemsError(self.count())
+
+        # Return item if any
+        return items[0] if items else None
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ ORDER BY
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def order_by(self, *paths: str, reverse: bool = False) -> QuerySet[ItemBound]:
+        """Returns a query set ordered by the values of paths, where "-" reverses one"""
+
+        # Raise TypeError if a path is not a string, such as a positional reverse flag
+        if not paths or not all(isinstance(path, str) for path in paths):
+            raise TypeError("order_by takes one or more paths and a keyword reverse")
+
+        # Raise TypeError if query set has been sliced
+        if self.start != 0 or self.stop is not None:
+            raise TypeError("Cannot order a query set once a slice has been taken")
+
+        # Return query set
+        return self._clone(ordering=(paths, reverse))
@@ -0,0 +1,223 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+import itertools
+import math
+import random
+import sys
+
+from collections import deque
+from typing import Any, Iterable
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.collection.classes.sketch import Sketch
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ RESERVOIR
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class Reservoir(Sketch):
+    """A uniform random sample of up to k values of a stream of unknown length
+
+    Values are sampled by Algorithm L, which draws how many values to skip before the
+    next one enters the sample, so that skipped values cost a single iteration step.
+    """
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ INSTANCE ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Declare type of sample size
+    k: int
+
+    # Declare type of sampled values
+    items: list[Any]
+
+    # Declare type of the greatest random key in sample, once it is full
+    _w: float
+
+    # Declare type of the count at which the next value enters the sample
+    _next: int
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, k: int) -> None:
+        """Init Method"""
+
+        # Raise ValueError if k is negative
+        if k < 0:
+            raise ValueError("Reservoir size must not be negative")
+
+        # Initialize sketch
+        super().__init__()
+
+        # Set k
+        self.k = k
+
+        # Initialize items
+        self.items = []
+
+        # Initialize greatest key and the count of the next sampled value
+        self._w = 1.0
+        self._next = k + 1
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _EXTEND
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _extend(self, values: Iterable[Any]) -> None:
+        """Adds values, skipping those that do not enter the sample"""
+
+        # Get items and k
+        items, k = self.items, self.k
+
+        # Pair values with a counter, which only advances for each value that is read
+        counter = itertools.count()
+        iterator = zip(values, counter)
+
+        # Check if sample is empty by definition
+        if not k:
+            # Read values and update count
+            deque(iterator, maxlen=0)
+            self.count += next(counter)
+
+            # Return
+            return
+
+        # Initialize the number of values read up to the last sampled one
+        read = 0
+
+        # Check if sample is not full
+        if len(items) < k:
+            # Fill sample with the first values
+            items.extend(
+                value for value, _ in itertools.islice(iterator, k - len(items))
+            )
+            read = len(items) - self.count
+
+            # Return if values are exhausted before sample is full
+            if len(items) < k:
+                self.count += read
+                return
+
+            # Schedule the next sampled value
+            self._schedule(k)
+
+        # Iterate over the values that enter the sample, skipping those in between
+        while (
+            pair := next(
+                itertools.islice(iterator, self._next - self.count - read - 1, None),
+                None,
+            )
+        ) is not None:
+            # Replace a random item with value
+            items[random.randrange(k)] = pair[0]
+
+            # Update the number of values read up to this one
+            read = self._next - self.count
+
+            # Lower the greatest key and schedule the next sampled value
+            self._w *= math.exp(math.log(self._uniform()) / k)
+            self._next += self._skip() + 1
+
+        # Update count
+        self.count += next(counter)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _SCHEDULE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _schedule(self, count: int) -> None:
+        """Draws the greatest key of a sample of count values and the next value"""
+
+        # Draw the greatest key, i.e. the k-th least of count uniform keys
+        self._w = random.betavariate(self.k, count - self.k + 1)
+
+        # Schedule the next sampled value
+        self._next = count + self._skip() + 1
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _SKIP
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _skip(self) -> int:
+        """Returns the number of values to skip before the next one enters the sample"""
+
+        # Return a geometric number of values whose keys exceed the greatest key
+        return math.floor(
+            math.log(self._uniform()) / math.log(1.0 - self._w or sys.float_info.min)
+        )
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _UNIFORM
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _uniform() -> float:
+        """Returns a random float that is greater than 0 and less than 1"""
+
+        # Return random float, excluding 0
+        return random.random() or sys.float_info.min
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ ADD
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def add(self, value: Any) -> None:
+        """Adds a value to the sketch"""
+
+        # Add value
+        self._extend((value,))
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ MERGE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def merge(self, other: Reservoir) -> Reservoir:
+        """Returns a new uniform sample of the values of both samples
+
+        Each item is drawn from either sample in proportion to the values it has seen.
+        """
+
+        # Raise ValueError if sizes differ
+        if other.k != self.k:
+            raise ValueError("Cannot merge reservoirs of different sizes")
+
+        # Initialize sketch
+        sketch = Reservoir(self.k)
+
+        # Get shuffled copies of both samples and the values they have seen
+        items = random.sample(self.items, len(self.items))
+        items_other = random.sample(other.items, len(other.items))
+        count, count_other = self.count, other.count
+
+        # Draw items without replacement from the values of both samples
+        for _ in range(min(self.k, count + count_other)):
+            # Draw from this sample in proportion to its values that are not drawn
+            if random.random() * (count + count_other) < count:
+                sketch.items.append(items.pop())
+                count -= 1
+
+            # Otherwise draw from the other sample
+            else:
+                sketch.items.append(items_other.pop())
+                count_other -= 1
+
+        # Set count
+        sketch.count = self.count + other.count
+
+        # Schedule the next sampled value if sample is full
+        if self.k and len(sketch.items) == self.k:
+            sketch._schedule(sketch.count)
+
+        # Return sketch
+        return sketch
@@ -13,6 +13,7 @@ from typing import Any, Hashable, Iterator, TypeVar
 # └─────────────────────────────────────────────────────────────────────────────────────
 
 from core.collection.classes.collection import Collection
+from core.collection.classes.ring_view import RingView
 
 # ┌─────────────────────────────────────────────────────────────────────────────────────
 # │ TYPE VARIABLES
@@ -75,10 +76,10 @@ class RingCollection(Collection[ItemBound]):
         if isinstance(item, int):
             return self.get(item)
 
-        # Check if item is a slice
-        return (
-            self._ring[self._cursor :] + self._ring[: self._cursor]  # noqa: E203
-        ).__getitem__(item)
+        # Return a lazy view of the slice, computed over the two wrapped segments
+        return RingView(
+            self._ring, self._cursor, self._length, range(self._length)[item]
+        )
 
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ __ITER__
@@ -265,6 +266,22 @@ class RingCollection(Collection[ItemBound]):
         # Return item
         return item
 
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ HEAD
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def head(self, n: int = 5) -> RingCollection[ItemBound]:
+        """Returns a new collection of the first n items of the collection"""
+
+        # Initialize collection
+        collection = self.New()
+
+        # Add the first n items to collection from a view of the ring
+        collection.add(*self[: max(0, n)])
+
+        # Return collection
+        return collection
+
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ REMOVE
     # └─────────────────────────────────────────────────────────────────────────────────
@@ -275,6 +292,25 @@ class RingCollection(Collection[ItemBound]):
         # Raise NotImplementedError
         raise NotImplementedError("RingCollection does not support remove")
 
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ TAIL
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def tail(self, n: int = 5) -> RingCollection[ItemBound]:
+        """Returns a new collection of the last n items of the collection"""
+
+        # Initialize collection
+        collection = self.New()
+
+        # Get n
+        n = max(0, min(n, self._length))
+
+        # Add the last n items to collection from a view of the ring
+        collection.add(*self[self._length - n :])  # noqa: E203
+
+        # Return collection
+        return collection
+
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ UPDATE SIZE
     # └─────────────────────────────────────────────────────────────────────────────────
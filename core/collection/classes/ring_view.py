@@ -0,0 +1,207 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+import itertools
+
+from typing import Any, Iterator, MutableSequence, Sequence, TypeVar, overload
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TYPE VARIABLES
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+ItemBound = TypeVar("ItemBound", bound=Any)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ RING VIEW
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class RingView(Sequence[ItemBound]):
+    """A lazy, zero-copy view of a slice of a ring in order from oldest to newest"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ INSTANCE ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Declare type of ring buffer, cursor and length at the time the view was taken
+    _buffer: MutableSequence[Any]
+    _cursor: int
+    _length: int
+
+    # Declare type of the logical indices of the view
+    _indices: range
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(
+        self, buffer: MutableSequence[Any], cursor: int, length: int, indices: range
+    ) -> None:
+        """Init Method"""
+
+        # Set ring buffer, cursor and length
+        self._buffer = buffer
+        self._cursor = cursor
+        self._length = length
+
+        # Set logical indices
+        self._indices = indices
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __EQ__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __eq__(self, other: object) -> bool:
+        """Equality Method"""
+
+        # Return NotImplemented if other is not a list, tuple or view
+        if not isinstance(other, (list, tuple, RingView)):
+            return NotImplemented
+
+        # Return whether items are equal, as for the list that slices used to return
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __GETITEM__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    @overload
+    def __getitem__(self, key: int) -> ItemBound:
+        ...
+
+    @overload
+    def __getitem__(self, key: slice) -> RingView[ItemBound]:
+        ...
+
+    def __getitem__(self, key: int | slice) -> ItemBound | RingView[ItemBound]:
+        """Get Item Method"""
+
+        # Check if key is a slice
+        if isinstance(key, slice):
+            # Return a view of the sliced logical indices
+            return RingView(
+                self._buffer, self._cursor, self._length, self._indices[key]
+            )
+
+        # Return item at the physical index of logical index
+        return self._buffer[(self._cursor + self._indices[key]) % self._length]
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __ITER__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __iter__(self) -> Iterator[ItemBound]:
+        """Iterate Method"""
+
+        # Get item getter of buffer
+        getitem = self._buffer.__getitem__
+
+        # Return iterator of items over at most two physical segments
+        return itertools.chain.from_iterable(
+            map(getitem, segment) for segment in self.segments()
+        )
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __LEN__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __len__(self) -> int:
+        """Length Method"""
+
+        # Return length
+        return len(self._indices)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __REPR__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __repr__(self) -> str:
+        """Representation Method"""
+
+        # Return representation
+        return f"<{self.__class__.__name__}: {len(self)} items>"
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __REVERSED__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __reversed__(self) -> Iterator[ItemBound]:
+        """Reversed Method"""
+
+        # Return iterator of a reversed view
+        return iter(self[::-1])
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ MEMORYVIEWS
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def memoryviews(self) -> tuple[memoryview, ...]:
+        """Returns zero-copy memoryviews of the segments of a typed ring buffer"""
+
+        # Get memoryview of buffer, which raises TypeError if it is not typed
+        view = memoryview(self._buffer)  # type: ignore
+
+        # Initialize memoryviews
+        memoryviews = []
+
+        # Iterate over segments
+        for segment in self.segments():
+            # Get stop, where a negative stop of a descending segment means the start
+            stop = segment.stop if segment.stop >= 0 else None
+
+            # Append memoryview of segment
+            memoryviews.append(view[segment.start : stop : segment.step])  # noqa: E203
+
+        # Return memoryviews
+        return tuple(memoryviews)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ SEGMENTS
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def segments(self) -> tuple[range, ...]:
+        """Returns the physical index ranges of the view, split where the ring wraps"""
+
+        # Get logical indices, cursor and length
+        indices, cursor, length = self._indices, self._cursor, self._length
+
+        # Get the logical index at which physical indices wrap to the start of buffer
+        wrap = length - cursor
+
+        # Check if indices are ascending
+        if indices.step > 0:
+            # Count the leading indices before the wrap
+            count = len(range(indices.start, min(indices.stop, wrap), indices.step))
+
+            # Get the physical offsets of indices before and after the wrap
+            offsets = (cursor, cursor - length)
+
+        # Otherwise handle descending indices
+        else:
+            # Count the leading indices after the wrap
+            count = len(range(indices.start, max(indices.stop, wrap - 1), indices.step))
+
+            # Get the physical offsets of indices after and before the wrap
+            offsets = (cursor - length, cursor)
+
+        # Return the non-empty physical segments of indices split at the wrap
+        return tuple(
+            range(part.start + offset, part.stop + offset, part.step)
+            for part, offset in zip((indices[:count], indices[count:]), offsets)
+            if part
+        )
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ TOLIST
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def tolist(self) -> list[ItemBound]:
+        """Returns a list of the items of the view"""
+
+        # Return list of items
+        return list(self)
@@ -0,0 +1,408 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+import struct
+
+from multiprocessing import shared_memory
+from typing import Any, Hashable, Iterator, cast
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.collection.classes.ring_collection import RingCollection
+from core.placeholders import nothing
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ LAYOUT
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Define the header of published sequence, slot count and record format
+HEADER = struct.Struct("=QQ32s")
+
+# Define the stamp of each slot, i.e. the sequence number of its record plus one
+STAMP = struct.Struct("=Q")
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ SHARED RING COLLECTION
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class SharedRingCollection(RingCollection[Any]):
+    """A ring collection of fixed-size records in shared memory for many processes"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ INSTANCE ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Declare type of size, which is fixed
+    _size: int
+
+    # Declare type of shared memory block
+    _shm: shared_memory.SharedMemory
+
+    # Declare type of shared buffer
+    _buffer: memoryview
+
+    # Declare type of record format
+    _format: str
+
+    # Declare type of record struct
+    _record: struct.Struct
+
+    # Declare type of slot size in bytes
+    _slot_size: int
+
+    # Declare type of whether records have a single field
+    _scalar: bool
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, size: int, format: str = "d", name: str | None = None) -> None:
+        """Init Method"""
+
+        # Set size and record layout
+        self._init_layout(size, format)
+
+        # Create shared memory block
+        self._shm = shared_memory.SharedMemory(
+            name=name, create=True, size=HEADER.size + size * self._slot_size
+        )
+
+        # Set shared buffer
+        self._buffer = cast(memoryview, self._shm.buf)
+
+        # Write header
+        HEADER.pack_into(self._buffer, 0, 0, size, format.encode())
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __GETITEM__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __getitem__(self, item: Any) -> Any:
+        """Get Item Method"""
+
+        # Return record by slot index if item is an integer, like a ring collection
+        if isinstance(item, int):
+            return self.get(item)
+
+        # Return the records of the slice that have not been overwritten meanwhile
+        return [
+            record
+            for record in map(self._read, self._sequences()[item])
+            if record is not nothing
+        ]
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __ITER__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iter Method"""
+
+        # Return iterator of the records from oldest to newest
+        return iter(self[:])
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __REDUCE__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __reduce__(self) -> tuple[Any, tuple[str]]:
+        """Reduce Method"""
+
+        # Pickle by name, so that a process receiving the collection attaches to it
+        return self.attach, (self.name,)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __REVERSED__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __reversed__(self) -> Iterator[Any]:
+        """Reversed Method"""
+
+        # Return iterator of the records from newest to oldest
+        return iter(self[::-1])
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _CURSOR
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    @property
+    def _cursor(self) -> int:  # type: ignore[override]
+        """Returns the slot of the next record"""
+
+        # Return the slot of the published sequence
+        return self.sequence % self._size
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _INIT LAYOUT
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _init_layout(self, size: int, format: str) -> None:
+        """Sets the size and the record layout of a struct format"""
+
+        # Raise ValueError if format does not fit in the header
+        if len(format.encode()) > 32:
+            raise ValueError(f"Record format is too long: {format!r}")
+
+        # Set size, given that cursor and length are derived from the shared header
+        self._size = size
+
+        # Set record format and struct, standardized so that layout is portable
+        self._format = format
+        self._record = struct.Struct("=" + format.lstrip("@=<>!"))
+
+        # Set whether records have a single field, which are then added as scalars
+        self._scalar = len(self._record.unpack(bytes(self._record.size))) == 1
+
+        # Set slot size, aligning stamps to 8 bytes so that they are written whole
+        self._slot_size = (STAMP.size + self._record.size + 7) // 8 * 8
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _LENGTH
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    @property
+    def _length(self) -> int:  # type: ignore[override]
+        """Returns the number of records in the ring"""
+
+        # Return the published count up to size
+        return min(self.sequence, self._size)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _READ
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _read(self, sequence: int) -> Any:
+        """Returns the record of a sequence number or nothing if it was overwritten"""
+
+        # Get shared buffer
+        buffer = self._buffer
+
+        # Get the offset of the slot of sequence
+        offset = HEADER.size + sequence % self._size * self._slot_size
+
+        # Return nothing if slot does not hold the record of sequence
+        if STAMP.unpack_from(buffer, offset)[0] != sequence + 1:
+            return nothing
+
+        # Unpack record in place without copying the slot
+        record = self._record.unpack_from(buffer, offset + STAMP.size)
+
+        # Return nothing if the producer overwrote the slot during the read
+        if STAMP.unpack_from(buffer, offset)[0] != sequence + 1:
+            return nothing
+
+        # Return record
+        return record[0] if self._scalar else record
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _SEQUENCES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _sequences(self, sequence: int = 0) -> range:
+        """Returns the sequence numbers of the records in the ring from a sequence"""
+
+        # Get published sequence
+        published = self.sequence
+
+        # Return the sequence numbers that have not yet been overwritten
+        return range(max(sequence, published - self._size, 0), published)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ ATTACH
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    @classmethod
+    def attach(cls, name: str) -> SharedRingCollection:
+        """Attaches to an existing shared ring collection by name"""
+
+        # Initialize collection without creating a shared memory block
+        collection = cls.__new__(cls)
+
+        # Initialize try-except block
+        try:
+            # Open shared memory block, leaving its lifetime to the producer
+            shm = shared_memory.SharedMemory(name=name, track=False)  # type: ignore
+
+        # Open shared memory block where it cannot opt out of tracking
+        except TypeError:
+            shm = shared_memory.SharedMemory(name=name)
+
+        # Set shared memory block and buffer
+        collection._shm = shm
+        collection._buffer = cast(memoryview, shm.buf)
+
+        # Read size and record format from header
+        _, size, format = HEADER.unpack_from(collection._buffer, 0)
+
+        # Set size and record layout
+        collection._init_layout(size, format.rstrip(b"\0").decode())
+
+        # Return collection
+        return collection
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ NAME
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    @property
+    def name(self) -> str:
+        """Returns the name of the shared memory block"""
+
+        # Return name
+        return self._shm.name
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ SEQUENCE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    @property
+    def sequence(self) -> int:
+        """Returns the sequence number of the next record, i.e. the published count"""
+
+        # Return published sequence, which is the first field of header
+        return int(STAMP.unpack_from(self._buffer, 0)[0])
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ NEW
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def New(  # type: ignore[override]
+        self, *args: Any, **kwargs: Any
+    ) -> RingCollection[Any]:
+        """Returns a new, process-local collection"""
+
+        # Check if size not in kwargs
+        if "size" not in kwargs:
+            # Add size to kwargs
+            kwargs["size"] = self._size
+
+        # Return new ring collection, given that a shared block is not a copy
+        return RingCollection(*args, **kwargs)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ ADD
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def add(self, *items: Any) -> int:
+        """Publishes records, which must come from a single producer process"""
+
+        # Get shared buffer, size and slot size
+        buffer, size, slot_size = self._buffer, self._size, self._slot_size
+
+        # Get stamp and record pack methods
+        stamp, pack = STAMP.pack_into, self._record.pack_into
+
+        # Get published sequence
+        sequence = self.sequence
+
+        # Iterate over items
+        for item in items:
+            # Get the offset of the slot of sequence
+            offset = HEADER.size + sequence % size * slot_size
+
+            # Invalidate slot so that readers discard a partially written record
+            stamp(buffer, offset, 0)
+
+            # Write record
+            if self._scalar:
+                pack(buffer, offset + 8, item)
+            else:
+                pack(buffer, offset + 8, *item)
+
+            # Stamp slot with the sequence number of its record
+            stamp(buffer, offset, sequence + 1)
+
+            # Increment sequence
+            sequence += 1
+
+        # Publish sequence once the records are stamped
+        stamp(buffer, 0, sequence)
+
+        # Return count
+        return len(items)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ CLOSE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def close(self) -> None:
+        """Closes the access of this process to the shared memory block"""
+
+        # Release shared buffer
+        self._buffer.release()
+
+        # Close shared memory block
+        self._shm.close()
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ GET
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def get(self, key: Hashable, default: Any | None = None) -> Any | None:
+        """Gets a record by slot index from the shared ring collection"""
+
+        # Return default if key not an int
+        if not isinstance(key, int):
+            return default
+
+        # Get the sequence numbers of the records in the ring
+        sequences = self._sequences()
+
+        # Get the sequence number of the record in slot of key
+        sequence = sequences.start + (key - sequences.start) % self._size
+
+        # Return default if slot does not hold a record yet
+        if sequence not in sequences:
+            return default
+
+        # Get record
+        record = self._read(sequence)
+
+        # Return record if it was not overwritten meanwhile
+        return default if record is nothing else record
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ READ
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def read(self, sequence: int = 0) -> tuple[list[Any], int]:
+        """Returns the records published from a sequence number and the next one
+
+        A consumer that fell more than a ring behind resumes at the oldest record.
+        """
+
+        # Get the sequence numbers of the records from sequence
+        sequences = self._sequences(sequence)
+
+        # Return the records that were not overwritten and the next sequence number
+        return [
+            record for record in map(self._read, sequences) if record is not nothing
+        ], sequences.stop
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ UNLINK
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def unlink(self) -> None:
+        """Destroys the shared memory block, which the producer does once"""
+
+        # Unlink shared memory block
+        self._shm.unlink()
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ UPDATE SIZE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def update_size(self, size: int | None) -> None:
+        """Updates the size of the collection"""
+
+        # Raise NotImplementedError
+        raise NotImplementedError("SharedRingCollection has a fixed size")
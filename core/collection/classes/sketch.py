@@ -0,0 +1,112 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from functools import partial
+from operator import is_not
+from typing import Any, Iterable, TypeVar
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.object.functions.ogetter import ogetter
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ SKETCH
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class Sketch(ABC):
+    """An abstract approximate summary of values that is built in a single pass
+
+    Sketches of the same parameters can be merged, so that partitions of a collection
+    or chunks of a stream can be summarized separately and then combined.
+    """
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ TYPE VARIABLES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    SketchBound = TypeVar("SketchBound", bound="Sketch")
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ INSTANCE ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Declare type of the number of values added
+    count: int
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self) -> None:
+        """Init Method"""
+
+        # Initialize count
+        self.count = 0
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __REPR__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __repr__(self) -> str:
+        """Representation Method"""
+
+        # Return representation
+        return f"<{self.__class__.__name__}: {self.count} values>"
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _EXTEND
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _extend(self, values: Iterable[Any]) -> None:
+        """Adds values one at a time, which subclasses may do in bulk instead"""
+
+        # Iterate over values
+        for value in values:
+            # Add value
+            self.add(value)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ ADD
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    @abstractmethod
+    def add(self, value: Any) -> None:
+        """Adds a value to the sketch"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ EXTEND
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def extend(
+        self: SketchBound, values: Iterable[Any], path: str | None = None
+    ) -> SketchBound:
+        """Adds values, or the values of a path of items that are not None, in a pass"""
+
+        # Check if path is given
+        if path is not None:
+            # Get getter
+            getter = ogetter(path.replace(".", "__"), default=None, delimiter="__")
+
+            # Get values of path that are not None
+            values = filter(partial(is_not, None), map(getter, values))
+
+        # Add values
+        self._extend(values)
+
+        # Return sketch
+        return self
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ MERGE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    @abstractmethod
+    def merge(self: SketchBound, other: SketchBound) -> SketchBound:
+        """Returns a new sketch of the values of both sketches"""
@@ -0,0 +1,538 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+import itertools
+
+from bisect import bisect_left, bisect_right
+from operator import eq
+from typing import Any, Iterable, Iterator
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.collection.classes.collection_index import CollectionIndex
+from core.collection.classes.filter_condition import FilterCondition
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ SORTED INDEX
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class SortedIndex(CollectionIndex):
+    """An ordered secondary index of collection items by a comparable path value"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ CLASS ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Define filter operators that can be served by the index
+    OPERATORS = frozenset(("__eq", "__gt", "__gte", "__lt", "__lte"))
+
+    # Define the length above which a chunk is split in two
+    CHUNK_SIZE = 1024
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ INSTANCE ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Declare type of sorted value chunks
+    _values: list[list[Any]]
+
+    # Declare type of item ID chunks in value order
+    _ids: list[list[int]]
+
+    # Declare type of item chunks in value order
+    _items: list[list[Any]]
+
+    # Declare type of the greatest value of each chunk
+    _maxes: list[Any]
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, path: str) -> None:
+        """Init Method"""
+
+        # Initialize index
+        super().__init__(path)
+
+        # Initialize chunks, which keep inserts and removals cheap on large indexes
+        self._values = []
+        self._ids = []
+        self._items = []
+        self._maxes = []
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _ADD
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _add(self, item_id: int, item: Any, value: Any) -> bool:
+        """Adds an item by value and returns whether it was indexed"""
+
+        # Skip None and NaN, which can never meet a range condition and would break the
+        # order of values that bisection relies on
+        if value is None or value != value:
+            return False
+
+        # Initialize try-except block
+        try:
+            # Get the location after any equal values, to keep insertion order
+            chunk, position = self._locate(value, right=True)
+
+        # Skip values that cannot be compared, which can never meet a range condition
+        except TypeError:
+            return False
+
+        # Insert item at location
+        self._insert(chunk, position, item_id, item, value)
+
+        # Return True
+        return True
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _ADD ORDERED
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _add_ordered(
+        self, item_id: int, item: Any, value: Any, positions: dict[int, int]
+    ) -> bool:
+        """Adds an item by value among equal values in order of insertion position"""
+
+        # Skip None and NaN, which can never meet a range condition
+        if value is None or value != value:
+            return False
+
+        # Initialize try-except block
+        try:
+            # Get the locations of the first and after the last equal value
+            start, stop = self._locate(value), self._locate(value, right=True)
+
+        # Skip values that cannot be compared, which can never meet a range condition
+        except TypeError:
+            return False
+
+        # Get insertion position of item and position getter
+        position_item, position = positions[item_id], positions.__getitem__
+
+        # Iterate over the chunks of equal values
+        for chunk in range(start[0], min(stop[0] + 1, len(self._maxes))):
+            # Get the position range of equal values within chunk
+            lo = start[1] if chunk == start[0] else 0
+            hi = stop[1] if chunk == stop[0] else len(self._ids[chunk])
+
+            # Continue if item comes after the equal values of chunk
+            if lo == hi or position(self._ids[chunk][hi - 1]) < position_item:
+                continue
+
+            # Set stop to the first equal value whose item comes after item
+            stop = chunk, bisect_right(
+                self._ids[chunk], position_item, lo, hi, key=position
+            )
+
+            # Break
+            break
+
+        # Insert item at stop
+        self._insert(*stop, item_id, item, value)
+
+        # Return True
+        return True
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _CLEAR
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _clear(self) -> None:
+        """Clears the index structures"""
+
+        # Clear chunks
+        self._values.clear()
+        self._ids.clear()
+        self._items.clear()
+        self._maxes.clear()
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _INSERT
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _insert(
+        self, chunk: int, position: int, item_id: int, item: Any, value: Any
+    ) -> None:
+        """Inserts an item by value at a located chunk and position"""
+
+        # Check if index is empty
+        if not self._maxes:
+            # Initialize first chunk
+            self._values.append([value])
+            self._ids.append([item_id])
+            self._items.append([item])
+            self._maxes.append(value)
+
+            # Return
+            return
+
+        # Append to the last chunk if location is beyond the greatest value
+        if chunk == len(self._maxes):
+            chunk, position = chunk - 1, len(self._values[chunk - 1])
+
+        # Get chunk values
+        values = self._values[chunk]
+
+        # Insert value, item ID and item
+        values.insert(position, value)
+        self._ids[chunk].insert(position, item_id)
+        self._items[chunk].insert(position, item)
+
+        # Update the greatest value of chunk
+        self._maxes[chunk] = values[-1]
+
+        # Split chunk in two if it has grown too large
+        if len(values) > self.CHUNK_SIZE:
+            self._split(chunk)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _LOCATE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _locate(self, value: Any, right: bool = False) -> tuple[int, int]:
+        """Returns the chunk and position at which a value would be bisected"""
+
+        # Get bisect function
+        bisect = bisect_right if right else bisect_left
+
+        # Get chunk
+        chunk = bisect(self._maxes, value)
+
+        # Return the end if value is beyond the greatest value
+        if chunk == len(self._maxes):
+            return chunk, 0
+
+        # Return chunk and position
+        return chunk, bisect(self._values[chunk], value)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _LOOKUP
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _lookup(self, condition: FilterCondition) -> dict[int, Any] | None:
+        """Returns items by ID that meet a condition or None if it cannot be served"""
+
+        # Return items in the range of condition
+        return self.lookup(condition)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _RANGE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _range(
+        self, start: tuple[int, int], stop: tuple[int, int]
+    ) -> Iterator[tuple[int, Any]]:
+        """Returns an iterator of item IDs and items between two located positions"""
+
+        # Define chunk generator
+        def chunks() -> Iterator[Iterator[tuple[int, Any]]]:
+            """Yields the item IDs and items of each chunk in range"""
+
+            # Iterate over the chunks in range
+            for chunk in range(start[0], min(stop[0] + 1, len(self._maxes))):
+                # Get the position range within chunk
+                position_start = start[1] if chunk == start[0] else 0
+                position_stop = stop[1] if chunk == stop[0] else len(self._ids[chunk])
+
+                # Yield item IDs and items
+                yield zip(
+                    self._ids[chunk][position_start:position_stop],
+                    self._items[chunk][position_start:position_stop],
+                )
+
+        # Return iterator of item IDs and items
+        return itertools.chain.from_iterable(chunks())
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _REMAP
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _remap(self, item_ids: dict[int, int] | list[int]) -> None:
+        """Replaces the item IDs of chunks by what they map to"""
+
+        # Replace the item IDs of each chunk
+        self._ids = [list(map(item_ids.__getitem__, chunk)) for chunk in self._ids]
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _REMOVE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _remove(self, item_id: int, value: Any) -> None:
+        """Removes an item by its indexed value"""
+
+        # Iterate over the chunks that may contain value
+        for chunk in range(bisect_left(self._maxes, value), len(self._maxes)):
+            # Get chunk values and item IDs
+            values, ids = self._values[chunk], self._ids[chunk]
+
+            # Get the position range of equal values within chunk
+            start, stop = bisect_left(values, value), bisect_right(values, value)
+
+            # Iterate over the positions of equal values
+            for position in range(start, stop):
+                # Continue if position is not of item ID
+                if ids[position] != item_id:
+                    continue
+
+                # Delete value, item ID and item
+                del values[position]
+                del ids[position]
+                del self._items[chunk][position]
+
+                # Check if chunk is empty
+                if not values:
+                    # Delete chunk
+                    del self._values[chunk]
+                    del self._ids[chunk]
+                    del self._items[chunk]
+                    del self._maxes[chunk]
+
+                # Otherwise update the greatest value of chunk
+                else:
+                    self._maxes[chunk] = values[-1]
+
+                # Return
+                return
+
+            # Return if equal values do not continue into the next chunk
+            if stop < len(values):
+                return
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _REVERSED
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _reversed(self) -> Iterator[Iterable[Any]]:
+        """Yields slices of items in reverse value order, equal values in order
+
+        Runs of equal values are found by comparing neighbouring values at once, so
+        that only these are walked forward, and chunks whose equal values continue
+        across a boundary are walked together.
+        """
+
+        # Initialize the end of the chunks to walk
+        stop = len(self._maxes)
+
+        # Iterate while chunks are left
+        while stop:
+            # Get the first of the chunks to walk, which extends over equal values
+            start = stop - 1
+            while start and self._maxes[start - 1] == self._values[start][0]:
+                start -= 1
+
+            # Get values and items of chunks
+            values = list(itertools.chain.from_iterable(self._values[start:stop]))
+            items = list(itertools.chain.from_iterable(self._items[start:stop]))
+
+            # Get the positions whose value is equal to the previous one
+            ties = list(
+                itertools.compress(
+                    range(1, len(values)),
+                    map(eq, values, itertools.islice(values, 1, None)),
+                )
+            )
+
+            # Initialize the end of the items to walk
+            end = len(items)
+
+            # Iterate while runs of equal values are left, from the last
+            while ties:
+                # Get the range of the last run of equal values
+                hi = ties[-1] + 1
+                lo = bisect_left(values, values[hi - 1], 0, hi - 1)
+
+                # Yield the items after run in reverse, and the items of run in order
+                yield reversed(items[hi:end])
+                yield items[lo:hi]
+
+                # Move to the items before run
+                end = lo
+                del ties[bisect_left(ties, lo + 1) :]  # noqa: E203
+
+            # Yield the remaining items in reverse
+            yield reversed(items[:end])
+
+            # Move to the previous chunks
+            stop = start
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _SPLIT
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _split(self, chunk: int) -> None:
+        """Splits a chunk in two halves"""
+
+        # Get middle position
+        middle = len(self._values[chunk]) // 2
+
+        # Iterate over chunk lists
+        for chunks in (self._values, self._ids, self._items):
+            # Replace chunk with its halves
+            chunks[chunk : chunk + 1] = [  # noqa: E203
+                chunks[chunk][:middle],
+                chunks[chunk][middle:],
+            ]
+
+        # Replace the greatest value of chunk with those of its halves
+        self._maxes[chunk : chunk + 1] = [  # noqa: E203
+            self._values[chunk][-1],
+            self._values[chunk + 1][-1],
+        ]
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ COPY
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def copy(self, items_by_id: dict[int, Any]) -> SortedIndex:
+        """Returns a copy of the index restricted to items by ID"""
+
+        # Initialize index
+        index = self.New()
+
+        # Check if all indexed items are kept
+        if self._values_by_id.keys() <= items_by_id.keys():
+            # Copy chunks and stored values by item ID as they are
+            index._values = [chunk.copy() for chunk in self._values]
+            index._ids = [chunk.copy() for chunk in self._ids]
+            index._items = [chunk.copy() for chunk in self._items]
+            index._maxes = self._maxes.copy()
+            index._values_by_id = self._values_by_id.copy()
+
+            # Return index
+            return index
+
+        # Initialize kept values, item IDs and items in value order
+        values: list[Any] = []
+        ids: list[int] = []
+        items: list[Any] = []
+
+        # Iterate over chunks
+        for chunk_values, chunk_ids in zip(self._values, self._ids):
+            # Iterate over values and item IDs of chunk
+            for value, item_id in zip(chunk_values, chunk_ids):
+                # Continue if item is not kept
+                if item_id not in items_by_id:
+                    continue
+
+                # Append value, item ID and item, which are already sorted
+                values.append(value)
+                ids.append(item_id)
+                items.append(items_by_id[item_id])
+
+        # Get chunk size, leaving room for inserts before a chunk is split
+        size = self.CHUNK_SIZE // 2
+
+        # Iterate over chunk lists
+        for chunks, kept in (
+            (index._values, values),
+            (index._ids, ids),
+            (index._items, items),
+        ):
+            # Set chunks
+            chunks.extend(
+                kept[i : i + size] for i in range(0, len(kept), size)  # noqa: E203
+            )
+
+        # Set the greatest value of each chunk
+        index._maxes = [chunk[-1] for chunk in index._values]
+
+        # Set stored values by item ID
+        index._values_by_id = {item_id: self._values_by_id[item_id] for item_id in ids}
+
+        # Return index
+        return index
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ ITEMS
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def items(self, reverse: bool = False) -> Iterator[Any]:
+        """Returns an iterator of the indexed items in value order
+
+        Items of equal values are in insertion order even if reversed, like a stable
+        sort of the items in collection order.
+        """
+
+        # Check if reverse
+        if reverse:
+            # Return iterator of items in reverse value order
+            return itertools.chain.from_iterable(self._reversed())
+
+        # Return iterator of items
+        return itertools.chain.from_iterable(self._items)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ LOOKUP
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def lookup(self, *conditions: FilterCondition) -> dict[int, Any] | None:
+        """Returns items by ID that meet all conditions or None if unservable"""
+
+        # Initialize start and stop as chunk and position pairs
+        start, stop = (0, 0), (len(self._maxes), 0)
+
+        # Iterate over conditions, narrowing a single range rather than intersecting
+        for condition in conditions:
+            # Get operator and expected value
+            operator, expected = condition.operator, condition.expected
+
+            # Return None if condition cannot be served, given that None and NaN are not
+            # indexed
+            if (
+                expected is None
+                or expected != expected
+                or operator not in self.OPERATORS
+            ):
+                return None
+
+            # Initialize try-except block
+            try:
+                # Narrow start by lower bound
+                if operator in ("__eq", "__gte"):
+                    start = max(start, self._locate(expected))
+                elif operator == "__gt":
+                    start = max(start, self._locate(expected, right=True))
+
+                # Narrow stop by upper bound
+                if operator in ("__eq", "__lte"):
+                    stop = min(stop, self._locate(expected, right=True))
+                elif operator == "__lt":
+                    stop = min(stop, self._locate(expected))
+
+            # Return None if expected value cannot be compared to indexed values
+            except TypeError:
+                return None
+
+        # Return items by ID in value order
+        return dict(self._range(start, stop))
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ MAX
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def max(self) -> Any | None:
+        """Returns the item with the greatest value"""
+
+        # Return last item if any
+        return self._items[-1][-1] if self._items else None
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ MIN
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def min(self) -> Any | None:
+        """Returns the item with the least value"""
+
+        # Return first item if any
+        return self._items[0][0] if self._items else None
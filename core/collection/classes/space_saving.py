@@ -0,0 +1,248 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+import heapq
+import itertools
+
+from collections import Counter
+from typing import Any, Hashable, Iterable, Iterator
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.collection.classes.sketch import Sketch
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ SPACE SAVING
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class SpaceSaving(Sketch):
+    """A sketch of the most frequent values that monitors at most k of them
+
+    An unmonitored value replaces the least frequent monitored one and inherits its
+    count as error, so counts overestimate by at most count / k, and any value more
+    frequent than that is monitored.
+    """
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ CLASS ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Define the number of values that are counted exactly before they are added
+    CHUNK = 4096
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ INSTANCE ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Declare type of the number of monitored values
+    k: int
+
+    # Declare type of estimated counts and errors by monitored value
+    counts: dict[Hashable, int]
+    errors: dict[Hashable, int]
+
+    # Declare type of a heap of count lower bounds, sequence numbers and values
+    _heap: list[tuple[int, int, Hashable]]
+
+    # Declare type of sequence counter, which breaks ties without comparing values
+    _sequence: Iterator[int]
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, k: int = 100) -> None:
+        """Init Method"""
+
+        # Raise ValueError if k is not positive
+        if k < 1:
+            raise ValueError("Space-Saving k must be at least 1")
+
+        # Initialize sketch
+        super().__init__()
+
+        # Set k
+        self.k = k
+
+        # Initialize counts, errors, heap and sequence counter
+        self.counts = {}
+        self.errors = {}
+        self._heap = []
+        self._sequence = itertools.count()
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __GETSTATE__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Get State Method"""
+
+        # Get state
+        state = self.__dict__.copy()
+
+        # Remove heap and sequence counter, which are rebuilt from counts
+        del state["_heap"], state["_sequence"]
+
+        # Return state
+        return state
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __SETSTATE__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Set State Method"""
+
+        # Restore state
+        self.__dict__.update(state)
+
+        # Rebuild heap
+        self._rebuild()
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _ADD
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _add(self, value: Hashable, weight: int) -> None:
+        """Adds a value a number of times"""
+
+        # Get counts
+        counts = self.counts
+
+        # Increment count if value is monitored
+        if value in counts:
+            counts[value] += weight
+
+        # Otherwise monitor value if there is room
+        elif len(counts) < self.k:
+            counts[value] = weight
+            self.errors[value] = 0
+            heapq.heappush(self._heap, (weight, next(self._sequence), value))
+
+        # Otherwise replace the least frequent monitored value
+        else:
+            # Get heap
+            heap = self._heap
+
+            # Refresh the heap top until it is current, given that counts only grow
+            while heap[0][0] != counts[heap[0][2]]:
+                heapq.heapreplace(
+                    heap, (counts[heap[0][2]], next(self._sequence), heap[0][2])
+                )
+
+            # Get the least count and value
+            count, _, value_evicted = heap[0]
+
+            # Replace value, which inherits the least count as error
+            del counts[value_evicted], self.errors[value_evicted]
+            counts[value] = count + weight
+            self.errors[value] = count
+            heapq.heapreplace(heap, (count + weight, next(self._sequence), value))
+
+        # Update count
+        self.count += weight
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _EXTEND
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _extend(self, values: Iterable[Any]) -> None:
+        """Adds values in chunks that are first counted exactly"""
+
+        # Get iterator
+        iterator = iter(values)
+
+        # Iterate over chunks
+        while chunk := Counter(itertools.islice(iterator, self.CHUNK)):
+            # Iterate over values of chunk and their counts
+            for value, weight in chunk.items():
+                # Add value
+                self._add(value, weight)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _REBUILD
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _rebuild(self) -> None:
+        """Rebuilds the heap and sequence counter from counts"""
+
+        # Initialize sequence counter
+        self._sequence = itertools.count(len(self.counts))
+
+        # Initialize heap
+        self._heap = [
+            (count, i, value) for i, (value, count) in enumerate(self.counts.items())
+        ]
+        heapq.heapify(self._heap)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ ADD
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def add(self, value: Any) -> None:
+        """Adds a value to the sketch"""
+
+        # Add value
+        self._add(value, 1)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ MERGE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def merge(self, other: SpaceSaving) -> SpaceSaving:
+        """Returns a new sketch of the values of both sketches
+
+        A value that only one sketch monitors is counted as the least count of the other
+        if that one is full, since the value could have been evicted from it.
+        """
+
+        # Raise ValueError if capacities differ
+        if other.k != self.k:
+            raise ValueError("Cannot merge Space-Saving sketches of different k")
+
+        # Get the count that each sketch could hide of an unmonitored value
+        floor = min(self.counts.values()) if len(self.counts) == self.k else 0
+        floor_other = min(other.counts.values()) if len(other.counts) == other.k else 0
+
+        # Initialize sketch
+        sketch = SpaceSaving(self.k)
+
+        # Get combined counts and errors of the values of both sketches
+        counts = {
+            value: self.counts.get(value, floor) + other.counts.get(value, floor_other)
+            for value in self.counts.keys() | other.counts.keys()
+        }
+        errors = {
+            value: self.errors.get(value, floor) + other.errors.get(value, floor_other)
+            for value in counts
+        }
+
+        # Keep the k most frequent values
+        for value in heapq.nlargest(self.k, counts, key=counts.__getitem__):
+            sketch.counts[value] = counts[value]
+            sketch.errors[value] = errors[value]
+
+        # Set count
+        sketch.count = self.count + other.count
+
+        # Rebuild heap
+        sketch._rebuild()
+
+        # Return sketch
+        return sketch
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ TOP
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def top(self, n: int | None = None) -> list[tuple[Hashable, int]]:
+        """Returns the n most frequent values and their estimated counts"""
+
+        # Return values and counts in descending order of count
+        return Counter(self.counts).most_common(n)
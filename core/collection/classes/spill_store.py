@@ -0,0 +1,436 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+import itertools
+import pickle
+import sqlite3
+import weakref
+
+from collections import OrderedDict
+from typing import Any, Iterable, Iterator, MutableMapping
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.placeholders import nothing
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ SPILL STORE
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class SpillStore(MutableMapping[int, Any]):
+    """An ordered mapping of items by ID that spills cold items to SQLite"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ CLASS ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Define the number of evicted items that are written to SQLite at once
+    SPILL_BATCH = 256
+
+    # Define the number of cold items that are read from SQLite at once
+    READ_BATCH = 512
+
+    # Define whether the objects of each type support weak references
+    WEAK_REFERENCES: dict[type, bool] = {}
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ INSTANCE ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Declare type of capacity of hot items
+    capacity: int
+
+    # Declare type of item IDs in insertion order and whether they have a row
+    _ids: dict[int, bool]
+
+    # Declare type of hot items by ID in least to most recently used order
+    _hot: OrderedDict[int, Any]
+
+    # Declare type of evicted items by ID that are not yet written
+    _pending: dict[int, Any]
+
+    # Declare type of the item IDs of the latest objects of items by object ID
+    _ids_by_object: dict[int, int]
+
+    # Declare type of the latest object ID of each item by ID, with a weak reference to
+    # the object where it supports one
+    _objects: dict[int, tuple[int, weakref.ref[Any] | None]]
+
+    # Declare type of item ID counter, whose IDs are negative so as not to clash
+    _counter: Iterator[int]
+
+    # Declare type of SQLite connection
+    _connection: sqlite3.Connection
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, capacity: int, path: str | None = None) -> None:
+        """Init Method"""
+
+        # Set capacity
+        self.capacity = max(1, capacity)
+
+        # Initialize item IDs, hot items, pending items and the objects of items
+        self._ids = {}
+        self._hot = OrderedDict()
+        self._pending = {}
+        self._ids_by_object = {}
+        self._objects = {}
+
+        # Initialize item ID counter
+        self._counter = itertools.count(-1, -1)
+
+        # Connect to SQLite, where an empty path is a temporary database on disk
+        self._connection = sqlite3.connect(path or "", isolation_level=None)
+
+        # Skip journaling and syncing, given that the store does not outlive process
+        self._connection.execute("PRAGMA journal_mode = OFF")
+        self._connection.execute("PRAGMA synchronous = OFF")
+
+        # Create items table
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS items (id INTEGER PRIMARY KEY, data BLOB)"
+        )
+
+        # Clear items left over in an existing database
+        self._connection.execute("DELETE FROM items")
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __CONTAINS__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __contains__(self, item_id: object) -> bool:
+        """Contains Method"""
+
+        # Return whether item ID is in store
+        return item_id in self._ids
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __DELITEM__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __delitem__(self, item_id: int) -> None:
+        """Delete Item Method"""
+
+        # Remove item ID, raising KeyError if it is not in store
+        stored = self._ids.pop(item_id)
+
+        # Remove item from hot or pending items
+        if self._hot.pop(item_id, nothing) is nothing:
+            self._pending.pop(item_id, None)
+
+        # Forget the object of item
+        self._untrack(item_id)
+
+        # Remove the row of item from SQLite if any
+        if stored:
+            self._connection.execute("DELETE FROM items WHERE id = ?", (item_id,))
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __GETITEM__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __getitem__(self, item_id: int) -> Any:
+        """Get Item Method"""
+
+        # Check if item is hot
+        if item_id in self._hot:
+            # Mark item as most recently used
+            self._hot.move_to_end(item_id)
+
+            # Return item
+            return self._hot[item_id]
+
+        # Raise KeyError if item ID is not in store
+        if item_id not in self._ids:
+            raise KeyError(item_id)
+
+        # Get item from pending items, which keeps its identity
+        item = self._pending.pop(item_id, nothing)
+
+        # Read item from SQLite if it was written, keeping its row to be replaced
+        if item is nothing:
+            item = self._load(item_id)
+
+        # Add item to hot items
+        self._admit(item_id, item)
+
+        # Return item
+        return item
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __ITER__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __iter__(self) -> Iterator[int]:
+        """Iterate Method"""
+
+        # Return iterator of item IDs in insertion order
+        return iter(self._ids)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __LEN__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __len__(self) -> int:
+        """Length Method"""
+
+        # Return length
+        return len(self._ids)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __REVERSED__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __reversed__(self) -> Iterator[int]:
+        """Reversed Method"""
+
+        # Return iterator of item IDs in reverse insertion order
+        return reversed(self._ids)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __SETITEM__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __setitem__(self, item_id: int, item: Any) -> None:
+        """Set Item Method"""
+
+        # Remove any previous item by ID
+        if item_id in self._ids:
+            del self[item_id]
+
+        # Add item ID, which does not have a row yet
+        self._ids[item_id] = False
+
+        # Add item to hot items
+        self._admit(item_id, item)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _ADMIT
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _admit(self, item_id: int, item: Any) -> None:
+        """Adds an item to hot items, evicting least recently used ones if full"""
+
+        # Add item to hot items
+        self._hot[item_id] = item
+
+        # Record the item ID of its object if it is not already the latest one
+        if self._ids_by_object.get(id(item)) != item_id:
+            self._track(item_id, item)
+
+        # Iterate while hot items exceed capacity
+        while len(self._hot) > self.capacity:
+            # Pop least recently used item, whose object stays recorded
+            item_id_evicted, item_evicted = self._hot.popitem(last=False)
+
+            # Add item to pending items
+            self._pending[item_id_evicted] = item_evicted
+
+        # Write pending items once there are enough to batch
+        if len(self._pending) >= self.SPILL_BATCH:
+            self.flush()
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _LOAD
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _load(self, item_id: int) -> Any:
+        """Reads an item from SQLite"""
+
+        # Get row
+        row = self._connection.execute(
+            "SELECT data FROM items WHERE id = ?", (item_id,)
+        ).fetchone()
+
+        # Return item
+        return pickle.loads(row[0])
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _TRACK
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _track(self, item_id: int, item: Any) -> None:
+        """Records an object as the latest one of an item, replacing any previous one"""
+
+        # Forget the previous object of item
+        self._untrack(item_id)
+
+        # Get whether the objects of type support weak references, e.g. dicts do not
+        weak = self.WEAK_REFERENCES.get(type(item))
+        if weak is None:
+            weak = self.WEAK_REFERENCES[type(item)] = self._weak(item)
+
+        # Get a weak reference to object, by which a reused object ID is told apart
+        reference = weakref.ref(item) if weak else None
+
+        # Record the item ID of object and the object of item
+        self._ids_by_object[id(item)] = item_id
+        self._objects[item_id] = (id(item), reference)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _UNTRACK
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _untrack(self, item_id: int) -> None:
+        """Forgets the latest object of an item"""
+
+        # Pop the object ID of item
+        object_id, _ = self._objects.pop(item_id, (None, None))
+
+        # Forget the item ID of object if it is still recorded for item
+        if object_id is not None and self._ids_by_object.get(object_id) == item_id:
+            del self._ids_by_object[object_id]
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _WEAK
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _weak(item: Any) -> bool:
+        """Returns whether an object supports weak references"""
+
+        # Initialize try-except block
+        try:
+            # Get a weak reference to object
+            weakref.ref(item)
+
+        # Return False if object does not support weak references
+        except TypeError:
+            return False
+
+        # Return True
+        return True
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ CLOSE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def close(self) -> None:
+        """Closes the SQLite connection, which deletes a temporary database"""
+
+        # Close connection
+        self._connection.close()
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ FLUSH
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def flush(self) -> None:
+        """Writes pending items to SQLite"""
+
+        # Return if there are no pending items
+        if not self._pending:
+            return
+
+        # Write pending items in a single statement
+        self._connection.executemany(
+            "INSERT OR REPLACE INTO items VALUES (?, ?)",
+            (
+                (item_id, pickle.dumps(item, protocol=pickle.HIGHEST_PROTOCOL))
+                for item_id, item in self._pending.items()
+            ),
+        )
+
+        # Mark pending items as having a row
+        self._ids.update(dict.fromkeys(self._pending, True))
+
+        # Clear pending items
+        self._pending.clear()
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ ITEM ID
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def item_id(self, item: Any) -> int:
+        """Returns the ID of the item of a live object, or a new ID that is not in store
+
+        The latest object of every item is recorded, whether it is hot or cold. As a
+        cold object may be gone and its ID reused, it must be that of a weak reference,
+        or else equal to the stored item.
+        """
+
+        # Get the item ID of object
+        item_id = self._ids_by_object.get(id(item))
+
+        # Return new item ID if object is not recorded
+        if item_id is None:
+            return next(self._counter)
+
+        # Return item ID if object is the hot or pending item of that ID
+        if self._hot.get(item_id) is item or self._pending.get(item_id) is item:
+            return item_id
+
+        # Get the weak reference to the object of item
+        _, reference = self._objects[item_id]
+
+        # Return item ID if object is still the one referenced
+        if reference is not None:
+            return item_id if reference() is item else next(self._counter)
+
+        # Return item ID if object is equal to the stored item, or else a new item ID
+        return item_id if self._load(item_id) == item else next(self._counter)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ ITEMS
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def items(  # type: ignore[override]
+        self, item_ids: Iterable[int] | None = None
+    ) -> Iterator[tuple[int, Any]]:
+        """Yields items by ID in order, reading cold items in batches without caching"""
+
+        # Get hot and pending items
+        hot, pending = self._hot, self._pending
+
+        # Get item IDs
+        item_ids = iter(self._ids if item_ids is None else item_ids)
+
+        # Iterate over batches of item IDs
+        while batch := list(itertools.islice(item_ids, self.READ_BATCH)):
+            # Get the IDs of the cold items of batch
+            cold = [i for i in batch if i not in hot and i not in pending]
+
+            # Initialize cold items by ID
+            items_cold: dict[int, Any] = {}
+
+            # Check if there are cold items
+            if cold:
+                # Read cold items from SQLite
+                items_cold = {
+                    item_id: pickle.loads(data)
+                    for item_id, data in self._connection.execute(
+                        "SELECT id, data FROM items WHERE id IN "
+                        f"({', '.join('?' * len(cold))})",
+                        cold,
+                    )
+                }
+
+            # Iterate over item IDs of batch
+            for item_id in batch:
+                # Yield item by ID, where a hot or pending item keeps its identity
+                if item_id in hot:
+                    yield item_id, hot[item_id]
+                elif item_id in pending:
+                    yield item_id, pending[item_id]
+                elif item_id in items_cold:
+                    yield item_id, items_cold[item_id]
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ VALUES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def values(self) -> Iterator[Any]:  # type: ignore[override]
+        """Yields items in order, reading cold items in batches without caching"""
+
+        # Yield items
+        for _, item in self.items():
+            yield item
@@ -0,0 +1,346 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+from typing import Any, Hashable, Iterable, Iterator, TypeVar
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.collection.classes.collection import Collection
+from core.collection.classes.collection_index import CollectionIndex
+from core.collection.classes.dict_collection import DictCollection
+from core.collection.classes.spill_store import SpillStore
+from core.collection.exceptions import DuplicateKeysError
+from core.placeholders import nothing
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TYPE VARIABLES
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+ItemBound = TypeVar("ItemBound", bound=Any)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ SPILLABLE DICT COLLECTION
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class SpillableDictCollection(DictCollection[ItemBound]):
+    """A dict collection that keeps its keys and a bounded LRU of hot items in memory
+
+    Cold items are pickled to SQLite and come back as copies, so mutate and reindex
+    items while they are hot, i.e. right after getting them from the collection. As a
+    copy is not the object that was added, an item is identified by its key values.
+    """
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ INSTANCE ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Declare type of items by ID
+    _items_by_id: SpillStore  # type: ignore[assignment]
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(
+        self,
+        keys: Iterable[str | Iterable[str]] | str | None = None,
+        indexes: Iterable[str | CollectionIndex] | None = None,
+        capacity: int = 10_000,
+        path: str | None = None,
+    ) -> None:
+        """Init Method"""
+
+        # Raise NotImplementedError if secondary indexes are given, which hold items
+        if indexes:
+            raise NotImplementedError(
+                "SpillableDictCollection does not support secondary indexes"
+            )
+
+        # Initialize dict collection
+        super().__init__(keys=keys)
+
+        # Set items by ID to a store of at most capacity hot items
+        self._items_by_id = SpillStore(capacity, path=path)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __GETSTATE__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Get State Method"""
+
+        # Raise TypeError, given that cold items live in a database of this process
+        raise TypeError("SpillableDictCollection cannot be pickled")
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __ITER__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __iter__(self) -> Iterator[ItemBound]:
+        """Iterate Method"""
+
+        # Return iterator of items, reading cold items in batches without caching them
+        return self._items_by_id.values()
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __OR__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __or__(self, other: Any) -> SpillableDictCollection[ItemBound]:
+        """Or Method"""
+
+        # Return generic union, given that the item IDs of other are not those of store
+        return Collection.__or__(self, other)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _COPY
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _copy(self, item_ids: Iterable[int] | None = None) -> DictCollection[ItemBound]:
+        """Returns a shallow copy of all items, or of items by ID, with a new store"""
+
+        # Initialize collection
+        collection = self.New()
+
+        # Get the IDs of the items to copy in collection order
+        if item_ids is not None:
+            item_ids = item_ids if isinstance(item_ids, (set, dict)) else set(item_ids)
+            item_ids = [item_id for item_id in self._items_by_id if item_id in item_ids]
+
+        # Add items to collection, streaming cold items
+        collection.add_many(item for _, item in self._items_by_id.items(item_ids))
+
+        # Return collection
+        return collection
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _FIND IDS
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _find_ids(self, other: DictCollection[Any]) -> set[int]:
+        """Returns the IDs of the items whose key values are in another collection"""
+
+        # Return all item IDs if other is the collection itself
+        if other is self:
+            return set(self._items_by_id)
+
+        # Get the item IDs by key of other collection
+        item_ids_by_key = other._item_ids_by_key
+
+        # Return the IDs of the items that have a key value in other collection
+        return {
+            item_id
+            for item_id, key_values in self._key_values_by_id.items()
+            if any(key_value in item_ids_by_key for key_value in key_values)
+        }
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _IS COMPATIBLE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _is_compatible(self, other: Any) -> bool:
+        """Returns whether another collection is the same or shares the same keys
+
+        Item IDs are local to each store, so items are found in other collections by
+        their stored key values rather than by ID.
+        """
+
+        # Return whether other is the collection itself or a keyed one of the same keys
+        return other is self or (
+            isinstance(other, DictCollection)
+            and bool(self._keys)
+            and other._keys == self._keys
+        )
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _ITEM ID
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _item_id(self, item: Any) -> int:
+        """Returns the ID by which an item is stored, resolving copies by key values"""
+
+        # Iterate over key getters
+        for getter in self._key_getters:
+            # Get key value
+            key_value = getter(item)
+
+            # Continue if key value is missing or None, which add does not store
+            if key_value is nothing or key_value is None:
+                continue
+
+            # Initialize try-except block
+            try:
+                # Get the ID of the item that has key value
+                item_id = self._item_ids_by_key.get(key_value)
+
+            # Handle unhashable key values, which no item has
+            except TypeError:
+                break
+
+            # Return item ID if that item has exactly the same key values
+            if item_id is not None and self._key_values_by_id.get(
+                item_id
+            ) == self._key_values(item):
+                return item_id
+
+            # Break, given that only the first key value is needed to find an item
+            break
+
+        # Return the ID of the item of a live object, or a new one
+        return self._items_by_id.item_id(item)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _KEY VALUES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _key_values(self, item: Any) -> tuple[Any, ...]:
+        """Returns the key values of an item as add stores them"""
+
+        # Return distinct key values, skipping missing and None
+        return tuple(
+            dict.fromkeys(
+                key_value
+                for key_value in (getter(item) for getter in self._key_getters)
+                if key_value is not nothing and key_value is not None
+            )
+        )
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ NEW
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def New(self, *args: Any, **kwargs: Any) -> SpillableDictCollection[ItemBound]:
+        """Returns a new collection"""
+
+        # Check if keys not in kwargs
+        if "keys" not in kwargs:
+            # Add keys to kwargs
+            kwargs["keys"] = self._keys
+
+        # Check if capacity not in kwargs
+        if "capacity" not in kwargs:
+            # Add capacity to kwargs
+            kwargs["capacity"] = self._items_by_id.capacity
+
+        # Return new collection
+        return SpillableDictCollection(*args, **kwargs)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ ADD INDEX
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def add_index(self, *indexes: str | CollectionIndex) -> None:
+        """Adds and builds secondary indexes"""
+
+        # Raise NotImplementedError
+        raise NotImplementedError(
+            "SpillableDictCollection does not support secondary indexes"
+        )
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ ADD MANY
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def add_many(self, items: Iterable[ItemBound]) -> int:
+        """Adds an iterable of items atomically, reporting all duplicate keys at once
+
+        Items are written to the store as they are read, so that only their key values
+        are held until all of them are checked. If any key value is duplicated, the
+        items written so far are removed again.
+        """
+
+        # Get key getters, items by ID and item IDs by key
+        key_getters, items_by_id = self._key_getters, self._items_by_id
+        item_ids_by_key = self._item_ids_by_key
+
+        # Initialize the IDs of the items written and new item IDs by key
+        item_ids_new: dict[int, None] = {}
+        item_ids_by_key_new: dict[Hashable, int] = {}
+
+        # Initialize duplicate key values
+        duplicates: list[Any] = []
+
+        # Iterate over items in a single pass, which allows generators
+        for item in items:
+            # Continue if item is None
+            if item is None:
+                continue
+
+            # Get item ID, which is that of a written item if it is the same object
+            item_id = self._item_id(item)
+
+            # Continue if item is already in collection or has been written
+            if item_id in items_by_id:
+                continue
+
+            # Iterate over key getters
+            for getter in key_getters:
+                # Get key value
+                key_value = getter(item)
+
+                # Continue if key value is nothing
+                if key_value is nothing:
+                    continue
+
+                # Append duplicate if key value is already in collection, or belongs to
+                # another item that has been read rather than to another key of this one
+                if (
+                    key_value in item_ids_by_key
+                    or item_ids_by_key_new.get(key_value, item_id) != item_id
+                ):
+                    duplicates.append(key_value)
+
+                # Otherwise add key value to new item IDs by key if not None
+                elif key_value is not None:
+                    item_ids_by_key_new[key_value] = item_id
+
+            # Continue if there are duplicates, only checking the key values of the rest
+            if duplicates:
+                continue
+
+            # Write item to store, which spills the least recently added items
+            items_by_id[item_id] = item
+            item_ids_new[item_id] = None
+
+        # Check if there are duplicates
+        if duplicates:
+            # Remove the items written, leaving the collection as it was
+            for item_id in item_ids_new:
+                del items_by_id[item_id]
+
+            # Raise DuplicateKeysError
+            raise DuplicateKeysError(duplicates)
+
+        # Update item IDs by key
+        item_ids_by_key.update(item_ids_by_key_new)
+
+        # Get key values by item ID
+        key_values_by_id = self._key_values_by_id
+
+        # Iterate over new item IDs by key
+        for key_value, item_id in item_ids_by_key_new.items():
+            # Store key value so that it can be updated or removed after a mutation
+            key_values_by_id[item_id] = key_values_by_id.get(item_id, ()) + (key_value,)
+
+        # Record the insertion positions of items, as there are no secondary indexes
+        self._index_add_many(item_ids_new)
+
+        # Return count
+        return len(item_ids_new)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ CLOSE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def close(self) -> None:
+        """Closes the store, which deletes a temporary database"""
+
+        # Close store
+        self._items_by_id.close()
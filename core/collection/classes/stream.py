@@ -0,0 +1,372 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+import itertools
+
+from collections import deque
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Generic,
+    Hashable,
+    Iterable,
+    Iterator,
+    TypeVar,
+)
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.collection.classes.filter_plan import FilterPlan
+from core.collection.classes.filter_statistics import FilterStatistics
+from core.collection.classes.sketch import Sketch
+from core.object.functions.ogetter import ogetter
+
+if TYPE_CHECKING:
+    from core.collection.classes.collection import Collection
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TYPE VARIABLES
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+ItemBound = TypeVar("ItemBound", bound=Any)
+ReturnBound = TypeVar("ReturnBound")
+SketchBound = TypeVar("SketchBound", bound=Sketch)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ STREAM
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class Stream(Generic[ItemBound]):
+    """A lazy, single-pass pipeline of stages over a collection or any iterable"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ CLASS ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Define the number of items that collect adds to a collection at once
+    COLLECT_BATCH = 1024
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ INSTANCE ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Declare type of items
+    items: Iterable[ItemBound]
+
+    # Declare type of the collection the stream is rooted in
+    source: Collection[Any] | None
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(
+        self, items: Iterable[ItemBound], source: Collection[Any] | None = None
+    ) -> None:
+        """Init Method"""
+
+        # Set items
+        self.items = items
+
+        # Set source
+        self.source = source
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __ITER__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __iter__(self) -> Iterator[ItemBound]:
+        """Iterate Method"""
+
+        # Return iterator of items
+        return iter(self.items)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __REPR__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __repr__(self) -> str:
+        """Representation Method"""
+
+        # Return representation
+        return f"<{self.__class__.__name__}: {self.items.__class__.__name__}>"
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _CHAIN
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _chain(self, items: Iterable[ReturnBound]) -> Stream[ReturnBound]:
+        """Returns a stream of the items of a further stage"""
+
+        # Return stream, keeping the collection it is rooted in
+        return Stream(items, source=self.source)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _FREEZE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _freeze(value: Any) -> Hashable:
+        """Returns a hashable form of a value made of dicts, lists, tuples and sets
+
+        Raises TypeError if the value holds an unhashable object of any other type.
+        """
+
+        # Return a tagged frozenset of items if value is a dict
+        if isinstance(value, dict):
+            return (dict, frozenset((k, Stream._freeze(v)) for k, v in value.items()))
+
+        # Return a tagged tuple of values if value is a list or a tuple
+        if isinstance(value, (list, tuple)):
+            return (
+                list if isinstance(value, list) else tuple,
+                tuple(map(Stream._freeze, value)),
+            )
+
+        # Return a tagged frozenset if value is a set
+        if isinstance(value, set):
+            return (set, frozenset(value))
+
+        # Hash value, which raises TypeError if it is unhashable
+        hash(value)
+
+        # Return value
+        return value
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ FROM ITERABLE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    @classmethod
+    def from_iterable(cls, items: Iterable[ItemBound]) -> Stream[ItemBound]:
+        """Returns a stream of an iterable, such as a generator of fetched items"""
+
+        # Return stream
+        return cls(items)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ BATCH
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def batch(self, n: int) -> Stream[list[ItemBound]]:
+        """Returns a stream of consecutive lists of up to n items"""
+
+        # Raise ValueError if n is not positive
+        if n < 1:
+            raise ValueError("Batch size must be at least 1")
+
+        # Define batch generator
+        def batches(items: Iterator[ItemBound]) -> Iterator[list[ItemBound]]:
+            """Yields lists of up to n items"""
+
+            # Yield batches until items are exhausted
+            while batch := list(itertools.islice(items, n)):
+                yield batch
+
+        # Return stream of batches
+        return self._chain(batches(iter(self.items)))
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ COLLECT
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def collect(self, into: Collection[Any] | None = None) -> Collection[Any]:
+        """Adds the items of the stream to a collection, or to a new one of source"""
+
+        # Check if collection is not given
+        if into is None:
+            # Raise ValueError if there is no source collection to create one from
+            if self.source is None:
+                raise ValueError(
+                    "A collection to collect into is required for streams of iterables"
+                )
+
+            # Set collection to a new one of source
+            into = self.source.New()
+
+        # Get items
+        items = iter(self.items)
+
+        # Add items in batches, so that only a batch is held besides the collection
+        while batch := list(itertools.islice(items, self.COLLECT_BATCH)):
+            into.add(*batch)
+
+        # Return collection
+        return into
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ DEDUPE BY
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def dedupe_by(self, *paths: str) -> Stream[ItemBound]:
+        """Returns a stream of the first item of each value of paths, or of each item
+
+        The values seen so far are kept, so memory grows with distinct values only.
+        Unhashable values, such as dict items or list values, are compared by a
+        frozen form, or by equality if they hold other unhashable objects.
+        """
+
+        # Get getters of paths
+        getters = tuple(ogetter(path, default=None) for path in paths)
+
+        # Define key function
+        def key(item: Any) -> Hashable:
+            """Returns the value of paths of an item, or the item itself"""
+
+            # Return item if there are no paths
+            if not getters:
+                return item
+
+            # Return the value of a single path
+            if len(getters) == 1:
+                return getters[0](item)
+
+            # Return a tuple of the values of paths
+            return tuple(getter(item) for getter in getters)
+
+        # Define deduplicating generator
+        def deduped(items: Iterable[ItemBound]) -> Iterator[ItemBound]:
+            """Yields items whose key value has not been seen"""
+
+            # Initialize seen key values, and frozen forms of unhashable key values
+            seen: set[Hashable] = set()
+            frozen: set[Hashable] = set()
+
+            # Initialize key values that cannot be frozen, compared by equality
+            unhashable: list[Any] = []
+
+            # Iterate over items
+            for item in items:
+                # Get key value
+                value = key(item)
+
+                # Check if key value is hashable
+                try:
+                    # Continue if key value has been seen
+                    if value in seen:
+                        continue
+
+                    # Add key value to seen key values
+                    seen.add(value)
+
+                # Handle unhashable key value, such as a dict item or a list path value
+                except TypeError:
+                    # Check if key value can be frozen
+                    try:
+                        value = self._freeze(value)
+
+                    # Handle key value that cannot be frozen
+                    except TypeError:
+                        # Continue if an equal key value has been seen
+                        if value in unhashable:
+                            continue
+
+                        # Add key value to key values that cannot be frozen
+                        unhashable.append(value)
+
+                    # Handle frozen key value
+                    else:
+                        # Continue if frozen key value has been seen
+                        if value in frozen:
+                            continue
+
+                        # Add frozen key value to frozen key values
+                        frozen.add(value)
+
+                # Yield item
+                yield item
+
+        # Return stream of deduplicated items
+        return self._chain(deduped(self.items))
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ FILTER
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def filter(
+        self, func: Callable[[ItemBound], Any] | None = None, **kwargs: Any
+    ) -> Stream[ItemBound]:
+        """Returns a stream of items that meet a predicate and filter keyword args"""
+
+        # Get items
+        items: Iterable[ItemBound] = self.items
+
+        # Filter items by predicate if any
+        if func is not None:
+            items = filter(func, items)
+
+        # Get a compiled filter plan
+        plan = FilterPlan.from_kwargs(kwargs)
+
+        # Filter items by plan if it has conditions, reordered by the statistics of the
+        # source collection or by those of the stream alone
+        if plan:
+            items = plan.filter(
+                items,
+                (
+                    FilterStatistics()
+                    if self.source is None
+                    else self.source._filter_statistics()
+                ),
+            )
+
+        # Return stream of filtered items
+        return self._chain(items)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ MAP
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def map(self, func: Callable[[ItemBound], ReturnBound]) -> Stream[ReturnBound]:
+        """Returns a stream of the results of a function applied to each item"""
+
+        # Return stream of results
+        return self._chain(map(func, self.items))
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ SKETCH
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def sketch(self, sketch: SketchBound, path: str | None = None) -> SketchBound:
+        """Adds the items, or the values of a path that are not None, to a sketch"""
+
+        # Return sketch
+        return sketch.extend(self.items, path)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ WINDOW
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def window(self, n: int, step: int = 1) -> Stream[tuple[ItemBound, ...]]:
+        """Returns a stream of sliding tuples of n items, one every step items"""
+
+        # Raise ValueError if n or step is not positive
+        if n < 1 or step < 1:
+            raise ValueError("Window size and step must be at least 1")
+
+        # Define window generator
+        def windows(items: Iterable[ItemBound]) -> Iterator[tuple[ItemBound, ...]]:
+            """Yields full windows of items"""
+
+            # Initialize window
+            window: deque[ItemBound] = deque(maxlen=n)
+
+            # Iterate over items, counting those added since the last window
+            for i, item in enumerate(items, 1):
+                # Add item to window, which drops the oldest item once full
+                window.append(item)
+
+                # Yield window if it is full and step items were added since the last
+                if len(window) == n and (i - n) % step == 0:
+                    yield tuple(window)
+
+        # Return stream of windows
+        return self._chain(windows(self.items))
@@ -0,0 +1,239 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+from typing import Any
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.collection.classes.collection_index import CollectionIndex
+from core.collection.classes.filter_condition import FilterCondition
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TRIGRAM INDEX
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class TrigramIndex(CollectionIndex):
+    """A secondary index of collection items by the trigrams of a string path value
+
+    Trigrams are case-folded, so that a single index serves case-sensitive and
+    case-insensitive substring filters. The items whose posting lists contain every
+    trigram of the expected value are candidates that are then checked exactly.
+    """
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ CLASS ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Define filter operators that can be served by the index
+    OPERATORS = frozenset(("__contains", "__icontains"))
+
+    # Define the length of a gram
+    N = 3
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ INSTANCE ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Declare type of item ID posting lists by trigram
+    _postings: dict[str, set[int]]
+
+    # Declare type of string items by ID
+    _items: dict[int, Any]
+
+    # Declare type of items by ID whose value is not a string, such as a list
+    _others: dict[int, Any]
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, path: str) -> None:
+        """Init Method"""
+
+        # Initialize index
+        super().__init__(path)
+
+        # Initialize posting lists, string items and other items
+        self._postings = {}
+        self._items = {}
+        self._others = {}
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _ADD
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _add(self, item_id: int, item: Any, value: Any) -> bool:
+        """Adds an item by value and returns whether it was indexed"""
+
+        # Check if value is not a string
+        if not isinstance(value, str):
+            # Add item to other items, which are checked on every lookup
+            self._others[item_id] = item
+
+            # Return True
+            return True
+
+        # Get posting lists
+        postings = self._postings
+
+        # Iterate over trigrams
+        for gram in self._grams(value):
+            # Get posting list
+            posting = postings.get(gram)
+
+            # Add item ID to posting list, creating it only if it does not exist
+            if posting is None:
+                postings[gram] = {item_id}
+            else:
+                posting.add(item_id)
+
+        # Add item to string items
+        self._items[item_id] = item
+
+        # Return True
+        return True
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _CLEAR
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _clear(self) -> None:
+        """Clears the index structures"""
+
+        # Clear posting lists, string items and other items
+        self._postings.clear()
+        self._items.clear()
+        self._others.clear()
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _GRAMS
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    @classmethod
+    def _grams(cls, value: str) -> set[str]:
+        """Returns the distinct case-folded trigrams of a string"""
+
+        # Case-fold value, which unlike lowercasing maps each character on its own
+        value = value.casefold()
+
+        # Return trigrams
+        return {
+            value[i : i + cls.N] for i in range(len(value) - cls.N + 1)  # noqa: E203
+        }
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _LOOKUP
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _lookup(self, condition: FilterCondition) -> dict[int, Any] | None:
+        """Returns items by ID that meet a condition or None if it cannot be served"""
+
+        # Get operator and expected value
+        operator, expected = condition.operator, condition.expected
+
+        # Return None if operator is not served or expected value has no trigram
+        if (
+            operator not in self.OPERATORS
+            or not isinstance(expected, str)
+            or len(expected) < self.N
+        ):
+            return None
+
+        # Get the posting lists of the trigrams of expected value, smallest first
+        postings = sorted(
+            (self._postings.get(gram, set()) for gram in self._grams(expected)),
+            key=len,
+        )
+
+        # Intersect posting lists, stopping once no candidate is left
+        item_ids = postings[0].copy()
+        for posting in postings[1:]:
+            if not item_ids:
+                break
+            item_ids &= posting
+
+        # Get string items and stored values
+        items, values = self._items, self._values_by_id
+
+        # Get whether values should be lowercased, given a lowercased expected value
+        lower = operator == "__icontains"
+
+        # Get candidate items whose stored value contains the expected value
+        items_met = {
+            item_id: items[item_id]
+            for item_id in item_ids
+            if expected in (values[item_id].lower() if lower else values[item_id])
+        }
+
+        # Add other items that meet condition
+        items_met.update(
+            (item_id, item) for item_id, item in self._others.items() if condition(item)
+        )
+
+        # Return items
+        return items_met
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _REMAP
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _remap(self, item_ids: dict[int, int] | list[int]) -> None:
+        """Replaces the item IDs of posting lists and items by what they map to"""
+
+        # Replace the item IDs of posting lists
+        self._postings = {
+            gram: set(map(item_ids.__getitem__, posting))
+            for gram, posting in self._postings.items()
+        }
+
+        # Replace the item IDs of string items and other items
+        self._items = dict(
+            zip(map(item_ids.__getitem__, self._items), self._items.values())
+        )
+        self._others = dict(
+            zip(map(item_ids.__getitem__, self._others), self._others.values())
+        )
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _REMOVE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _remove(self, item_id: int, value: Any) -> None:
+        """Removes an item by its indexed value"""
+
+        # Check if value is not a string
+        if not isinstance(value, str):
+            # Remove item from other items
+            self._others.pop(item_id, None)
+
+            # Return
+            return
+
+        # Get posting lists
+        postings = self._postings
+
+        # Iterate over trigrams
+        for gram in self._grams(value):
+            # Get posting list
+            posting = postings.get(gram)
+
+            # Continue if posting list does not exist
+            if posting is None:
+                continue
+
+            # Remove item ID from posting list
+            posting.discard(item_id)
+
+            # Remove posting list if empty
+            if not posting:
+                del postings[gram]
+
+        # Remove item from string items
+        self._items.pop(item_id, None)
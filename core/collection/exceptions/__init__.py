@@ -27,6 +27,31 @@ class DuplicateKeyError(Exception):
         self.key_value = key_value
 
 
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ DUPLICATE KEYS ERROR
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class DuplicateKeysError(DuplicateKeyError):
+    """Raised when one or more duplicate keys are detected in a batch of resources"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, key_values: list[Any]) -> None:
+        """Init Method"""
+
+        # Initialize the exception with the first key value
+        super().__init__(key_values[0])
+
+        # Set the exception message with all key values
+        self.args = (f"Duplicate keys detected: {key_values!r}",)
+
+        # Set the key values
+        self.key_values = key_values
+
+
 # ┌─────────────────────────────────────────────────────────────────────────────────────
 # │ MUTIPLE ITEMS ERROR
 # └─────────────────────────────────────────────────────────────────────────────────────
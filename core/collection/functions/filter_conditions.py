@@ -2,6 +2,7 @@
 # │ GENERAL IMPORTS
 # └─────────────────────────────────────────────────────────────────────────────────────
 
+from functools import lru_cache
 from typing import Any, Callable, Generator
 
 # ┌─────────────────────────────────────────────────────────────────────────────────────
@@ -25,6 +26,13 @@ from core.collection.functions.filter_checkers import (
     check_iendswith,
 )
 
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TYPE ALIASES
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Define a filter checker type alias
+FilterChecker = Callable[[Any, Any], bool]
+
 
 # ┌─────────────────────────────────────────────────────────────────────────────────────
 # │ OPERATORS
@@ -48,25 +56,53 @@ OPERATORS = (
     ("__iendswith", 11, check_iendswith),
 )
 
+# Define checkers by operator
+CHECKERS: dict[str, FilterChecker] = {
+    operator: checker for operator, _, checker in OPERATORS
+}
+
+# Define case-sensitive checkers by case-insensitive operator
+CHECKERS_CASE_SENSITIVE: dict[str, FilterChecker] = {
+    "__icontains": check_contains,
+    "__ieq": check_eq,
+    "__iin": check_in,
+    "__istartswith": check_startswith,
+    "__iendswith": check_endswith,
+}
+
 # ┌─────────────────────────────────────────────────────────────────────────────────────
-# │ GET FILTER CONDITION
+# │ GET FILTER KEY
 # └─────────────────────────────────────────────────────────────────────────────────────
 
 
-def get_filter_condition(
-    key: str, value: Any
-) -> tuple[str, Any, str, Callable[[Any, Any], bool]]:
-    """Returns a filter condition tuple based on a key and value"""
+@lru_cache(maxsize=1024)
+def get_filter_key(key: str) -> tuple[str, str, FilterChecker]:
+    """Returns a path, operator and checker tuple based on a filter key"""
 
     # Iterate over operators
     for operator, char_count, checker in OPERATORS:
         # Check if key ends with operator
         if key.endswith(operator):
-            # Return filter condition
-            return (key[:-char_count], value, "__gte", checker)
+            # Return path, operator and checker
+            return (key[:-char_count], operator, checker)
+
+    # Return equality as default
+    return (key, "__eq", check_eq)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GET FILTER CONDITION
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def get_filter_condition(key: str, value: Any) -> tuple[str, Any, str, FilterChecker]:
+    """Returns a filter condition tuple based on a key and value"""
+
+    # Get path, operator and checker
+    path, operator, checker = get_filter_key(key)
 
-    # Return equality condition as default
-    return (key, value, "__eq", check_eq)
+    # Return filter condition
+    return (path, value, operator, checker)
 
 
 # ┌─────────────────────────────────────────────────────────────────────────────────────
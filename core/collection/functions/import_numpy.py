@@ -0,0 +1,31 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+from functools import lru_cache
+from types import ModuleType
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ IMPORT NUMPY
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+@lru_cache(maxsize=None)
+def import_numpy() -> ModuleType | None:
+    """Returns the NumPy module, or None if it is not installed
+
+    NumPy is imported on first use rather than at import time, so that importing a
+    collection does not pay for it unless a vectorized path is taken.
+    """
+
+    # Import NumPy if it is installed
+    try:
+        import numpy
+    except ImportError:
+        return None
+
+    # Return NumPy
+    return numpy
@@ -0,0 +1,34 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+from typing import Any, Callable, Iterable
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ FILTER PARTITION
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def filter_partition(func: Callable[[Any], Any], partition: Iterable[Any]) -> list[int]:
+    """Returns the positions of the items of a partition that meet a predicate
+
+    Positions rather than items are returned so that a worker process does not send
+    copies of the items back, and so that the caller keeps the original items.
+    """
+
+    # Return positions of items that meet predicate
+    return [i for i, item in enumerate(partition) if func(item)]
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ MAP PARTITION
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def map_partition(func: Callable[[Any], Any], partition: Iterable[Any]) -> list[Any]:
+    """Returns the results of a function applied to the items of a partition"""
+
+    # Return results
+    return [func(item) for item in partition]
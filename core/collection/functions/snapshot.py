@@ -0,0 +1,201 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+import gc
+import io
+import os
+import pickle
+import struct
+
+from array import array
+from mmap import ACCESS_COPY
+from mmap import mmap as MemoryMap
+from typing import Any
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ CONSTANTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Define the header of a snapshot, i.e. magic bytes, pickle size and buffer count
+HEADER = struct.Struct("=8sQQ")
+
+# Define the magic bytes of a snapshot
+MAGIC = b"CORESNAP"
+
+# Define the alignment of out-of-band buffers in a snapshot
+ALIGNMENT = 64
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ LOAD ARRAY
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def load_array(typecode: str, buffer: Any) -> array[Any]:
+    """Returns an array of a typecode from a buffer"""
+
+    # Initialize array
+    values = array(typecode)
+
+    # Copy buffer into array
+    values.frombytes(buffer)
+
+    # Return array
+    return values
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ SNAPSHOT PICKLER
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class SnapshotPickler(pickle.Pickler):
+    """A pickler that writes typed arrays as out-of-band buffers"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ REDUCER OVERRIDE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def reducer_override(self, obj: Any) -> Any:
+        """Reduces an array to its typecode and a buffer of its values"""
+
+        # Return NotImplemented if object is not an array
+        if type(obj) is not array:
+            return NotImplemented
+
+        # Return reduction
+        return load_array, (obj.typecode, pickle.PickleBuffer(obj))
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ DUMP SNAPSHOT
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def dump_snapshot(obj: Any, path: str) -> int:
+    """Writes an object to a snapshot file and returns its size in bytes
+
+    The object is pickled with protocol 5, where out-of-band buffers such as those of
+    arrays are written after the pickle, each aligned so that it can be mapped.
+    """
+
+    # Initialize out-of-band buffers
+    buffers: list[pickle.PickleBuffer] = []
+
+    # Initialize pickle stream
+    stream = io.BytesIO()
+
+    # Pickle object, collecting out-of-band buffers instead of copying them
+    SnapshotPickler(stream, protocol=5, buffer_callback=buffers.append).dump(obj)
+
+    # Get pickle
+    data = stream.getbuffer()
+
+    # Get a flat view of each buffer
+    views = [buffer.raw() for buffer in buffers]
+
+    # Get a temporary path, so that an existing snapshot is only replaced once written
+    path_temporary = f"{path}.tmp"
+
+    # Open temporary file
+    with open(path_temporary, "wb") as file:
+        # Write header, pickle and buffer sizes
+        file.write(HEADER.pack(MAGIC, len(data), len(views)))
+        file.write(data)
+        file.write(struct.pack(f"={len(views)}Q", *(view.nbytes for view in views)))
+
+        # Iterate over buffers
+        for view in views:
+            # Write padding and buffer
+            file.write(bytes(-file.tell() % ALIGNMENT))
+            file.write(view)
+
+        # Get size
+        size = file.tell()
+
+    # Replace any existing snapshot
+    os.replace(path_temporary, path)
+
+    # Return size
+    return size
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ LOAD SNAPSHOT
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def load_snapshot(path: str, mmap: bool = False) -> Any:
+    """Reads an object from a snapshot file
+
+    With mmap, out-of-band buffers are copy-on-write views of the mapped file, so that
+    their pages are only read when accessed. Otherwise they are read into memory.
+    """
+
+    # Open file
+    with open(path, "rb") as file:
+        # Read header
+        magic, size, count = HEADER.unpack(file.read(HEADER.size))
+
+        # Raise ValueError if file is not a snapshot
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a collection snapshot")
+
+        # Get the offset of buffers in file
+        offset = HEADER.size + size + 8 * count
+
+        # Check if file should be mapped
+        if mmap:
+            # Map file, starting views at the beginning of file
+            view = memoryview(MemoryMap(file.fileno(), 0, access=ACCESS_COPY))
+            start = 0
+
+            # Get pickle and buffer sizes
+            data: Any = view[HEADER.size : HEADER.size + size]  # noqa: E203
+            sizes = struct.unpack_from(f"={count}Q", view, HEADER.size + size)
+
+        # Otherwise read file
+        else:
+            # Read pickle and buffer sizes
+            data = file.read(size)
+            sizes = struct.unpack(f"={count}Q", file.read(8 * count))
+
+            # Read buffers into a writable region, starting views at their offset
+            view = memoryview(bytearray(os.fstat(file.fileno()).st_size - offset))
+            file.readinto(view)
+            start = offset
+
+    # Initialize out-of-band buffers
+    buffers = []
+
+    # Iterate over buffer sizes
+    for buffer_size in sizes:
+        # Skip padding
+        offset += -offset % ALIGNMENT
+
+        # Append a view of buffer
+        buffers.append(
+            view[offset - start : offset - start + buffer_size]  # noqa: E203
+        )
+
+        # Move to the next buffer
+        offset += buffer_size
+
+    # Get whether garbage collection is enabled
+    enabled = gc.isenabled()
+
+    # Disable garbage collection, which unpickling many objects would trigger in vain
+    gc.disable()
+
+    # Initialize try-finally block
+    try:
+        # Return object
+        return pickle.loads(data, buffers=buffers)
+
+    # Enable garbage collection if it was enabled
+    finally:
+        if enabled:
+            gc.enable()
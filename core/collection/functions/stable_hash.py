@@ -0,0 +1,45 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+from hashlib import blake2b
+from typing import Any
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ CONSTANTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Define a mask of 64 bits
+MASK = (1 << 64) - 1
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ STABLE HASH
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def stable_hash(value: Any) -> int:
+    """Returns a 64-bit hash of a value that is the same in every process
+
+    Unlike hash, which is salted per process for strings, this lets sketches built in
+    worker processes be merged. Numbers, whose hash is not salted, are mixed by
+    arithmetic, while other values are digested by their bytes or repr, so they should
+    be strings, bytes or tuples of primitives.
+    """
+
+    # Check if value is a number
+    if isinstance(value, (int, float)):
+        # Return the hash of number, mixed by the SplitMix64 finalizer
+        h = (hash(value) + 0x9E3779B97F4A7C15) & MASK
+        h = ((h ^ (h >> 30)) * 0xBF58476D1CE4E5B9) & MASK
+        h = ((h ^ (h >> 27)) * 0x94D049BB133111EB) & MASK
+        return h ^ (h >> 31)
+
+    # Get value as bytes
+    if not isinstance(value, bytes):
+        value = (value if isinstance(value, str) else repr(value)).encode()
+
+    # Return hash
+    return int.from_bytes(blake2b(value, digest_size=8).digest(), "little")
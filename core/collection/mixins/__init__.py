@@ -0,0 +1,7 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.collection.mixins.indexed_collection_mixin import (  # noqa: F401
+    IndexedCollectionMixin as IndexedCollectionMixin,
+)
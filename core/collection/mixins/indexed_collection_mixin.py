@@ -0,0 +1,483 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+import heapq
+import itertools
+
+from copy import copy
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, cast
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.collection.classes.collection_index import CollectionIndex
+from core.collection.classes.filter_condition import FilterCondition
+from core.collection.classes.filter_plan import FilterPlan
+from core.collection.classes.hash_index import HashIndex
+from core.collection.classes.prefix_index import PrefixIndex
+from core.collection.classes.sorted_index import SortedIndex
+from core.object.functions.ogetter import ogetter
+
+if TYPE_CHECKING:
+    from core.collection.classes.collection import Collection
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ INDEXED COLLECTION MIXIN
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class IndexedCollectionMixin:
+    """A collection mixin that maintains secondary indexes of items"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ INSTANCE ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Declare type of indexes
+    _indexes: tuple[CollectionIndex, ...]
+
+    # Declare type of insertion positions by item ID, used to restore collection order
+    _positions: dict[int, int] | None
+
+    # Declare type of insertion position counter
+    _position_counter: Iterator[int]
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _CANDIDATES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _candidates(self, plan: FilterPlan) -> tuple[list[Any] | None, FilterPlan]:
+        """Returns candidate items in collection order and the residual plan"""
+
+        # Lookup candidate items and residual plan by index
+        items, plan_residual = self._lookup(plan)
+
+        # Return None if no condition could be served by an index
+        if items is None:
+            return None, plan
+
+        # Get insertion positions
+        positions = self._positions
+
+        # Check if candidate items should be restored to collection order
+        if positions is not None and len(items) > 1:
+            # Return candidate items in collection order
+            return [
+                items[item_id] for item_id in sorted(items, key=positions.__getitem__)
+            ], plan_residual
+
+        # Return candidate items
+        return list(items.values()), plan_residual
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _COPY INDEXES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _copy_indexes(
+        self, source: IndexedCollectionMixin, items_by_id: dict[int, Any]
+    ) -> None:
+        """Sets the secondary indexes to copies of those of a source collection"""
+
+        # Set indexes to copies restricted to items by ID
+        self._indexes = tuple(index.copy(items_by_id) for index in source._indexes)
+
+        # Check if insertion positions are tracked
+        if self._positions is not None:
+            # Set insertion positions in order of items by ID
+            self._positions = dict(zip(items_by_id, self._position_counter))
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _FILTER
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _filter(self, plan: FilterPlan) -> Iterator[Any]:
+        """Yields the items of the collection that meet a filter plan"""
+
+        # Get collection and its filter statistics
+        collection = cast("Collection[Any]", self)
+        statistics = collection._filter_statistics()
+
+        # Get candidate items and residual plan
+        items, plan_residual = self._candidates(plan)
+
+        # Return items that meet the plan if no condition could be served by an index
+        if items is None:
+            return plan.filter(collection, statistics)
+
+        # Return candidate items that meet the residual plan
+        return plan_residual.filter(items, statistics)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _GET INDEX STATE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _get_index_state(self, positions: dict[int, int]) -> dict[str, Any]:
+        """Returns the pickle state of indexes, keyed by the positions of items by ID
+
+        Item IDs are pickled as positions in collection order given that unpickled
+        items have new IDs, which _set_index_state then puts back in their place.
+        """
+
+        # Get copies of indexes, keyed by positions
+        indexes = tuple(copy(index) for index in self._indexes)
+        for index in indexes:
+            index.remap(positions)
+
+        # Return state, where insertion positions are rebuilt in collection order
+        return {
+            "_indexes": indexes,
+            "_positions": self._positions is not None,
+            "_position_counter": None,
+        }
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _GET SORTED INDEX
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _get_sorted_index(self, path: str) -> SortedIndex | None:
+        """Returns the sorted index of a path if any"""
+
+        # Get index of path that can serve range conditions
+        index = self.get_index(path, "__gt")
+
+        # Return index if sorted
+        return index if isinstance(index, SortedIndex) else None
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _INDEX ADD
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _index_add(self, item_id: int, item: Any) -> None:
+        """Adds an item to the secondary indexes"""
+
+        # Record the insertion position of item
+        if self._positions is not None:
+            self._positions.setdefault(item_id, next(self._position_counter))
+
+        # Iterate over indexes
+        for index in self._indexes:
+            # Add item to index
+            index.add(item_id, item)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _INDEX ADD MANY
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _index_add_many(self, items_by_id: dict[int, Any]) -> None:
+        """Adds new items by ID to the secondary indexes"""
+
+        # Record the insertion positions of items
+        if self._positions is not None:
+            self._positions.update(zip(items_by_id, self._position_counter))
+
+        # Iterate over indexes
+        for index in self._indexes:
+            # Get index add method
+            add = index.add
+
+            # Iterate over items by ID
+            for item_id, item in items_by_id.items():
+                # Add item to index
+                add(item_id, item)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _INDEX REMOVE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _index_remove(self, item_id: int) -> None:
+        """Removes an item from the secondary indexes"""
+
+        # Forget the insertion position of item
+        if self._positions is not None:
+            self._positions.pop(item_id, None)
+
+        # Iterate over indexes
+        for index in self._indexes:
+            # Remove item from index
+            index.remove(item_id)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _INDEX UPDATE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _index_update(self, item_id: int, item: Any) -> bool:
+        """Updates the index entries of an item and returns whether any changed"""
+
+        # Initialize changed flag
+        changed = False
+
+        # Iterate over indexes
+        for index in self._indexes:
+            # Update item in index, which only touches the entries of changed values
+            # and keeps it among equal values in collection order
+            changed = index.update(item_id, item, self._positions) or changed
+
+        # Return changed flag
+        return changed
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _INIT INDEXES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _init_indexes(
+        self, indexes: Iterable[str | CollectionIndex] | None, positions: bool = False
+    ) -> None:
+        """Initializes the secondary indexes"""
+
+        # Set indexes, where a path string declares a hash index
+        self._indexes = tuple(
+            HashIndex(index) if isinstance(index, str) else index
+            for index in indexes or ()
+        )
+
+        # Initialize insertion positions if there are indexes or if they are requested
+        self._positions = {} if positions or self._indexes else None
+
+        # Initialize insertion position counter
+        self._position_counter = itertools.count()
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _LOOKUP
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _lookup(self, plan: FilterPlan) -> tuple[dict[int, Any] | None, FilterPlan]:
+        """Returns candidate items by ID and the residual plan of a filter plan"""
+
+        # Initialize served item lookups
+        served: list[dict[int, Any]] = []
+
+        # Initialize residual conditions
+        residual: list[FilterCondition] = []
+
+        # Initialize conditions by index, so that an index serves its conditions at once
+        conditions_by_index: dict[CollectionIndex, list[FilterCondition]] = {}
+
+        # Iterate over conditions
+        for condition in plan.conditions:
+            # Get index that can serve condition
+            index = self.get_index(condition.path, condition.operator)
+
+            # Check if there is an index
+            if index is not None:
+                conditions_by_index.setdefault(index, []).append(condition)
+                continue
+
+            # Lookup items that meet condition otherwise
+            items = self._lookup_condition(condition)
+
+            # Check if condition could not be served
+            if items is None:
+                residual.append(condition)
+                continue
+
+            # Append items to served item lookups
+            served.append(items)
+
+        # Iterate over indexes and their conditions
+        for index, conditions in conditions_by_index.items():
+            # Lookup items that meet conditions
+            items = index.lookup(*conditions)
+
+            # Check if conditions could not be served
+            if items is None:
+                residual.extend(conditions)
+                continue
+
+            # Append items to served item lookups
+            served.append(items)
+
+        # Return early if no items meet a served condition
+        if any(not items for items in served):
+            return {}, FilterPlan(())
+
+        # Return plan unchanged if no condition was served
+        if not served:
+            return None, plan
+
+        # Sort served item lookups so that the smallest is intersected first
+        served.sort(key=len)
+
+        # Get smallest item lookup
+        items, others = served[0], served[1:]
+
+        # Check if there are other item lookups
+        if others:
+            # Intersect item lookups
+            items = {
+                item_id: item
+                for item_id, item in items.items()
+                if all(item_id in other for other in others)
+            }
+
+        # Return items and residual plan
+        return items, FilterPlan(residual)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _LOOKUP CONDITION
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _lookup_condition(self, condition: FilterCondition) -> dict[int, Any] | None:
+        """Returns items by ID that meet a condition without an index or None"""
+
+        # Return None, leaving conditions without an index to the residual plan
+        return None
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _SET INDEX STATE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _set_index_state(self, item_ids: list[int]) -> None:
+        """Replaces positions by unpickled item IDs in collection order"""
+
+        # Replace the positions of indexes by item IDs
+        for index in self._indexes:
+            index.remap(item_ids)
+
+        # Set insertion positions in collection order if they are tracked
+        self._positions = (
+            dict(zip(item_ids, itertools.count())) if self._positions else None
+        )
+
+        # Set insertion position counter
+        self._position_counter = itertools.count(len(item_ids))
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ ADD INDEX
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def add_index(self, *indexes: str | CollectionIndex) -> None:
+        """Adds and builds secondary indexes where a path string declares a HashIndex"""
+
+        # Check if insertion positions are not yet tracked
+        if self._positions is None:
+            # Initialize insertion positions of the existing items
+            self._positions = {}
+
+            # Iterate over items
+            for item in cast(Iterable[Any], self):
+                # Record the insertion position of item
+                self._positions.setdefault(id(item), next(self._position_counter))
+
+        # Iterate over indexes
+        for index in indexes:
+            # Convert path string to hash index
+            index = HashIndex(index) if isinstance(index, str) else index
+
+            # Iterate over items
+            for item in cast(Iterable[Any], self):
+                # Add item to index
+                index.add(id(item), item)
+
+            # Add index to indexes
+            self._indexes += (index,)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ GET INDEX
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def get_index(
+        self, path: str, operator: str | None = None
+    ) -> CollectionIndex | None:
+        """Returns the first secondary index of a path that can serve an operator"""
+
+        # Normalize path to the filter keyword delimiter
+        path = path.replace(".", "__")
+
+        # Iterate over indexes
+        for index in self._indexes:
+            # Return index if path and operator match
+            if index.path == path and (operator is None or operator in index.OPERATORS):
+                return index
+
+        # Return None
+        return None
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ INDEXES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    @property
+    def indexes(self) -> tuple[CollectionIndex, ...]:
+        """Returns the secondary indexes of the collection"""
+
+        # Return indexes
+        return self._indexes
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ PREFIX SEARCH
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def prefix_search(
+        self, path: str, prefix: str, limit: int | None = None
+    ) -> list[Any]:
+        """Returns up to limit items whose value of a path starts with a prefix
+
+        Case is ignored and items are returned in order of case-folded value. A prefix
+        index of the path serves the search in O(log n + len(prefix) + k), otherwise
+        the collection is scanned.
+        """
+
+        # Get prefix index of path
+        index = self.get_index(path, "__istartswith")
+
+        # Return items found by prefix index if any
+        if isinstance(index, PrefixIndex):
+            return index.search(prefix, limit)
+
+        # Get getter and lowercase prefix
+        getter = ogetter(path.replace(".", "__"), default=None, delimiter="__")
+        prefix = prefix.lower()
+
+        # Get the case-folded values and items whose value starts with prefix
+        matches = [
+            (value.casefold(), item)
+            for item in cast(Iterable[Any], self)
+            if isinstance(value := getter(item), str)
+            and value.lower().startswith(prefix)
+        ]
+
+        # Order matches by value, keeping collection order on ties like the index does
+        matches = (
+            sorted(matches, key=itemgetter(0))
+            if limit is None
+            else heapq.nsmallest(limit, matches, key=itemgetter(0))
+        )
+
+        # Return items
+        return [item for _, item in matches]
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ REINDEX
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def reindex(self, *items: Any) -> int:
+        """Updates the index entries of mutated items and returns how many changed"""
+
+        # Return 0 if there are no indexes, in which case positions are not tracked
+        if self._positions is None:
+            return 0
+
+        # Initialize count
+        count = 0
+
+        # Iterate over items
+        for item in items:
+            # Get item ID
+            item_id = id(item)
+
+            # Continue if item is not in collection
+            if item_id not in self._positions:
+                continue
+
+            # Update item in indexes and increment count if any entry changed
+            if self._index_update(item_id, item):
+                count += 1
+
+        # Return count
+        return count
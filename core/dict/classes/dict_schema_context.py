@@ -13,6 +13,13 @@ from typing import Any
 class DictSchemaContext:
     """A context class for the DictSchema callable"""
 
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ SLOTS
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Declare slots, so that instances do not carry a __dict__
+    __slots__ = ("data", "item")
+
     # Declare type of data
     data: Any
 
@@ -20,6 +20,13 @@ from core.datetime.functions.dtto_utc import dtto_utc
 class Log:
     """A log utility class"""
 
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ SLOTS
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Declare slots, so that instances do not carry a __dict__
+    __slots__ = ("key", "timestamp", "message", "level", "exception")
+
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ __INIT__
     # └─────────────────────────────────────────────────────────────────────────────────
@@ -0,0 +1,258 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+from typing import Any, Callable, Iterable
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.dict.functions.dset import dset
+from core.object.functions.ogetter import ogetter
+from core.placeholders import nothing
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TYPE ALIASES
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Define a reducer type alias of an initial state factory, a step and a finalizer
+Reducer = tuple[Callable[[], Any], Callable[[Any, Any], Any], Callable[[Any], Any]]
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ REDUCERS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def _final(state: Any) -> Any:
+    """Returns a state or None if no value was seen"""
+
+    # Return None if no value was seen
+    return None if state is nothing else state
+
+
+# Define reducers by aggregate key, each of which streams non-None values
+REDUCERS: dict[str, Reducer] = {
+    "first": (lambda: nothing, lambda s, v: v if s is nothing else s, _final),
+    "last": (lambda: nothing, lambda s, v: v, _final),
+    "sum": (lambda: nothing, lambda s, v: 0 + v if s is nothing else s + v, _final),
+    "mean": (
+        lambda: (0, 0),
+        lambda s, v: (s[0] + v, s[1] + 1),
+        lambda s: s[0] / s[1] if s[1] else None,
+    ),
+    "min": (lambda: nothing, lambda s, v: v if s is nothing or v < s else s, _final),
+    "max": (lambda: nothing, lambda s, v: v if s is nothing or v > s else s, _final),
+    "any": (lambda: nothing, lambda s, v: s is True or bool(v), _final),
+    "all": (lambda: nothing, lambda s, v: bool(v) and s is not False, _final),
+    "count": (lambda: 0, lambda s, v: s + 1, lambda s: s),
+}
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GET REDUCER
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def get_reducer(key: str, reducers: dict[str, Any] | None = None) -> Reducer:
+    """Returns the reducer of an aggregate key"""
+
+    # Get custom reducer
+    reducer = (reducers or {}).get(key)
+
+    # Check if custom reducer is a callable of the list of values
+    if callable(reducer):
+        # Get callable
+        func = reducer
+
+        # Return reducer that collects values
+        return (list, lambda s, v: s.append(v) or s, lambda s: func(s) if s else None)
+
+    # Return custom reducer if any
+    if reducer is not None:
+        return reducer  # type: ignore
+
+    # Return built-in reducer if any
+    if key in REDUCERS:
+        return REDUCERS[key]
+
+    # Check if key is concat unique
+    if key.startswith("concat-unique-"):
+        # Get separator
+        sep = key.split("concat-unique-")[1]
+
+        # Return reducer that joins sorted unique values
+        return (
+            set,
+            lambda s, v: s.add(v) or s,
+            lambda s: sep.join(sorted(s)) if s else None,
+        )
+
+    # Check if key is concat
+    if key.startswith("concat-"):
+        # Get separator
+        sep = key.split("concat-")[1]
+
+        # Return reducer that joins values
+        return (
+            list,
+            lambda s, v: s.append(v) or s,
+            lambda s: sep.join(s) if s else None,
+        )
+
+    # Raise error
+    raise ValueError(f"Invalid aggregate key: {key}")
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ AGGREGATOR
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class Aggregator:
+    """A single-pass aggregator of object instance values by an aggregate schema"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ INSTANCE ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Declare type of aggregate schema
+    agg_schema: dict[str, Iterable[str]]
+
+    # Declare type of custom reducers by aggregate key
+    reducers: dict[str, Any] | None
+
+    # Declare type of value getters, one for each distinct attribute
+    _getters: tuple[Callable[[Any], Any], ...]
+
+    # Declare type of steps as attribute, getter position, reducer step and finalizer
+    _steps: tuple[tuple[str, int, Callable[[Any, Any], Any], Callable[[Any], Any]], ...]
+
+    # Declare type of initial state factories
+    _initials: tuple[Callable[[], Any], ...]
+
+    # Declare type of state position, getter position and reducer step of each step
+    _plan: tuple[tuple[int, int, Callable[[Any, Any], Any]], ...]
+
+    # Declare type of states
+    _states: list[Any]
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(
+        self,
+        agg_schema: dict[str, Iterable[str]],
+        reducers: dict[str, Any] | None = None,
+    ) -> None:
+        """Init Method"""
+
+        # Set aggregate schema and custom reducers
+        self.agg_schema = agg_schema
+        self.reducers = reducers
+
+        # Initialize getter positions by attribute
+        positions: dict[str, int] = {}
+
+        # Initialize steps and initial state factories
+        steps = []
+        initials = []
+
+        # Iterate over the aggregate schema
+        for key, attrs in agg_schema.items():
+            # Get reducer
+            initial, step, final = get_reducer(key, reducers)
+
+            # Iterate over attributes
+            for attr in attrs:
+                # Append step, sharing a getter between keys of the same attribute
+                steps.append(
+                    (attr, positions.setdefault(attr, len(positions)), step, final)
+                )
+
+                # Append initial state factory
+                initials.append(initial)
+
+        # Set value getters
+        self._getters = tuple(ogetter(attr, default=None) for attr in positions)
+
+        # Set steps and initial state factories
+        self._steps = tuple(steps)
+        self._initials = tuple(initials)
+
+        # Set plan of the steps that are run for each instance
+        self._plan = tuple(
+            (i, position, step) for i, (_, position, step, _) in enumerate(steps)
+        )
+
+        # Initialize states
+        self._states = [initial() for initial in self._initials]
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ NEW
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def New(self) -> Aggregator:
+        """Returns a new aggregator of the same compiled schema with fresh states"""
+
+        # Initialize aggregator without recompiling the aggregate schema
+        aggregator = self.__class__.__new__(self.__class__)
+
+        # Share aggregate schema, reducers, getters and steps
+        aggregator.agg_schema = self.agg_schema
+        aggregator.reducers = self.reducers
+        aggregator._getters = self._getters
+        aggregator._steps = self._steps
+        aggregator._initials = self._initials
+        aggregator._plan = self._plan
+
+        # Initialize states
+        aggregator._states = [initial() for initial in self._initials]
+
+        # Return aggregator
+        return aggregator
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ ADD
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def add(self, *instances: object | dict[Any, Any]) -> None:
+        """Adds instances to the aggregate"""
+
+        # Get getters, plan and states
+        getters, plan, states = self._getters, self._plan, self._states
+
+        # Iterate over instances
+        for instance in instances:
+            # Get values of each distinct attribute
+            values = [getter(instance) for getter in getters]
+
+            # Iterate over the plan of steps
+            for i, position, step in plan:
+                # Get value
+                value = values[position]
+
+                # Update state if value is not None
+                if value is not None:
+                    states[i] = step(states[i], value)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ RESULT
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def result(self, kwargs: dict[str, Any] | None = None) -> dict[str, Any]:
+        """Returns instance kwargs of the aggregate values"""
+
+        # Initialize instance kwargs
+        instance_kwargs = kwargs if kwargs is not None else {}
+
+        # Iterate over steps and states
+        for (attr, _, _, final), state in zip(self._steps, self._states):
+            # Add aggregate value to instance kwargs
+            dset(instance_kwargs, attr, final(state), insert=True)
+
+        # Return instance kwargs
+        return instance_kwargs
@@ -7,6 +7,7 @@ from core.object.functions.assert_isinstance import (  # noqa: F401
 )
 from core.object.functions.oagg import oagg as oagg  # noqa: F401
 from core.object.functions.oget import oget as oget  # noqa: F401
+from core.object.functions.ogetter import ogetter as ogetter  # noqa: F401
 from core.object.functions.ohasattr import ohasattr as ohasattr  # noqa: F401
 from core.object.functions.olower import olower as olower  # noqa: F401
 from core.object.functions.oset import oset as oset  # noqa: F401
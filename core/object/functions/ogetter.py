@@ -0,0 +1,106 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from typing import Any, Callable
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.placeholders import nothing
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ OGETTER
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def ogetter(
+    path: str,
+    default: Any = nothing,
+    delimiter: str = ".",
+) -> Callable[[object | dict[Any, Any]], Any]:
+    """Returns a compiled getter that behaves like oget for a fixed path string"""
+
+    # Split path into keys once
+    keys = tuple(path.split(delimiter))
+
+    # Check if no default is given
+    if default is nothing:
+        # Check if path has a single key
+        if len(keys) == 1:
+            # Get key
+            key = keys[0]
+
+            # Define a single key getter
+            def getter(instance: Any) -> Any:
+                """Gets a value by key or attribute"""
+
+                # Return value by key or attribute
+                if isinstance(instance, dict):
+                    return instance[key]
+                return getattr(instance, key)
+
+            # Return getter
+            return getter
+
+        # Define a nested getter
+        def getter_nested(instance: Any) -> Any:
+            """Gets a value by a series of keys or attributes"""
+
+            # Iterate over keys
+            for key in keys:
+                # Get value by key or attribute and set instance
+                if isinstance(instance, dict):
+                    instance = instance[key]
+                else:
+                    instance = getattr(instance, key)
+
+            # Return value
+            return instance
+
+        # Return nested getter
+        return getter_nested
+
+    # Check if path has a single key
+    if len(keys) == 1:
+        # Get key
+        key = keys[0]
+
+        # Define a single key getter with a default
+        def getter_default_single(instance: Any) -> Any:
+            """Gets a value by key or attribute or returns a default"""
+
+            # Return value by key or attribute or default
+            if isinstance(instance, dict):
+                return instance.get(key, default)
+            return getattr(instance, key, default)
+
+        # Return single key getter with a default
+        return getter_default_single
+
+    # Initialize a local sentinel for missing values
+    missing = object()
+
+    # Define a nested getter with a default
+    def getter_default(instance: Any) -> Any:
+        """Gets a value by a series of keys or attributes or returns a default"""
+
+        # Iterate over keys
+        for key in keys:
+            # Get value by key or attribute and set instance
+            if isinstance(instance, dict):
+                instance = instance.get(key, missing)
+            else:
+                instance = getattr(instance, key, missing)
+
+            # Return default if value is missing
+            if instance is missing:
+                return default
+
+        # Return value
+        return instance
+
+    # Return getter with a default
+    return getter_default
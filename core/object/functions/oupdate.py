@@ -4,7 +4,7 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 # ┌─────────────────────────────────────────────────────────────────────────────────────
 # │ PROJECT IMPORTS
@@ -34,8 +34,25 @@ def oupdate(
     # Initialize an unfound instance
     unfound = Nothing()
 
-    # Iterate over the schema
-    for key in schema or instance_src.__dict__:
+    # Get names of schema
+    names: list[Any] = list(schema or ())
+
+    # Check if there is no schema
+    if not names:
+        # Get the attribute names of the source instance's __dict__ if it has one
+        names = list(getattr(instance_src, "__dict__", ()))
+
+        # Iterate over the classes of the source instance
+        for cls in type(instance_src).__mro__:
+            # Get slots of class, which may be a single name
+            slots = cls.__dict__.get("__slots__", ())
+            slots = (slots,) if isinstance(slots, str) else slots
+
+            # Add slot names, as slotted instances carry no __dict__ to read them from
+            names += [slot for slot in slots if slot not in ("__dict__", "__weakref__")]
+
+    # Iterate over names
+    for key in names:
         # Get keys
         keys = key if isinstance(key, (tuple, list)) else (key,)
 